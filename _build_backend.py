@@ -0,0 +1,63 @@
+"""PEP 517 backend: setuptools, plus mypy for compiled builds only.
+
+mypyc ships with mypy, so a wheel built with ``ESB_OMS_COMPILE=1`` needs
+it at build time, while the default pure-Python build does not. Listing
+mypy in ``[build-system] requires`` would install it for every build;
+this wrapper requests it only when compiling.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+from typing import Any
+
+from setuptools import build_meta
+from setuptools.build_meta import (
+    build_editable,
+    build_sdist,
+    build_wheel,
+    get_requires_for_build_sdist,
+    prepare_metadata_for_build_editable,
+    prepare_metadata_for_build_wheel,
+)
+
+__all__ = [
+    "build_editable",
+    "build_sdist",
+    "build_wheel",
+    "get_requires_for_build_editable",
+    "get_requires_for_build_sdist",
+    "get_requires_for_build_wheel",
+    "prepare_metadata_for_build_editable",
+    "prepare_metadata_for_build_wheel",
+]
+
+# Keep in step with the mypy pin of the dev dependency group
+MYPYC_REQUIREMENT = "mypy==1.18.2"
+
+
+def _compile_requires() -> list[str]:
+    # Mirrors the check in setup.py: PyPy always gets the pure-Python build
+    if (
+        os.environ.get("ESB_OMS_COMPILE") == "1"
+        and platform.python_implementation() == "CPython"
+    ):
+        return [MYPYC_REQUIREMENT]
+    return []
+
+
+def get_requires_for_build_wheel(
+    config_settings: dict[str, Any] | None = None,
+) -> list[str]:
+    """Setuptools' wheel requirements, plus mypy when compiling."""
+    requires: list[str] = build_meta.get_requires_for_build_wheel(config_settings)
+    return requires + _compile_requires()
+
+
+def get_requires_for_build_editable(
+    config_settings: dict[str, Any] | None = None,
+) -> list[str]:
+    """Setuptools' editable requirements, plus mypy when compiling."""
+    requires: list[str] = build_meta.get_requires_for_build_editable(config_settings)
+    return requires + _compile_requires()
@@ -5,17 +5,28 @@ Usage:
     export ESB_USERNAME="your_username"
     export ESB_PASSWORD="your_password"
 
-    # Run the script
+    # Run the script (needs the examples extra for pandas/pyarrow)
+    uv sync --extra examples
     uv run python example/sales_payment_summary.py
 """
 
 from __future__ import annotations
 
+import io
 import os
+import sys
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
 
 from esb_oms import Environment, ESBClient
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from esb_oms.models import SalesPaymentSummaryItem
+
 # Get credentials from environment
 USERNAME = os.environ.get("ESB_USERNAME", "")
 PASSWORD = os.environ.get("ESB_PASSWORD", "")
@@ -28,6 +39,25 @@ def get_yesterday() -> str:
     return yesterday.isoformat()
 
 
+def payments_frame(summaries: list[SalesPaymentSummaryItem]) -> pd.DataFrame:
+    """Flatten payment summaries into one row per branch and payment method."""
+    payments = [(s.branch_code, p) for s in summaries for p in s.payments]
+    table = pa.table(
+        {
+            "branch_code": [code for code, _ in payments],
+            "payment_method_name": [p.payment_method_name for _, p in payments],
+            "payment_count": pa.array(
+                [p.payment_count for _, p in payments], type=pa.int64()
+            ),
+            # Decimal -> float64 in one Arrow cast, not float() per payment
+            "payment_amount": pa.array([p.payment_amount for _, p in payments]).cast(
+                pa.float64()
+            ),
+        }
+    )
+    return table.to_pandas()
+
+
 def main() -> None:
     if not USERNAME or not PASSWORD:
         print("Set ESB_USERNAME and ESB_PASSWORD environment variables")
@@ -50,43 +80,53 @@ def main() -> None:
         print("No payment summary data found")
         return
 
-    print(f"\n=== Payment Summary ({len(summaries)} branches) ===")
-
-    total_amount = 0.0
-    total_count = 0
-
-    for summary in summaries:
-        print(f"\nBranch: {summary.branch_name} ({summary.branch_code})")
-        print(f"Date: {summary.sales_date}")
-        print("-" * 60)
-        print(f"{ 'Payment Method':<30} | {'Count':>8} | {'Amount':>12}")
-        print("-" * 60)
-
-        branch_total = 0.0
-        branch_count = 0
+    # All totals come from pandas reductions, not Python `+=` loops
+    df = payments_frame(summaries)
+    branch_totals = (
+        df.groupby("branch_code", sort=False)
+        .agg(count=("payment_count", "sum"), amount=("payment_amount", "sum"))
+        .reindex([s.branch_code for s in summaries], fill_value=0)
+    )
+    grand_total = df[["payment_count", "payment_amount"]].sum()
+
+    # Build the whole report in memory and write it out once
+    buf = io.StringIO()
+    print(f"\n=== Payment Summary ({len(summaries)} branches) ===", file=buf)
+
+    for summary, totals in zip(
+        summaries, branch_totals.itertuples(index=False), strict=True
+    ):
+        print(
+            f"\nBranch: {summary.branch_name} ({summary.branch_code})",
+            file=buf,
+        )
+        print(f"Date: {summary.sales_date}", file=buf)
+        print("-" * 60, file=buf)
+        print(
+            f"{'Payment Method':<30} | {'Count':>8} | {'Amount':>12}",
+            file=buf,
+        )
+        print("-" * 60, file=buf)
 
         for payment in summary.payments:
             print(
                 f"{payment.payment_method_name:<30} | "
                 f"{payment.payment_count:>8} | "
-                f"{payment.payment_amount:>12,.2f}"
+                f"{payment.payment_amount:>12,.2f}",
+                file=buf,
             )
-            branch_total += float(payment.payment_amount)
-            branch_count += payment.payment_count
 
-        print("-" * 60)
+        print("-" * 60, file=buf)
         print(
-            f"{ 'TOTAL':<30} | "
-            f"{branch_count:>8} | "
-            f"{branch_total:>12,.2f}"
+            f"{'TOTAL':<30} | {totals.count:>8} | {totals.amount:>12,.2f}",
+            file=buf,
         )
 
-        total_amount += branch_total
-        total_count += branch_count
+    print("\n=== Grand Total ===", file=buf)
+    print(f"Total Transactions: {int(grand_total['payment_count'])}", file=buf)
+    print(f"Total Amount:       {grand_total['payment_amount']:,.2f}", file=buf)
 
-    print("\n=== Grand Total ===")
-    print(f"Total Transactions: {total_count}")
-    print(f"Total Amount:       {total_amount:,.2f}")
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
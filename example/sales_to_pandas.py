@@ -1,5 +1,8 @@
 """Example: Fetch last month's sales and analyze with pandas.
 
+Requires the examples extra (pandas and pyarrow):
+    uv sync --extra examples
+
 Usage:
     # Set environment variables
     export ESB_USERNAME="your_username"
@@ -11,17 +14,53 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import UTC, datetime, timedelta
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
-import pandas as pd
+import pyarrow as pa
 
 from esb_oms import Environment, ESBClient
 
+if TYPE_CHECKING:
+    from esb_oms.models import SalesInformationItem
+
 # Get credentials from environment
 USERNAME = os.environ.get("ESB_USERNAME", "")
 PASSWORD = os.environ.get("ESB_PASSWORD", "")
 
+# Upper bound on pages requested concurrently (avoid overloading the API)
+MAX_WINDOW = 32
+
+# Order-level columns taken from each SalesInformationItem. Decimal money
+# fields are stored as float64; the fixed schema lets every page become a
+# record batch of the same shape.
+SCHEMA = pa.schema(
+    [
+        ("sales_num", pa.string()),
+        ("bill_num", pa.string()),
+        ("sales_date", pa.string()),
+        ("sales_date_in", pa.string()),
+        ("sales_date_out", pa.string()),
+        ("branch_code", pa.string()),
+        ("member_code", pa.string()),
+        ("member_name", pa.string()),
+        ("visit_purpose_name", pa.string()),
+        ("pax_total", pa.int64()),
+        ("subtotal", pa.float64()),
+        ("discount_total", pa.float64()),
+        ("vat_total", pa.float64()),
+        ("grand_total", pa.float64()),
+        ("payment_total", pa.float64()),
+        ("status_name", pa.string()),
+    ]
+)
+
+# Maximum number of fetched pages waiting to be turned into record batches
+QUEUE_SIZE = 64
+
 
 def get_last_month_dates() -> tuple[str, str]:
     """Get first and last day of last month."""
@@ -32,7 +71,78 @@ def get_last_month_dates() -> tuple[str, str]:
     return first_of_last_month.isoformat(), last_of_last_month.isoformat()
 
 
-def main() -> None:
+async def produce_pages(
+    client: ESBClient,
+    date_from: str,
+    date_to: str,
+    queue: asyncio.Queue[list[SalesInformationItem] | None],
+) -> None:
+    """Fetch every page of sales information concurrently into a queue.
+
+    Pages are requested in windows with asyncio.gather. The window doubles
+    after every window without an empty page, and fetching stops at the
+    first empty page. A short page does not end the export, since the
+    server may cap or deduplicate a page in the middle of the range. A
+    final None tells the consumer that no more pages are coming, even if
+    a request fails.
+    """
+
+    async def fetch(page: int) -> list[SalesInformationItem]:
+        return await client.report.get_sales_information_async(
+            sales_date_from=date_from,
+            sales_date_to=date_to,
+            page=page,
+        )
+
+    try:
+        start, window = 1, 1
+
+        while True:
+            pages = range(start, start + window)
+            results = await asyncio.gather(*(fetch(page) for page in pages))
+            for page, sales in zip(pages, results, strict=True):
+                if not sales:
+                    return
+                print(f"  Page {page}: {len(sales)} records")
+                await queue.put(sales)
+            start += window
+            window = min(window * 2, MAX_WINDOW)
+    finally:
+        await queue.put(None)
+
+
+def page_to_batch(sales: list[SalesInformationItem]) -> pa.RecordBatch:
+    """Convert one page of orders into an Arrow record batch."""
+    get_fields = attrgetter(*SCHEMA.names)
+    # Read all fields of an order in one call, then transpose the page
+    arrays = [
+        # Decimal -> float64 is a vectorized cast from Arrow's decimal type
+        pa.array(values).cast(field.type)
+        if pa.types.is_floating(field.type)
+        else pa.array(values, type=field.type)
+        for field, values in zip(
+            SCHEMA, zip(*map(get_fields, sales), strict=True), strict=True
+        )
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=SCHEMA)
+
+
+async def consume_batches(
+    queue: asyncio.Queue[list[SalesInformationItem] | None],
+) -> pa.Table:
+    """Turn pages into Arrow record batches as they arrive.
+
+    Each page's models are dropped as soon as the page is converted, so the
+    whole month is only ever held once, as compact Arrow buffers.
+    """
+    batches = []
+    while (sales := await queue.get()) is not None:
+        if sales:
+            batches.append(page_to_batch(sales))
+    return pa.Table.from_batches(batches, schema=SCHEMA)
+
+
+async def main() -> None:
     if not USERNAME or not PASSWORD:
         print("Set ESB_USERNAME and ESB_PASSWORD environment variables")
         return
@@ -41,56 +151,30 @@ def main() -> None:
     date_from, date_to = get_last_month_dates()
     print(f"Fetching sales: {date_from} ~ {date_to}")
 
-    # Fetch all pages of sales data
-    all_sales = []
-    page = 1
-
-    with ESBClient(
+    # Fetch pages and convert them concurrently, so building the batch for one
+    # page overlaps with the network round-trips for the next ones
+    queue: asyncio.Queue[list[SalesInformationItem] | None] = asyncio.Queue(
+        maxsize=QUEUE_SIZE
+    )
+    async with ESBClient(
         username=USERNAME,
         password=PASSWORD,
         environment=Environment.PRODUCTION,
     ) as client:
-        while True:
-            sales = client.report.get_sales_information(
-                sales_date_from=date_from,
-                sales_date_to=date_to,
-                page=page,
-            )
-            if not sales:
-                break
-            all_sales.extend(sales)
-            print(f"  Page {page}: {len(sales)} records")
-            page += 1
-
-    if not all_sales:
+        _, table = await asyncio.gather(
+            produce_pages(client, date_from, date_to, queue),
+            consume_batches(queue),
+        )
+
+    if not table.num_rows:
         print("No sales data found")
         return
 
-    print(f"Total fetched: {len(all_sales)} orders")
+    print(f"Total fetched: {table.num_rows} orders")
 
     # Convert to DataFrame (order-level, one row per order)
-    rows = []
-    for sale in all_sales:
-        rows.append({
-            "sales_num": sale.sales_num,
-            "bill_num": sale.bill_num,
-            "sales_date": sale.sales_date,
-            "sales_date_in": sale.sales_date_in,
-            "sales_date_out": sale.sales_date_out,
-            "branch_code": sale.branch_code,
-            "member_code": sale.member_code,
-            "member_name": sale.member_name,
-            "visit_purpose_name": sale.visit_purpose_name,
-            "pax_total": sale.pax_total,
-            "subtotal": float(sale.subtotal),
-            "discount_total": float(sale.discount_total),
-            "vat_total": float(sale.vat_total),
-            "grand_total": float(sale.grand_total),
-            "payment_total": float(sale.payment_total),
-            "status_name": sale.status_name,
-        })
-
-    df = pd.DataFrame(rows)
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
 
     # Display results
     print(f"\n=== Orders ({len(df)} records) ===")
@@ -107,4 +191,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""Build hook for the optional mypyc-compiled modules.
+
+Project metadata lives in pyproject.toml. Set ``ESB_OMS_COMPILE=1`` to
+compile ``esb_oms._http`` (response handling, retries, request dispatch)
+and the ``esb_oms.api`` endpoint modules to C extensions with mypyc;
+without it a pure-Python wheel is built.
+"""
+
+import os
+import platform
+
+from setuptools import setup
+
+# Modules compiled with mypyc when ESB_OMS_COMPILE=1. Every subclass of
+# BaseAPI must be listed with it: interpreted classes cannot inherit from
+# compiled ones.
+COMPILED_MODULES = [
+    "src/esb_oms/_http.py",
+    "src/esb_oms/api/_base.py",
+    "src/esb_oms/api/auth.py",
+    "src/esb_oms/api/master_member.py",
+    "src/esb_oms/api/master_menu.py",
+    "src/esb_oms/api/master_pos.py",
+    "src/esb_oms/api/master_promotion.py",
+    "src/esb_oms/api/other.py",
+    "src/esb_oms/api/report.py",
+    "src/esb_oms/api/sales.py",
+]
+
+ext_modules = []
+# mypyc targets the CPython C API; PyPy always gets the pure-Python build
+if (
+    os.environ.get("ESB_OMS_COMPILE") == "1"
+    and platform.python_implementation() == "CPython"
+):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(COMPILED_MODULES, opt_level="3")
+
+setup(ext_modules=ext_modules)
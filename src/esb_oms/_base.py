@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import random
+import threading
+import time
+from concurrent.futures import Future
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import httpx
 import structlog
 
 from esb_oms._http import (
+    DEFAULT_LIMITS,
+    HTTP2_AVAILABLE,
     BasicAuthHTTPClient,
     BearerHTTPClient,
+    HTTPClient,
     ManualTokenHTTPClient,
 )
+from esb_oms._token_cache import load_token, save_token, token_expiry
 from esb_oms.api.auth import AuthAPI
 from esb_oms.environments import (
     Environment,
@@ -16,11 +28,27 @@ from esb_oms.environments import (
     get_core_url,
     get_master_pos_url,
 )
-from esb_oms.exceptions import ESBAuthenticationError, ESBTokenRefreshError
+from esb_oms.exceptions import (
+    ESBAuthenticationError,
+    ESBRateLimitError,
+    ESBTokenRefreshError,
+)
 from esb_oms.models.auth import TokenInfo
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, MutableMapping
+    from pathlib import Path
+
+    from esb_oms.models.auth import RefreshResult
+
 logger = structlog.get_logger(__name__)
 
+# Token refresh attempts when the auth endpoint answers 429
+REFRESH_MAX_ATTEMPTS = 3
+
+# Upper bound for the exponential backoff between refresh attempts (seconds)
+REFRESH_MAX_BACKOFF = 30.0
+
 
 class BaseClient:
     """Base client with authentication management.
@@ -44,6 +72,9 @@ class BaseClient:
         environment: Environment = Environment.PRODUCTION,
         auto_refresh: bool = True,
         timeout: float = 30.0,
+        token_cache_path: Path | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        response_cache: MutableMapping[Hashable, Any] | None = None,
     ) -> None:
         """Initialize the base client.
 
@@ -58,6 +89,15 @@ class BaseClient:
             environment: Target environment (staging or production).
             auto_refresh: Whether to auto-refresh expired tokens.
             timeout: Request timeout in seconds.
+            token_cache_path: Optional file to cache login tokens in. A valid
+                cached token is reused instead of logging in again, and new
+                tokens are written back after login and refresh. Tokens are
+                only reused for the same user and environment they were
+                issued for.
+            limits: Connection pool limits (pool size and keep-alive expiry)
+                for every HTTP client.
+            response_cache: Optional mapping (e.g. ``cachetools.TTLCache``)
+                for memoizing GET responses of the API clients. Off by default.
 
         Raises:
             ValueError: If neither credentials nor static token provided.
@@ -65,6 +105,10 @@ class BaseClient:
         self.environment = environment
         self.auto_refresh = auto_refresh
         self._timeout = timeout
+        self._limits = limits
+        self._response_cache = response_cache
+        # Bind once so auth events don't rebuild the context on every call
+        self._log = logger.bind(environment=environment.value)
 
         # Validate authentication method
         has_credentials = username is not None and password is not None
@@ -77,43 +121,117 @@ class BaseClient:
         # Store credentials for auto-login and Basic Auth
         self._username = username
         self._password = password
+        # Built once: Basic Auth hands the same tuple to every request
+        self._credentials = (username, password) if username and password else None
         self._static_token = static_token
 
         # Token state
+        self._token_cache_path = token_cache_path
         self._token_info: TokenInfo | None = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_in_flight: Future[None] | None = None
+        if token_cache_path is not None and not has_static_token:
+            self._token_info = load_token(
+                token_cache_path, username, get_core_url(environment)
+            )
+
+        # HTTP clients, transports and the Auth API are cached properties,
+        # built on first use so short scripts only pay for what they touch
+
+    @cached_property
+    def _core_http(self) -> ManualTokenHTTPClient:
+        """Core HTTP client - for Auth API (login/refresh).
+
+        Transport retries are off: _refresh_with_backoff owns the retries
+        of the refresh call, and nesting both multiplied the attempts.
+        """
+        return ManualTokenHTTPClient(
+            base_url=get_core_url(self.environment),
+            timeout=self._timeout,
+            max_retries=0,
+            transport=self._transport,
+            async_transport=self._async_transport,
+        )
+
+    @cached_property
+    def _transport(self) -> httpx.HTTPTransport:
+        """Connection pool shared by all sync HTTP clients.
 
-        # Initialize HTTP clients with appropriate auth methods
+        Auth, API, Master POS and Core requests draw from the same
+        keep-alive connections, so e.g. a login warms the connection the
+        following Core calls reuse.
+        """
+        return httpx.HTTPTransport(
+            limits=self._limits, http2=HTTP2_AVAILABLE, retries=1
+        )
 
-        # Core HTTP client - for Auth API (login/refresh)
-        self._core_http = ManualTokenHTTPClient(
-            base_url=get_core_url(environment),
-            timeout=timeout,
+    @cached_property
+    def _async_transport(self) -> httpx.AsyncHTTPTransport:
+        """Connection pool shared by all async HTTP clients."""
+        return httpx.AsyncHTTPTransport(
+            limits=self._limits, http2=HTTP2_AVAILABLE, retries=1
         )
 
-        # API HTTP client - uses Bearer token (static or access token)
-        self._api_http = BearerHTTPClient(
-            base_url=get_api_url(environment),
-            get_token=self._get_token,
-            timeout=timeout,
+    @cached_property
+    def _api_http(self) -> BearerHTTPClient:
+        """API HTTP client - uses Bearer token (static or access token)."""
+        return BearerHTTPClient(
+            base_url=get_api_url(self.environment),
+            get_token=self._token_source(),
+            timeout=self._timeout,
+            transport=self._transport,
+            async_transport=self._async_transport,
+            response_cache=self._response_cache,
         )
 
-        # Master POS HTTP client - uses Basic Auth with credentials
-        self._master_pos_http = BasicAuthHTTPClient(
-            base_url=get_master_pos_url(environment),
+    @cached_property
+    def _master_pos_http(self) -> BasicAuthHTTPClient:
+        """Master POS HTTP client - uses Basic Auth with credentials."""
+        return BasicAuthHTTPClient(
+            base_url=get_master_pos_url(self.environment),
             get_credentials=self._get_credentials,
-            timeout=timeout,
+            timeout=self._timeout,
+            transport=self._transport,
+            async_transport=self._async_transport,
+            response_cache=self._response_cache,
         )
 
-        # Core Bearer HTTP client - uses Bearer token on Core URL
-        # Used for endpoints like sales-payment-summary
-        self._core_bearer_http = BearerHTTPClient(
-            base_url=get_core_url(environment),
-            get_token=self._get_token,
-            timeout=timeout,
+    @cached_property
+    def _core_bearer_http(self) -> BearerHTTPClient:
+        """Core Bearer HTTP client - uses Bearer token on Core URL.
+
+        Used for endpoints like sales-payment-summary.
+        """
+        return BearerHTTPClient(
+            base_url=get_core_url(self.environment),
+            get_token=self._token_source(),
+            timeout=self._timeout,
+            transport=self._transport,
+            async_transport=self._async_transport,
+            response_cache=self._response_cache,
         )
 
-        # Initialize Auth API (uses core HTTP client)
-        self._auth = AuthAPI(self._core_http)
+    @cached_property
+    def _auth(self) -> AuthAPI:
+        """Auth API (uses core HTTP client)."""
+        return AuthAPI(self._core_http)
+
+    def _built_http_clients(self) -> list[HTTPClient]:
+        """Get the HTTP clients that have actually been constructed.
+
+        Returns:
+            HTTP clients created so far (unused ones are never built).
+        """
+        return [
+            client
+            for name in (
+                "_core_http",
+                "_api_http",
+                "_master_pos_http",
+                "_core_bearer_http",
+            )
+            if (client := self.__dict__.get(name)) is not None
+        ]
 
     @property
     def auth(self) -> AuthAPI:
@@ -135,20 +253,28 @@ class BaseClient:
             return True
         return self._token_info is not None
 
-    def _get_token(self) -> str | None:
-        """Get the current Bearer token.
+    def _token_source(self) -> Callable[[], str | None]:
+        """Pick the Bearer token getter for the HTTP clients.
 
-        This is used by BearerHTTPClient to get the token for requests.
-        If using static token, returns that. Otherwise returns access token.
+        Static tokens never change, so they get a getter that returns the
+        token directly; otherwise the getter reads the current access token.
 
         Returns:
-            The current token or None if not authenticated.
+            Zero-argument callable returning the token for the next request.
         """
-        if self._static_token:
-            return self._static_token
-        if self._token_info:
-            return self._token_info.access_token
-        return None
+        static_token = self._static_token
+        if static_token:
+            return lambda: static_token
+        return self._get_access_token
+
+    def _get_access_token(self) -> str | None:
+        """Get the current access token, if logged in.
+
+        Returns:
+            The access token or None if not authenticated.
+        """
+        token_info = self._token_info
+        return token_info.access_token if token_info else None
 
     def _get_credentials(self) -> tuple[str, str] | None:
         """Get the Basic Auth credentials.
@@ -158,9 +284,24 @@ class BaseClient:
         Returns:
             Tuple of (username, password) or None if not available.
         """
-        if self._username and self._password:
-            return (self._username, self._password)
-        return None
+        return self._credentials
+
+    def _set_token_info(self, token_info: TokenInfo) -> None:
+        """Store new tokens and write them to the token cache, if configured.
+
+        Args:
+            token_info: The tokens returned by login or refresh.
+        """
+        self._token_info = token_info
+        if self._token_cache_path is not None:
+            try:
+                save_token(
+                    self._token_cache_path, token_info, get_core_url(self.environment)
+                )
+            except OSError:
+                self._log.warning(
+                    "token_cache_write_failed", path=str(self._token_cache_path)
+                )
 
     def login(self) -> None:
         """Login using stored credentials.
@@ -176,23 +317,71 @@ class BaseClient:
             msg = "Cannot login: no credentials provided"
             raise ValueError(msg)
 
-        logger.info("auth_login_start", username=self._username)
+        self._log.info("auth_login_start", username=self._username)
         result = self._auth.login(self._username, self._password)
-        self._token_info = TokenInfo(
-            access_token=result.access_token,
-            refresh_token=result.refresh_token,
-            username=result.username,
-            company_code=result.company_code,
+        self._set_token_info(
+            TokenInfo(
+                access_token=result.access_token,
+                refresh_token=result.refresh_token,
+                username=result.username,
+                company_code=result.company_code,
+                expires_at=token_expiry(result.access_token),
+            )
         )
-        logger.info(
+        self._log.info(
             "auth_login_success",
             username=result.username,
             company_code=result.company_code,
         )
 
-    def refresh_token(self) -> None:
+    def refresh_token(self, failed_token: str | None = None) -> None:
         """Refresh the access token using the refresh token.
 
+        Safe to call from several threads at once: only the first caller
+        hits the refresh endpoint, the others wait for and share its
+        outcome. A caller that arrives after another thread already
+        replaced ``failed_token`` returns without refreshing, so the
+        refresh token is never rotated twice for one expired access token.
+
+        Args:
+            failed_token: The access token that was rejected. Defaults to
+                the current access token.
+
+        Raises:
+            ESBTokenRefreshError: If refresh fails.
+            ValueError: If no refresh token available.
+        """
+        if failed_token is None:
+            failed_token = self._get_access_token()
+
+        with self._refresh_lock:
+            if self._get_access_token() != failed_token:
+                self._log.debug("auth_refresh_skipped")
+                return
+            in_flight = self._refresh_in_flight
+            is_leader = in_flight is None
+            if in_flight is None:
+                in_flight = self._refresh_in_flight = Future()
+
+        if not is_leader:
+            self._log.debug("auth_refresh_joined")
+            in_flight.result()
+            return
+
+        try:
+            self._refresh_token()
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        else:
+            in_flight.set_result(None)
+        finally:
+            with self._refresh_lock:
+                self._refresh_in_flight = None
+
+    def _refresh_token(self) -> None:
+        """Call the refresh endpoint and store the new tokens.
+
         Raises:
             ESBTokenRefreshError: If refresh fails.
             ValueError: If no refresh token available.
@@ -201,18 +390,21 @@ class BaseClient:
             msg = "Cannot refresh: no refresh token available"
             raise ValueError(msg)
 
-        logger.info("auth_refresh_start")
+        self._log.info("auth_refresh_start")
         try:
-            result = self._auth.refresh(self._token_info.refresh_token)
-            self._token_info = TokenInfo(
-                access_token=result.access_token,
-                refresh_token=result.refresh_token,
-                username=result.username,
-                company_code=result.company_code,
+            result = self._refresh_with_backoff(self._token_info.refresh_token)
+            self._set_token_info(
+                TokenInfo(
+                    access_token=result.access_token,
+                    refresh_token=result.refresh_token,
+                    username=result.username,
+                    company_code=result.company_code,
+                    expires_at=token_expiry(result.access_token),
+                )
             )
-            logger.info("auth_refresh_success")
+            self._log.info("auth_refresh_success")
         except ESBAuthenticationError as e:
-            logger.warning(
+            self._log.warning(
                 "auth_refresh_failed", code=e.code, status_code=e.status_code
             )
             raise ESBTokenRefreshError(
@@ -222,6 +414,41 @@ class BaseClient:
                 response_data=e.response_data,
             ) from e
 
+    def _refresh_with_backoff(self, refresh_token: str) -> RefreshResult:
+        """Call the refresh endpoint, waiting and retrying when rate limited.
+
+        The wait honours the server's Retry-After when present, otherwise it
+        backs off exponentially; either way it is capped at
+        REFRESH_MAX_BACKOFF. Random jitter keeps clients that were
+        throttled together from retrying in lockstep.
+
+        Args:
+            refresh_token: The refresh token to exchange.
+
+        Returns:
+            RefreshResult with the new tokens.
+
+        Raises:
+            ESBRateLimitError: If still rate limited after the last attempt.
+        """
+        attempt = 1
+        while True:
+            try:
+                return self._auth.refresh(refresh_token)
+            except ESBRateLimitError as e:
+                if attempt == REFRESH_MAX_ATTEMPTS:
+                    raise
+                delay = min(
+                    float(e.retry_after) if e.retry_after is not None else 2.0**attempt,
+                    REFRESH_MAX_BACKOFF,
+                )
+                delay += random.uniform(0, 0.5)
+                self._log.warning(
+                    "auth_refresh_rate_limited", attempt=attempt, delay=delay
+                )
+                time.sleep(delay)
+                attempt += 1
+
     def ensure_authenticated(self) -> None:
         """Ensure the client is authenticated.
 
@@ -239,10 +466,20 @@ class BaseClient:
 
     def close(self) -> None:
         """Close the client and release resources."""
-        self._core_http.close()
-        self._api_http.close()
-        self._master_pos_http.close()
-        self._core_bearer_http.close()
+        for client in self._built_http_clients():
+            client.close()
+        # Shared transport: closed here once, whichever clients were used
+        if "_transport" in self.__dict__:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the client and release both sync and async resources."""
+        for client in self._built_http_clients():
+            await client.aclose()
+        if "_transport" in self.__dict__:
+            self._transport.close()
+        if "_async_transport" in self.__dict__:
+            await self._async_transport.aclose()
 
     def __enter__(self) -> BaseClient:
         """Enter context manager."""
@@ -256,3 +493,16 @@ class BaseClient:
     ) -> None:
         """Exit context manager."""
         self.close()
+
+    async def __aenter__(self) -> BaseClient:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        """Exit async context manager."""
+        await self.aclose()
@@ -0,0 +1,113 @@
+"""Circuit breaker for ESB OMS API hosts.
+
+Stops sending requests to a host that keeps failing, so callers fail fast
+during an outage instead of waiting on timeouts, and lets a single probe
+through after a cool-down to detect recovery.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import structlog
+
+from esb_oms.exceptions import ESBConnectionError
+
+# Consecutive failures (5xx, timeouts, connection errors) that open the circuit
+DEFAULT_FAILURE_THRESHOLD = 5
+
+# Seconds an open circuit rejects requests before allowing a probe
+DEFAULT_RESET_TIMEOUT = 30.0
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one HTTP client.
+
+    Each HTTP client owns its breaker, so failures seen by one client (or
+    one set of credentials) never reject another client's requests. Each
+    logical request counts once, after its retries are used up.
+
+    - Closed: requests pass; consecutive failures are counted.
+    - Open: requests are rejected with ESBConnectionError until
+      ``reset_timeout`` has passed.
+    - Half-open: one probe request is let through. Success closes the
+      circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            name: Name used in errors and logs (the base URL).
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds to stay open before probing.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def before_request(self) -> bool:
+        """Check whether a request may be sent.
+
+        Returns:
+            True if the request is the half-open probe.
+
+        Raises:
+            ESBConnectionError: If the circuit is open, or half-open with a
+                probe already in flight.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            waited = time.monotonic() - self._opened_at
+            if waited >= self.reset_timeout and not self._probing:
+                self._probing = True
+                logger.info("circuit_half_open", name=self.name)
+                return True
+        msg = f"Circuit open for {self.name}: too many consecutive failures"
+        raise ESBConnectionError(msg)
+
+    def record_success(self) -> None:
+        """Record a request that reached the server and was handled."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("circuit_closed", name=self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a server error, timeout or connection failure."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    "circuit_opened", name=self.name, failures=self._failures
+                )
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Give up a probe that ended without an answer from the server.
+
+        Used when the probe was cancelled or failed locally: the host's
+        health is still unknown, so the circuit stays open and the next
+        request after the cool-down probes again.
+        """
+        with self._lock:
+            self._probing = False
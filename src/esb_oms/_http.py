@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import itertools
 import json
+import random
+import re
+import threading
+import time
+from copy import deepcopy
+from decimal import Decimal
+from functools import lru_cache
+from importlib.util import find_spec
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 import structlog
 
+from esb_oms._circuit_breaker import CircuitBreaker
 from esb_oms.exceptions import (
     ESBAuthenticationError,
     ESBAuthorizationError,
@@ -23,17 +36,339 @@ from esb_oms.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import (
+        Callable,
+        Hashable,
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+    )
 
 
 # Default timeout in seconds
 DEFAULT_TIMEOUT = 30.0
 
+# Retries for GET requests failing with 429 or 5xx, and the backoff between
+# them: min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt) plus jitter
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# Default connection pool limits. Idle connections are kept alive for a
+# minute so back-to-back API calls reuse the same TCP/TLS session.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=40,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# HTTP/2 needs the optional h2 package (``pip install "esb-oms[http2]"``).
+# When present, requests that run concurrently share one multiplexed
+# connection; servers without h2 support are still spoken to over HTTP/1.1.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Exceptions raised for specific HTTP status codes
+_STATUS_ERRORS: dict[int, type[ESBError]] = {
+    401: ESBAuthenticationError,
+    403: ESBAuthorizationError,
+    404: ESBNotFoundError,
+    405: ESBMethodNotAllowedError,
+}
+
+# Body "status" values. V1 APIs return "00" for success and "01" for error,
+# the others "ok" and "fail"/"failed".
+_OK_STATUSES = frozenset({"ok", "00"})
+_FAIL_STATUSES = frozenset({"fail", "failed", "01"})
+
+# Exceptions raised for ESB error codes in failed responses, with the body
+# field holding validation errors (if any)
+_CODE_ERRORS: dict[str, tuple[type[ESBError], str | None]] = {
+    # Core API authentication codes (EC031000xx)
+    "EC03100001": (ESBAuthenticationError, None),  # Invalid Token
+    "EC03100032": (ESBAuthenticationError, None),  # Invalid username or password
+    "EC03100003": (ESBValidationError, "errors"),  # Validation Error
+    # Backend API codes
+    "EC011401": (ESBAuthenticationError, None),  # Unauthorized
+    "EC0118": (ESBValidationError, None),  # Undefined index (missing field)
+    "EC011400": (ESBValidationError, "data"),  # Validation Error (Shift Data API)
+}
+
+# Error message markers, matched case-insensitively without lowering a copy
+# of the (possibly multi-KB) message
+_NOT_FOUND_MESSAGE = re.compile("not found", re.IGNORECASE)
+_UNDEFINED_INDEX_MESSAGE = re.compile("undefined index", re.IGNORECASE)
+
 # User agent for API requests
 USER_AGENT = "esb-oms-python/0.1.0"
 
 logger = structlog.get_logger(__name__)
 
+# Value produced by a get_decoded() decoder
+_T = TypeVar("_T")
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values the JSON encoders don't handle natively.
+
+    Args:
+        value: Value that is not JSON serializable as is.
+
+    Returns:
+        A JSON serializable replacement (Decimal amounts become numbers).
+
+    Raises:
+        TypeError: If the value type is not supported.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+# Request and response bodies are encoded/decoded with orjson when the
+# ``speedups`` extra is installed; the stdlib produces the same JSON otherwise.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+
+_json_loads: Callable[[bytes | str], Any] = orjson.loads if _HAS_ORJSON else json.loads
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(value, default=_json_default)
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_json_default,
+    ).encode()
+
+
+# Headers for a JSON body; shared, never mutated
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json(
+    json: Any | None, headers: dict[str, str] | None, content: bytes | None = None
+) -> tuple[bytes | None, dict[str, str] | None]:
+    """Serialize a JSON request body once, ahead of sending.
+
+    The bytes are reused as is if the request is retried.
+
+    Args:
+        json: JSON body data, or None for no body.
+        headers: Additional headers for the request.
+        content: Already encoded JSON body, sent instead of ``json``.
+
+    Returns:
+        Tuple of (encoded body or None, headers including Content-Type).
+    """
+    if content is None:
+        if json is None:
+            return None, headers
+        content = _json_dumps(json)
+    if not headers:
+        return content, _JSON_HEADERS
+    return content, {**_JSON_HEADERS, **headers}
+
+
+# Large list responses are parsed incrementally with ijson when the
+# ``streaming`` extra is installed; otherwise the body is parsed in one go.
+# ijson itself is only imported once a stream is actually consumed.
+IJSON_AVAILABLE = find_spec("ijson") is not None
+
+
+def _retry_delay(error: ESBError, attempt: int) -> float | None:
+    """Get the wait before retrying a failed request.
+
+    Args:
+        error: The rate limit or server error that failed the request.
+        attempt: Number of retries already made.
+
+    Returns:
+        Seconds to wait: Retry-After when the server sent one, otherwise
+        exponential backoff, plus random jitter. None when Retry-After asks
+        for more than RETRY_MAX_DELAY, so the error is raised instead of
+        blocking the caller for that long.
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        delay = float(retry_after)
+        if delay > RETRY_MAX_DELAY:
+            return None
+    else:
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    return delay + random.uniform(0, RETRY_BASE_DELAY)
+
+
+def _iter_stream_items(
+    chunks: Iterable[bytes], path: str, item_path: str
+) -> Iterator[Any]:
+    """Parse a streamed response body incrementally with ijson.
+
+    Args:
+        chunks: Decoded chunks of the response body.
+        path: Request path, for error messages.
+        item_path: ijson prefix of the items to yield.
+
+    Yields:
+        Each parsed JSON value at ``item_path``.
+
+    Raises:
+        ESBError: If the body is not valid JSON.
+    """
+    import ijson
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, item_path, use_float=True)
+    try:
+        for chunk in chunks:
+            parser.send(chunk)
+            yield from items
+            del items[:]
+        parser.close()
+    except ijson.JSONError as e:
+        raise ESBError(f"Invalid response from {path}: {e}") from e
+    yield from items
+
+
+def _read_until_token(chunks: Iterator[bytes]) -> bytes:
+    """Read body chunks until the first non-whitespace byte has arrived.
+
+    Args:
+        chunks: Decoded chunks of the response body.
+
+    Returns:
+        The bytes read so far (empty if the body ended first).
+    """
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if head.strip():
+            break
+    return head
+
+
+def _with_body(response: httpx.Response, body: bytes) -> httpx.Response:
+    """Copy a streamed response with its already decoded body.
+
+    Args:
+        response: The streaming response the body was read from.
+        body: The full, decoded response body.
+
+    Returns:
+        A read response with the same status, headers and request.
+    """
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in ("content-encoding", "content-length")
+    ]
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=body,
+        request=response.request,
+    )
+
+
+def _is_json_content_type(response: httpx.Response) -> bool:
+    """Check whether a response may hold JSON, judging by its Content-Type.
+
+    A missing Content-Type counts as JSON, so the body is still parsed.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        True unless the response declares a non-JSON media type.
+    """
+    content_type = response.headers.get("content-type")
+    return content_type is None or "json" in content_type.lower()
+
+
+def _non_json_error(response: httpx.Response) -> ESBError:
+    """Build the exception for a response whose body is not JSON.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        ESBServerError for 5xx responses, ESBError otherwise.
+    """
+    if response.status_code >= 500:
+        return ESBServerError(
+            f"Server error: {response.text}", status_code=response.status_code
+        )
+    return ESBError(
+        f"Invalid response: {response.text}", status_code=response.status_code
+    )
+
+
+@lru_cache(maxsize=4)
+def _bearer_authorization(token: str) -> str:
+    """Get the Authorization header value for a Bearer token.
+
+    Cached because the same few tokens (access token, refresh token) are
+    sent over and over until they rotate.
+
+    Args:
+        token: The Bearer token.
+
+    Returns:
+        The header value, ``"Bearer <token>"``.
+    """
+    return f"Bearer {token}"
+
+
+@lru_cache(maxsize=8)
+def _fingerprint(secret: str) -> str:
+    """Get a one-way fingerprint of a credential for response cache keys.
+
+    Cached because the same few tokens are fingerprinted on every cached
+    GET until they rotate.
+
+    Args:
+        secret: Token or "username:password" string.
+
+    Returns:
+        Hex SHA-256 digest of the secret.
+    """
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+def _iter_items(data: Any, item_path: str) -> Iterator[Any]:
+    """Yield the values at an ijson-style prefix of parsed JSON.
+
+    Used when ijson is not installed, so request_stream() yields the same
+    items either way.
+
+    Args:
+        data: Parsed JSON document.
+        item_path: Dotted prefix, where "item" steps into a list
+            (e.g. "item" or "result.item").
+
+    Yields:
+        Each value found at the prefix.
+    """
+    if not item_path:
+        yield data
+        return
+    key, _, rest = item_path.partition(".")
+    if key == "item":
+        if isinstance(data, list):
+            for value in data:
+                yield from _iter_items(value, rest)
+    elif isinstance(data, dict) and key in data:
+        yield from _iter_items(data[key], rest)
+
 
 class HTTPClient:
     """Base HTTP client for making API requests.
@@ -48,6 +383,12 @@ class HTTPClient:
         base_url: str,
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = HTTP2_AVAILABLE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        response_cache: MutableMapping[Hashable, Any] | None = None,
     ) -> None:
         """Initialize the HTTP client.
 
@@ -55,15 +396,45 @@ class HTTPClient:
             base_url: Base URL for API requests.
             timeout: Request timeout in seconds.
             headers: Additional headers to include in all requests.
+            limits: Connection pool limits (pool size and keep-alive expiry).
+                Ignored for a client that is given a transport.
+            http2: Negotiate HTTP/2 when the server supports it. Enabled by
+                default when the h2 package is installed. Ignored for a
+                client that is given a transport.
+            max_retries: Retries for GET requests failing with a rate limit
+                or server error.
+            transport: Optional transport shared with other clients, so they
+                share one connection pool.
+            async_transport: Optional transport for the async client, shared
+                in the same way.
+            response_cache: Optional mapping (e.g. ``cachetools.TTLCache``)
+                memoizing get() responses by path, query parameters and
+                credentials, so it may be shared between clients. Entries
+                under the parent path of any non-GET request are dropped
+                when it is sent.
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._limits = limits
+        self._http2 = http2
+        self._max_retries = max_retries
+        self._breaker = CircuitBreaker(self._base_url)
+        # Bound once: per-request events pass method/path as plain kwargs, so
+        # disabled levels cost a no-op call instead of a bind() per request
+        self._log = logger.bind(base_url=self._base_url)
+        self._transport = transport
+        self._async_transport = async_transport
         self._default_headers = {
             "User-Agent": USER_AGENT,
             "Accept": "application/json",
             **(headers or {}),
         }
         self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_slots: asyncio.Semaphore | None = None
+        self._response_cache = response_cache
+        self._response_cache_lock = threading.Lock()
+        self._urls: dict[str, httpx.URL] = {}
 
     @property
     def client(self) -> httpx.Client:
@@ -73,15 +444,70 @@ class HTTPClient:
                 base_url=self._base_url,
                 timeout=self._timeout,
                 headers=self._default_headers,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
             )
         return self._client
 
+    def _url(self, path: str) -> httpx.URL:
+        """Resolve an endpoint path against the base URL, once per path.
+
+        Endpoint paths are fixed strings, so the absolute URL is cached and
+        httpx skips parsing and merging it with base_url on every request.
+        """
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = httpx.URL(f"{self._base_url}/{path.lstrip('/')}")
+        return url
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Get or create the httpx async client."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                headers=self._default_headers,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._async_transport,
+            )
+        return self._async_client
+
+    @property
+    def async_slots(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Get the limiter for in-flight async requests.
+
+        Async requests wait here for a free connection slot before they are
+        handed to httpx, so a large asyncio.gather queues up instead of
+        failing with pool timeouts.
+        """
+        max_connections = self._limits.max_connections
+        if max_connections is None:
+            return contextlib.nullcontext()
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(max_connections)
+        return self._async_slots
+
     def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client and release resources.
+
+        The async client (if any) must be closed with aclose().
+        """
         if self._client is not None:
             self._client.close()
             self._client = None
 
+    async def aclose(self) -> None:
+        """Close both the sync and async HTTP clients and release resources."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        # A semaphore belongs to the event loop it was first awaited in
+        self._async_slots = None
+
     def __enter__(self) -> HTTPClient:
         """Enter context manager."""
         return self
@@ -95,6 +521,19 @@ class HTTPClient:
         """Exit context manager."""
         self.close()
 
+    async def __aenter__(self) -> HTTPClient:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager."""
+        await self.aclose()
+
     def _prepare_auth(self) -> tuple[dict[str, str], httpx.Auth | None]:
         """Prepare authentication for request.
 
@@ -103,6 +542,17 @@ class HTTPClient:
         """
         return {}, None
 
+    def _auth_identity(self) -> str | None:
+        """Identify the credentials requests are sent with.
+
+        Part of response cache keys, so responses are only served back to
+        the same credentials.
+
+        Returns:
+            A fingerprint of the credentials, or None without any.
+        """
+        return None
+
     def request(
         self,
         method: str,
@@ -110,15 +560,23 @@ class HTTPClient:
         *,
         params: Mapping[str, Any] | None = None,
         json: Any | None = None,
+        content: bytes | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any] | list[Any]:
         """Make an HTTP request to the API.
 
+        GET requests that fail with a rate limit or server error are retried
+        up to ``max_retries`` times with exponential backoff and jitter,
+        honouring Retry-After up to RETRY_MAX_DELAY. Requests made while
+        this client's circuit breaker is open fail immediately with
+        ESBConnectionError.
+
         Args:
             method: HTTP method (GET, POST, etc.).
             path: API endpoint path.
             params: Query parameters.
             json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
             headers: Additional headers for this request.
 
         Returns:
@@ -135,36 +593,402 @@ class HTTPClient:
             ESBTimeoutError: When request times out.
             ESBError: For other API errors.
         """
-        auth_headers, auth = self._prepare_auth()
-        request_headers = {**auth_headers, **(headers or {})}
+        data: dict[str, Any] | list[Any] = self._request(
+            method, path, params=params, json=json, content=content, headers=headers
+        )
+        return data
 
-        log = logger.bind(method=method, path=path)
-        log.debug("http_request_start", params=params, has_body=json is not None)
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Send a request with retries; see request() and get_decoded()."""
+        # Encoded once up front: every retry attempt resends the same bytes
+        content, headers = _encode_json(json, headers, content)
+        if self._response_cache is not None and method.upper() != "GET":
+            # Writes drop cached GET responses under the same parent path
+            self._invalidate_cached(path)
+        # One breaker outcome per logical request, once retries are used up
+        is_probe = self._breaker.before_request()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    data = self._send(
+                        method,
+                        path,
+                        params=params,
+                        content=content,
+                        headers=headers,
+                        decode=decode,
+                    )
+                    break
+                except (ESBRateLimitError, ESBServerError) as e:
+                    if method.upper() != "GET" or attempt >= self._max_retries:
+                        raise
+                    delay = _retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    self._log.warning(
+                        "http_request_retry",
+                        method=method,
+                        path=path,
+                        attempt=attempt + 1,
+                        delay=delay,
+                    )
+                    time.sleep(delay)
+                    attempt += 1
+        except (ESBServerError, ESBTimeoutError, ESBConnectionError):
+            self._breaker.record_failure()
+            raise
+        except ESBError:
+            # The host answered, with an API error
+            self._breaker.record_success()
+            raise
+        except BaseException:
+            # Cancelled, interrupted or a local bug: the host never answered
+            if is_probe:
+                self._breaker.release_probe()
+            raise
+        self._breaker.record_success()
+        return data
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Send a single request attempt."""
+        auth_headers, auth = self._prepare_auth()
+        request_headers = headers
+        if auth_headers:
+            request_headers = {**auth_headers, **headers} if headers else auth_headers
+
+        log = self._log
+        log.debug(
+            "http_request_start",
+            method=method,
+            path=path,
+            params=params,
+            has_body=content is not None,
+        )
 
         try:
             response = self.client.request(
                 method=method,
-                url=path,
+                url=self._url(path),
                 params=params,
-                json=json,
+                content=content,
                 headers=request_headers,
                 auth=auth,
             )
         except httpx.TimeoutException as e:
-            log.warning("http_request_timeout", timeout=self._timeout)
+            log.warning(
+                "http_request_timeout", method=method, path=path, timeout=self._timeout
+            )
             raise ESBTimeoutError(
                 f"Request to {path} timed out after {self._timeout}s"
             ) from e
         except httpx.ConnectError as e:
-            log.exception("http_connection_error")
+            log.exception("http_connection_error", method=method, path=path)
             raise ESBConnectionError(
                 f"Failed to connect to {self._base_url}: {e}"
             ) from e
         except httpx.HTTPError as e:
-            log.exception("http_error")
+            log.exception("http_error", method=method, path=path)
             raise ESBConnectionError(f"HTTP error occurred: {e}") from e
 
-        log.debug("http_request_complete", status_code=response.status_code)
+        log.debug(
+            "http_request_complete",
+            method=method,
+            path=path,
+            status_code=response.status_code,
+        )
+        if decode is not None:
+            return self._decode_response(response, decode)
+        return self._handle_response(response)
+
+    def request_stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        item_path: str = "item",
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[Any]:
+        """Make an HTTP request and yield items of the JSON body as they arrive.
+
+        With ijson installed, a success body that is a top-level JSON list
+        is parsed while it downloads, so the first item is available before
+        the last byte arrives and only one item is held in memory at a
+        time. Any other body (e.g. an object carrying an error status) is
+        read whole and handled like in request(), as is every body without
+        ijson; the same items are yielded either way. Streamed requests are
+        not retried.
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            path: API endpoint path.
+            item_path: ijson prefix of the items to yield ("item" for the
+                elements of a top-level list).
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
+            headers: Additional headers for this request.
+
+        Yields:
+            Each parsed JSON value at ``item_path``.
+
+        Raises:
+            Same exceptions as request().
+        """
+        content, headers = _encode_json(json, headers, content)
+        auth_headers, auth = self._prepare_auth()
+        request_headers = headers
+        if auth_headers:
+            request_headers = {**auth_headers, **headers} if headers else auth_headers
+
+        log = self._log
+        log.debug("http_stream_start", method=method, path=path, params=params)
+
+        is_probe = self._breaker.before_request()
+        answered = False
+        try:
+            with self.client.stream(
+                method,
+                path,
+                params=params,
+                content=content,
+                headers=request_headers,
+                auth=auth,
+            ) as response:
+                answered = True
+                if response.status_code >= 500:
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.record_success()
+
+                if not IJSON_AVAILABLE or response.status_code >= 400:
+                    response.read()
+                    data = self._handle_response(response)
+                    yield from _iter_items(data, item_path)
+                    return
+
+                chunks = response.iter_bytes()
+                head = _read_until_token(chunks)
+                if head.lstrip()[:1] == b"[":
+                    yield from _iter_stream_items(
+                        itertools.chain((head,), chunks), path, item_path
+                    )
+                    return
+
+                # Objects carry the status envelope: check it like request()
+                body = head + b"".join(chunks)
+                data = self._handle_response(_with_body(response, body))
+                yield from _iter_items(data, item_path)
+        except httpx.TimeoutException as e:
+            self._breaker.record_failure()
+            log.warning(
+                "http_request_timeout", method=method, path=path, timeout=self._timeout
+            )
+            raise ESBTimeoutError(
+                f"Request to {path} timed out after {self._timeout}s"
+            ) from e
+        except httpx.HTTPError as e:
+            self._breaker.record_failure()
+            log.exception("http_error", method=method, path=path)
+            raise ESBConnectionError(f"HTTP error occurred: {e}") from e
+        except BaseException:
+            if is_probe and not answered:
+                self._breaker.release_probe()
+            raise
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make an HTTP request to the API without blocking the event loop.
+
+        Same as request(), but sent through the httpx async client so many
+        requests can be awaited concurrently (e.g. with asyncio.gather).
+
+        Args:
+            method: HTTP method (GET, POST, etc.).
+            path: API endpoint path.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
+            headers: Additional headers for this request.
+
+        Returns:
+            Parsed JSON response as a dictionary or list.
+
+        Raises:
+            Same exceptions as request(), with the same retries.
+        """
+        data: dict[str, Any] | list[Any] = await self._request_async(
+            method, path, params=params, json=json, content=content, headers=headers
+        )
+        return data
+
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Send a request with retries; see request_async()."""
+        # Encoded once up front: every retry attempt resends the same bytes
+        content, headers = _encode_json(json, headers, content)
+        if self._response_cache is not None and method.upper() != "GET":
+            # Writes drop cached GET responses under the same parent path
+            self._invalidate_cached(path)
+        # One breaker outcome per logical request, once retries are used up
+        is_probe = self._breaker.before_request()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    data = await self._send_async(
+                        method,
+                        path,
+                        params=params,
+                        content=content,
+                        headers=headers,
+                        decode=decode,
+                    )
+                    break
+                except (ESBRateLimitError, ESBServerError) as e:
+                    if method.upper() != "GET" or attempt >= self._max_retries:
+                        raise
+                    delay = _retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    self._log.warning(
+                        "http_request_retry",
+                        method=method,
+                        path=path,
+                        attempt=attempt + 1,
+                        delay=delay,
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+        except (ESBServerError, ESBTimeoutError, ESBConnectionError):
+            self._breaker.record_failure()
+            raise
+        except ESBError:
+            # The host answered, with an API error
+            self._breaker.record_success()
+            raise
+        except BaseException:
+            # Cancelled, interrupted or a local bug: the host never answered
+            if is_probe:
+                self._breaker.release_probe()
+            raise
+        self._breaker.record_success()
+        return data
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Send a single request attempt."""
+        auth_headers, auth = self._prepare_auth()
+        request_headers = headers
+        if auth_headers:
+            request_headers = {**auth_headers, **headers} if headers else auth_headers
+
+        log = self._log
+        log.debug(
+            "http_request_start",
+            method=method,
+            path=path,
+            params=params,
+            has_body=content is not None,
+        )
+
+        try:
+            async with self.async_slots:
+                response = await self.async_client.request(
+                    method=method,
+                    url=self._url(path),
+                    params=params,
+                    content=content,
+                    headers=request_headers,
+                    auth=auth,
+                )
+        except httpx.TimeoutException as e:
+            log.warning(
+                "http_request_timeout", method=method, path=path, timeout=self._timeout
+            )
+            raise ESBTimeoutError(
+                f"Request to {path} timed out after {self._timeout}s"
+            ) from e
+        except httpx.ConnectError as e:
+            log.exception("http_connection_error", method=method, path=path)
+            raise ESBConnectionError(
+                f"Failed to connect to {self._base_url}: {e}"
+            ) from e
+        except httpx.HTTPError as e:
+            log.exception("http_error", method=method, path=path)
+            raise ESBConnectionError(f"HTTP error occurred: {e}") from e
+
+        log.debug(
+            "http_request_complete",
+            method=method,
+            path=path,
+            status_code=response.status_code,
+        )
+        if decode is not None:
+            return self._decode_response(response, decode)
+        return self._handle_response(response)
+
+    def _decode_response(
+        self, response: httpx.Response, decode: Callable[[bytes], Any]
+    ) -> Any:
+        """Decode a successful response body in one pass, if decode accepts it.
+
+        Bodies that decode rejects with ValueError (including pydantic's
+        ValidationError) go through _handle_response() instead, which raises
+        for API errors and otherwise returns the parsed JSON.
+        """
+        if response.status_code < 400 and response.content:
+            try:
+                return decode(response.content)
+            except ValueError:
+                pass
         return self._handle_response(response)
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any] | list[Any]:
@@ -179,19 +1003,20 @@ class HTTPClient:
         Raises:
             Various ESB exceptions based on response status and content.
         """
+        # No content (204 or empty body): nothing to parse
+        if response.status_code < 400 and (
+            response.status_code == 204 or not response.content
+        ):
+            return {}
+
+        # Error pages from proxies/gateways are HTML: skip the doomed parse
+        if response.status_code >= 400 and not _is_json_content_type(response):
+            raise _non_json_error(response)
+
         try:
-            json_data: dict[str, Any] | list[Any] = response.json()
+            json_data: dict[str, Any] | list[Any] = _json_loads(response.content)
         except ValueError as err:
-            # Non-JSON response
-            if response.status_code >= 500:
-                raise ESBServerError(
-                    f"Server error: {response.text}",
-                    status_code=response.status_code,
-                ) from err
-            raise ESBError(
-                f"Invalid response: {response.text}",
-                status_code=response.status_code,
-            ) from err
+            raise _non_json_error(response) from err
 
         # If response is a list, return directly (no error metadata)
         if isinstance(json_data, list):
@@ -201,12 +1026,9 @@ class HTTPClient:
                 if json_data and isinstance(json_data[0], dict):
                     msg = json_data[0].get("message", msg)
                 # Map HTTP status codes to appropriate exceptions
-                if response.status_code == 401:
-                    raise ESBAuthenticationError(msg, status_code=response.status_code)
-                if response.status_code == 403:
-                    raise ESBAuthorizationError(msg, status_code=response.status_code)
-                if response.status_code == 404:
-                    raise ESBNotFoundError(msg, status_code=response.status_code)
+                error_class = _STATUS_ERRORS.get(response.status_code)
+                if error_class is not None:
+                    raise error_class(msg, status_code=response.status_code)
                 if response.status_code >= 500:
                     raise ESBServerError(msg, status_code=response.status_code)
                 raise ESBError(msg, status_code=response.status_code)
@@ -215,47 +1037,45 @@ class HTTPClient:
         data = json_data
         # Check for API-level errors
         # Note: status can be "ok", "fail", "failed" or numeric "00", "01"
-        status = str(data.get("status", "")).lower()
-        code = data.get("code")
-        # V1 APIs use "error" field instead of "message"
-        message = data.get("message") or data.get("error") or "Unknown error"
+        raw_status = data.get("status", "")
+
+        # Fast path for the common case: 2xx/3xx with no or a success status.
+        # A tuple, not the frozenset, since the value may be unhashable.
+        if response.status_code < 400 and raw_status in ("", "ok", "00"):
+            return data
+
+        status = raw_status.lower() if isinstance(raw_status, str) else str(raw_status)
 
         # Successful response
         # Note: V1 APIs return status "00" for success, "01" for error
-        if status in ("ok", "00") or (
-            status not in ("fail", "failed", "01") and response.status_code < 400
+        if status in _OK_STATUSES or (
+            status not in _FAIL_STATUSES and response.status_code < 400
         ):
             return data
 
-        # Handle specific error codes
-        error_kwargs: dict[str, Any] = {
-            "code": code,
-            "status_code": response.status_code,
-            "response_data": data,
-        }
-
-        # Authentication errors (401)
-        if response.status_code == 401:
-            raise ESBAuthenticationError(message, **error_kwargs)
-
-        # Authorization errors (403)
-        if response.status_code == 403:
-            raise ESBAuthorizationError(message, **error_kwargs)
-
-        # Not found errors (404)
-        if response.status_code == 404:
-            raise ESBNotFoundError(message, **error_kwargs)
+        code = data.get("code")
+        # V1 APIs use "error" field instead of "message"
+        message = data.get("message") or data.get("error") or "Unknown error"
 
-        # Method not allowed errors (405)
-        if response.status_code == 405:
-            raise ESBMethodNotAllowedError(message, **error_kwargs)
+        # Handle specific error codes
+        status_code = response.status_code
+
+        # Authentication (401), authorization (403), not found (404) and
+        # method not allowed (405) errors
+        error_class = _STATUS_ERRORS.get(status_code)
+        if error_class is not None:
+            raise error_class(
+                message, code=code, status_code=status_code, response_data=data
+            )
 
         # Rate limit errors (429)
-        if response.status_code == 429:
+        if status_code == 429:
             retry_after = response.headers.get("Retry-After")
             raise ESBRateLimitError(
                 message,
-                **error_kwargs,
+                code=code,
+                status_code=status_code,
+                response_data=data,
                 retry_after=int(retry_after) if retry_after else None,
             )
 
@@ -263,83 +1083,181 @@ class HTTPClient:
         # The API returns validation errors in different fields:
         # - "data" field (Backend API V2): list of strings or dict
         # - "errors" field (Master POS/V1 APIs): dict mapping fields to error lists
-        if response.status_code in (400, 422):
+        if status_code in (400, 422):
             validation_errors = data.get("data") or data.get("errors")
             raise ESBValidationError(
                 message,
-                **error_kwargs,
+                code=code,
+                status_code=status_code,
+                response_data=data,
                 validation_errors=validation_errors,
             )
 
         # Server errors (5xx)
-        if response.status_code >= 500:
-            raise ESBServerError(message, **error_kwargs)
+        if status_code >= 500:
+            raise ESBServerError(
+                message, code=code, status_code=status_code, response_data=data
+            )
 
         # Check for fail status in response body
         # - Auth API: "fail" or "failed" with EC* codes
         # - V1 APIs: "01" for error status
-        if status in ("fail", "failed", "01"):
+        if status in _FAIL_STATUSES:
             # Try to determine error type from code
             if code and isinstance(code, str):
-                # Core API authentication codes (EC031000xx)
-                # EC03100001: Invalid Token
-                # EC03100003: Validation Error
-                # EC03100032: Invalid username or password
-                if code in ("EC03100001", "EC03100032"):
-                    raise ESBAuthenticationError(message, **error_kwargs)
-                if code == "EC03100003":
+                code_error = _CODE_ERRORS.get(code)
+                if code_error is not None:
+                    error_class, errors_field = code_error
+                    if errors_field is None:
+                        raise error_class(
+                            message,
+                            code=code,
+                            status_code=status_code,
+                            response_data=data,
+                        )
                     raise ESBValidationError(
                         message,
-                        **error_kwargs,
-                        validation_errors=data.get("errors"),
+                        code=code,
+                        status_code=status_code,
+                        response_data=data,
+                        validation_errors=data.get(errors_field),
                     )
-                # Backend API authentication code
-                # EC011401: Unauthorized
-                if code == "EC011401":
-                    raise ESBAuthenticationError(message, **error_kwargs)
                 # Backend API error code EC0110
                 # Used for both "not found" and validation errors
                 # Message may contain JSON-encoded validation errors
                 if code == "EC0110":
                     # Try to parse message as JSON validation errors
                     try:
-                        parsed_message = json.loads(message)
+                        parsed_message = _json_loads(message)
                         if isinstance(parsed_message, dict):
                             # Message contains validation errors as JSON
                             raise ESBValidationError(
                                 "Validation error",
-                                **error_kwargs,
+                                code=code,
+                                status_code=status_code,
+                                response_data=data,
                                 validation_errors=parsed_message,
                             )
-                    except (json.JSONDecodeError, TypeError):
+                    except (ValueError, TypeError):
                         pass
                     # Check if message indicates "not found"
-                    if "not found" in message.lower():
-                        raise ESBNotFoundError(message, **error_kwargs)
+                    if _NOT_FOUND_MESSAGE.search(message):
+                        raise ESBNotFoundError(
+                            message,
+                            code=code,
+                            status_code=status_code,
+                            response_data=data,
+                        )
                     # Default to generic error
-                    raise ESBError(message, **error_kwargs)
-                # Backend API error code EC0118
-                # Undefined index errors (missing required fields)
-                if code == "EC0118":
-                    raise ESBValidationError(message, **error_kwargs)
-                # Backend API validation error code
-                # EC011400: Validation Error (Shift Data API)
-                if code == "EC011400":
-                    raise ESBValidationError(
-                        message,
-                        **error_kwargs,
-                        validation_errors=data.get("data"),
+                    raise ESBError(
+                        message, code=code, status_code=status_code, response_data=data
                     )
 
             # V1 APIs without EC codes - detect error type from message
             # "Undefined index:" indicates missing required field
-            if "undefined index" in message.lower():
-                raise ESBValidationError(message, **error_kwargs)
+            if _UNDEFINED_INDEX_MESSAGE.search(message):
+                raise ESBValidationError(
+                    message, code=code, status_code=status_code, response_data=data
+                )
 
-            raise ESBError(message, **error_kwargs)
+            raise ESBError(
+                message, code=code, status_code=status_code, response_data=data
+            )
 
         # Generic error
-        raise ESBError(message, **error_kwargs)
+        raise ESBError(message, code=code, status_code=status_code, response_data=data)
+
+    def _cache_key(
+        self,
+        path: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[Hashable, ...] | None:
+        """Build the response cache key for a GET request.
+
+        The base URL and a fingerprint of the credentials are part of the
+        key, so one cache can be shared by clients for different hosts and
+        users without serving one user's responses to another. Extra
+        headers are part of it too, so requests that differ only in headers
+        are cached apart.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers of the request.
+
+        Returns:
+            The cache key, or None if the parameters are not hashable.
+        """
+        key = (
+            self._base_url,
+            path,
+            tuple(sorted(params.items())) if params else None,
+            tuple(sorted(headers.items())) if headers else None,
+            self._auth_identity(),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _get_cached(
+        self, key: tuple[Hashable, ...]
+    ) -> dict[str, Any] | list[Any] | None:
+        """Get a copy of a cached response.
+
+        Args:
+            key: Cache key from _cache_key().
+
+        Returns:
+            A deep copy of the cached response, or None on a miss.
+        """
+        if self._response_cache is None:
+            return None
+        with self._response_cache_lock:
+            data: dict[str, Any] | list[Any] | None = self._response_cache.get(key)
+        if data is None:
+            return None
+        self._log.debug("http_cache_hit", path=key[1])
+        return deepcopy(data)
+
+    def _set_cached(
+        self, key: tuple[Hashable, ...], data: dict[str, Any] | list[Any]
+    ) -> None:
+        """Store a copy of a response in the cache.
+
+        Args:
+            key: Cache key from _cache_key().
+            data: Parsed response to cache.
+        """
+        if self._response_cache is None:
+            return
+        data = deepcopy(data)
+        with self._response_cache_lock:
+            self._response_cache[key] = data
+
+    def _invalidate_cached(self, path: str) -> None:
+        """Drop cached responses under the parent path of a write.
+
+        E.g. a POST to ``/master/menu/create`` drops ``/master/menu/...``.
+
+        Args:
+            path: Path of the non-GET request.
+        """
+        if self._response_cache is None:
+            return
+        prefix = path.rstrip("/").rpartition("/")[0] + "/"
+        with self._response_cache_lock:
+            stale = [
+                key
+                for key in self._response_cache
+                if isinstance(key, tuple)
+                and key[0] == self._base_url
+                and str(key[1]).startswith(prefix)
+            ]
+            for key in stale:
+                self._response_cache.pop(key, None)
 
     def get(
         self,
@@ -347,50 +1265,259 @@ class HTTPClient:
         *,
         params: Mapping[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        cache: bool = True,
     ) -> dict[str, Any] | list[Any]:
         """Make a GET request.
 
+        Served from the response cache when one is configured.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers.
+            cache: Whether the response cache may be used for this request,
+                e.g. False for data that is still changing.
+
+        Returns:
+            Parsed JSON response (dict or list).
+        """
+        key = None
+        if self._response_cache is not None and cache:
+            key = self._cache_key(path, params, headers)
+        if key is not None:
+            cached = self._get_cached(key)
+            if cached is not None:
+                return cached
+        data = self.request("GET", path, params=params, headers=headers)
+        if key is not None:
+            self._set_cached(key, data)
+        return data
+
+    def get_decoded(
+        self,
+        path: str,
+        decode: Callable[[bytes], _T],
+        *,
+        params: Mapping[str, Any] | None = None,
+        cache: bool = True,
+    ) -> _T | dict[str, Any] | list[Any]:
+        """Make a GET request and decode the raw body in one pass.
+
+        Lets a caller parse and validate a large success response straight
+        from bytes (e.g. with a pydantic ``model_validate_json``) instead of
+        building the intermediate dict first. When decode rejects the body
+        with ValueError, or the response cache is used, the response is
+        handled as in get() and the parsed JSON is returned instead.
+
+        Args:
+            path: API endpoint path.
+            decode: Parses a success body; raises ValueError to decline it.
+            params: Query parameters.
+            cache: Whether the response cache may be used for this request.
+
+        Returns:
+            The decoded value, or the parsed JSON response (dict or list).
+        """
+        if self._response_cache is not None and cache:
+            return self.get(path, params=params)
+        data: _T | dict[str, Any] | list[Any] = self._request(
+            "GET", path, params=params, decode=decode
+        )
+        return data
+
+    def post(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make a POST request.
+
         Args:
             path: API endpoint path.
             params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
             headers: Additional headers.
 
         Returns:
             Parsed JSON response (dict or list).
         """
         return self.request(
-            "GET",
+            "POST",
             path,
             params=params,
+            json=json,
+            content=content,
             headers=headers,
         )
 
-    def post(
+    def post_decoded(
         self,
         path: str,
+        decode: Callable[[bytes], _T],
         *,
         params: Mapping[str, Any] | None = None,
         json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> _T | dict[str, Any] | list[Any]:
+        """Make a POST request and decode the raw body in one pass.
+
+        Same as get_decoded(), for endpoints that answer a POST query with
+        a large body. POST responses are never cached.
+
+        Args:
+            path: API endpoint path.
+            decode: Parses a success body; raises ValueError to decline it.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
+            headers: Additional headers.
+
+        Returns:
+            The decoded value, or the parsed JSON response (dict or list).
+        """
+        data: _T | dict[str, Any] | list[Any] = self._request(
+            "POST",
+            path,
+            params=params,
+            json=json,
+            content=content,
+            headers=headers,
+            decode=decode,
+        )
+        return data
+
+    async def get_async(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        cache: bool = True,
     ) -> dict[str, Any] | list[Any]:
-        """Make a POST request.
+        """Make an async GET request.
+
+        Uses the same response cache as get().
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers.
+            cache: Whether the response cache may be used for this request.
+
+        Returns:
+            Parsed JSON response (dict or list).
+        """
+        key = None
+        if self._response_cache is not None and cache:
+            key = self._cache_key(path, params, headers)
+        if key is not None:
+            cached = self._get_cached(key)
+            if cached is not None:
+                return cached
+        data = await self.request_async("GET", path, params=params, headers=headers)
+        if key is not None:
+            self._set_cached(key, data)
+        return data
+
+    async def get_decoded_async(
+        self,
+        path: str,
+        decode: Callable[[bytes], _T],
+        *,
+        params: Mapping[str, Any] | None = None,
+        cache: bool = True,
+    ) -> _T | dict[str, Any] | list[Any]:
+        """Make an async GET request and decode the raw body in one pass.
+
+        Same as get_decoded().
+
+        Args:
+            path: API endpoint path.
+            decode: Parses a success body; raises ValueError to decline it.
+            params: Query parameters.
+            cache: Whether the response cache may be used for this request.
+
+        Returns:
+            The decoded value, or the parsed JSON response (dict or list).
+        """
+        if self._response_cache is not None and cache:
+            return await self.get_async(path, params=params)
+        data: _T | dict[str, Any] | list[Any] = await self._request_async(
+            "GET", path, params=params, decode=decode
+        )
+        return data
+
+    async def post_async(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make an async POST request.
 
         Args:
             path: API endpoint path.
             params: Query parameters.
             json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
             headers: Additional headers.
 
         Returns:
             Parsed JSON response (dict or list).
         """
-        return self.request(
+        return await self.request_async(
+            "POST",
+            path,
+            params=params,
+            json=json,
+            content=content,
+            headers=headers,
+        )
+
+    async def post_decoded_async(
+        self,
+        path: str,
+        decode: Callable[[bytes], _T],
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> _T | dict[str, Any] | list[Any]:
+        """Make an async POST request and decode the raw body in one pass.
+
+        Same as post_decoded().
+
+        Args:
+            path: API endpoint path.
+            decode: Parses a success body; raises ValueError to decline it.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body bytes, sent instead of json.
+            headers: Additional headers.
+
+        Returns:
+            The decoded value, or the parsed JSON response (dict or list).
+        """
+        data: _T | dict[str, Any] | list[Any] = await self._request_async(
             "POST",
             path,
             params=params,
             json=json,
+            content=content,
             headers=headers,
+            decode=decode,
         )
+        return data
 
 
 class BearerHTTPClient(HTTPClient):
@@ -408,6 +1535,12 @@ class BearerHTTPClient(HTTPClient):
         get_token: Callable[[], str | None],
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = HTTP2_AVAILABLE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        response_cache: MutableMapping[Hashable, Any] | None = None,
     ) -> None:
         """Initialize the Bearer HTTP client.
 
@@ -416,21 +1549,73 @@ class BearerHTTPClient(HTTPClient):
             get_token: Callback function to get the current Bearer token.
             timeout: Request timeout in seconds.
             headers: Additional headers to include in all requests.
+            limits: Connection pool limits (pool size and keep-alive expiry).
+            http2: Negotiate HTTP/2 when the server supports it.
+            max_retries: Retries for failed GET requests (429/5xx).
+            transport: Optional shared transport for the sync client.
+            async_transport: Optional shared transport for the async client.
+            response_cache: Optional cache for get() responses.
         """
-        super().__init__(base_url=base_url, timeout=timeout, headers=headers)
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=limits,
+            http2=http2,
+            max_retries=max_retries,
+            transport=transport,
+            async_transport=async_transport,
+            response_cache=response_cache,
+        )
         self._get_token = get_token
+        # Token currently set as the clients' default Authorization header
+        self._auth_token: str | None = None
+        # Serializes token reads with header writes across pool threads
+        self._auth_lock = threading.Lock()
 
     def _prepare_auth(self) -> tuple[dict[str, str], httpx.Auth | None]:
         """Prepare Bearer token authentication.
 
+        The Authorization header lives in the clients' default headers and
+        is only rewritten when the token rotates, so requests carry no
+        per-call auth headers to merge.
+
+        The token is read and written under a lock. Otherwise a thread that
+        read the token just before a refresh could write the old token back
+        over the new one, and requests sent by other threads in between
+        would go out with it.
+
         Returns:
-            Tuple of (headers_dict with Authorization, None).
+            Tuple of (empty headers, None).
         """
-        token = self._get_token()
-        if token:
-            return {"Authorization": f"Bearer {token}"}, None
+        with self._auth_lock:
+            token = self._get_token()
+            if token != self._auth_token:
+                self._auth_token = token
+                self._set_authorization(_bearer_authorization(token) if token else None)
         return {}, None
 
+    def _auth_identity(self) -> str | None:
+        """Fingerprint the current Bearer token; see HTTPClient."""
+        token = self._get_token()
+        return _fingerprint(token) if token else None
+
+    def _set_authorization(self, value: str | None) -> None:
+        """Set or clear the default Authorization header on all clients.
+
+        Args:
+            value: Header value, or None to remove the header.
+        """
+        clients = [c for c in (self._client, self._async_client) if c is not None]
+        if value is None:
+            self._default_headers.pop("Authorization", None)
+            for client in clients:
+                client.headers.pop("Authorization", None)
+            return
+        self._default_headers["Authorization"] = value
+        for client in clients:
+            client.headers["Authorization"] = value
+
 
 class BasicAuthHTTPClient(HTTPClient):
     """HTTP client with Basic authentication.
@@ -446,6 +1631,12 @@ class BasicAuthHTTPClient(HTTPClient):
         get_credentials: Callable[[], tuple[str, str] | None],
         timeout: float = DEFAULT_TIMEOUT,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = HTTP2_AVAILABLE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        response_cache: MutableMapping[Hashable, Any] | None = None,
     ) -> None:
         """Initialize the Basic Auth HTTP client.
 
@@ -454,9 +1645,28 @@ class BasicAuthHTTPClient(HTTPClient):
             get_credentials: Callback function returning (username, password) tuple.
             timeout: Request timeout in seconds.
             headers: Additional headers to include in all requests.
+            limits: Connection pool limits (pool size and keep-alive expiry).
+            http2: Negotiate HTTP/2 when the server supports it.
+            max_retries: Retries for failed GET requests (429/5xx).
+            transport: Optional shared transport for the sync client.
+            async_transport: Optional shared transport for the async client.
+            response_cache: Optional cache for get() responses.
         """
-        super().__init__(base_url=base_url, timeout=timeout, headers=headers)
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=limits,
+            http2=http2,
+            max_retries=max_retries,
+            transport=transport,
+            async_transport=async_transport,
+            response_cache=response_cache,
+        )
         self._get_credentials = get_credentials
+        # BasicAuth for the last credentials seen, rebuilt on change
+        self._auth_credentials: tuple[str, str] | None = None
+        self._basic_auth: httpx.BasicAuth | None = None
 
     def _prepare_auth(self) -> tuple[dict[str, str], httpx.Auth | None]:
         """Prepare Basic authentication.
@@ -465,9 +1675,21 @@ class BasicAuthHTTPClient(HTTPClient):
             Tuple of (empty headers, BasicAuth object).
         """
         credentials = self._get_credentials()
-        if credentials:
-            return {}, httpx.BasicAuth(username=credentials[0], password=credentials[1])
-        return {}, None
+        if credentials != self._auth_credentials:
+            self._auth_credentials = credentials
+            self._basic_auth = (
+                httpx.BasicAuth(username=credentials[0], password=credentials[1])
+                if credentials
+                else None
+            )
+        return {}, self._basic_auth
+
+    def _auth_identity(self) -> str | None:
+        """Fingerprint the Basic Auth credentials; see HTTPClient."""
+        credentials = self._get_credentials()
+        if credentials is None:
+            return None
+        return _fingerprint(f"{credentials[0]}:{credentials[1]}")
 
 
 class ManualTokenHTTPClient(HTTPClient):
@@ -496,7 +1718,10 @@ class ManualTokenHTTPClient(HTTPClient):
         Returns:
             Parsed JSON response (dict or list).
         """
-        request_headers = {"Authorization": f"Bearer {auth_token}", **(headers or {})}
+        request_headers = {
+            "Authorization": _bearer_authorization(auth_token),
+            **(headers or {}),
+        }
         return self.request(
             "GET",
             path,
@@ -0,0 +1,46 @@
+"""Page prefetching for async iteration over paginated endpoints.
+
+Kept out of the mypyc-compiled modules: mypyc cannot compile async
+generators, and interpreted functions may be called from compiled code.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+_ItemT = TypeVar("_ItemT")
+
+
+async def prefetch_pages(
+    get_page: Callable[[int], Awaitable[list[_ItemT]]],
+) -> AsyncIterator[_ItemT]:
+    """Yield the items of pages 1, 2, ... while fetching one page ahead.
+
+    The request for page N+1 starts as soon as page N arrives, so it
+    downloads while the caller works through page N. Iteration stops at
+    the first empty page.
+
+    Args:
+        get_page: Coroutine function returning the items of a 1-based page.
+
+    Yields:
+        Items in page order.
+    """
+    page = 1
+    next_page = asyncio.ensure_future(get_page(page))
+    try:
+        while True:
+            items = await next_page
+            if not items:
+                return
+            page += 1
+            next_page = asyncio.ensure_future(get_page(page))
+            for item in items:
+                yield item
+    finally:
+        # No-op once awaited; cancels the prefetch if the caller stopped early
+        next_page.cancel()
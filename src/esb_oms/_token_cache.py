@@ -0,0 +1,119 @@
+"""On-disk token cache for ESB OMS API client.
+
+Lets a new process reuse a still-valid access token from a previous run
+instead of logging in again.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import tempfile
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import structlog
+from pydantic import BaseModel, ValidationError
+
+from esb_oms.models.auth import TokenInfo
+
+# Access tokens expire after 1 hour (used when the JWT has no "exp" claim)
+DEFAULT_TOKEN_LIFETIME = timedelta(hours=1)
+
+# Cached tokens this close to expiry are treated as expired
+EXPIRY_MARGIN = timedelta(minutes=1)
+
+logger = structlog.get_logger(__name__)
+
+
+class _CachedToken(BaseModel):
+    """Contents of a token cache file.
+
+    Attributes:
+        core_url: Base URL of the ESB Core host that issued the token.
+        token: The cached token info.
+    """
+
+    core_url: str
+    token: TokenInfo
+
+
+def token_expiry(access_token: str) -> datetime:
+    """Get the expiry time of an access token.
+
+    Reads the "exp" claim of the JWT payload. The signature is not verified;
+    the result is only used to decide whether a cached token is worth reusing.
+
+    Args:
+        access_token: JWT access token.
+
+    Returns:
+        The expiry time, or one hour from now if it cannot be determined.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        padded = payload + "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromtimestamp(int(claims["exp"]), tz=UTC)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return datetime.now(tz=UTC) + DEFAULT_TOKEN_LIFETIME
+
+
+def load_token(path: Path, username: str | None, core_url: str) -> TokenInfo | None:
+    """Load a cached token if it is still valid.
+
+    Args:
+        path: Token cache file.
+        username: Username the token must belong to.
+        core_url: Base URL of the ESB Core host the token must come from,
+            so a client never sends another environment's tokens.
+
+    Returns:
+        The cached token info, or None if missing, unreadable, expired,
+        or issued to a different user or by a different host.
+    """
+    try:
+        cached = _CachedToken.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError):
+        logger.warning("token_cache_unreadable", path=str(path))
+        return None
+
+    token_info = cached.token
+    if cached.core_url != core_url:
+        logger.info("token_cache_other_host", path=str(path), core_url=cached.core_url)
+        return None
+    if username is not None and token_info.username != username:
+        return None
+    if token_info.expires_at is None or (
+        token_info.expires_at - EXPIRY_MARGIN <= datetime.now(tz=UTC)
+    ):
+        return None
+    return token_info
+
+
+def save_token(path: Path, token_info: TokenInfo, core_url: str) -> None:
+    """Write a token to the cache file atomically.
+
+    The token is written to a temporary file in the same directory and
+    moved into place with an atomic rename, so readers never see a partial file.
+    The file is only readable by the current user.
+
+    Args:
+        path: Token cache file.
+        token_info: Token info to cache.
+        core_url: Base URL of the ESB Core host that issued the token.
+    """
+    cached = _CachedToken(core_url=core_url, token=token_info)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(cached.__pydantic_serializer__.to_json(cached))
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -1,17 +1,37 @@
 """API modules for ESB OMS."""
 
-from esb_oms.api.auth import AuthAPI
-from esb_oms.api.master_member import MasterMemberAPI
-from esb_oms.api.master_menu import (
-    MasterMenuAPI,
-    MasterMenuCategoryAPI,
-    MasterMenuTemplateAPI,
-)
-from esb_oms.api.master_pos import MasterPOSAPI
-from esb_oms.api.master_promotion import MasterPromotionAPI
-from esb_oms.api.other import OtherAPI
-from esb_oms.api.report import ReportAPI
-from esb_oms.api.sales import SalesAPI
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from esb_oms.api.auth import AuthAPI
+    from esb_oms.api.master_member import MasterMemberAPI
+    from esb_oms.api.master_menu import (
+        MasterMenuAPI,
+        MasterMenuCategoryAPI,
+        MasterMenuTemplateAPI,
+    )
+    from esb_oms.api.master_pos import MasterPOSAPI
+    from esb_oms.api.master_promotion import MasterPromotionAPI
+    from esb_oms.api.other import OtherAPI
+    from esb_oms.api.report import ReportAPI
+    from esb_oms.api.sales import SalesAPI
+
+# API class name -> submodule defining it, imported on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    "AuthAPI": "auth",
+    "MasterMemberAPI": "master_member",
+    "MasterMenuAPI": "master_menu",
+    "MasterMenuCategoryAPI": "master_menu",
+    "MasterMenuTemplateAPI": "master_menu",
+    "MasterPOSAPI": "master_pos",
+    "MasterPromotionAPI": "master_promotion",
+    "OtherAPI": "other",
+    "ReportAPI": "report",
+    "SalesAPI": "sales",
+}
 
 __all__ = [
     "AuthAPI",
@@ -25,3 +45,29 @@ __all__ = [
     "ReportAPI",
     "SalesAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an API class from its submodule on first access.
+
+    Args:
+        name: API class name, e.g. ``"ReportAPI"``.
+
+    Returns:
+        The API class.
+
+    Raises:
+        AttributeError: If the name is not an exported API class.
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported API classes."""
+    return sorted({*globals(), *__all__})
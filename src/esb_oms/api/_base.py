@@ -2,12 +2,224 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from esb_oms.exceptions import ESBError
+from esb_oms.models.common import SuccessResponse
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Collection, Mapping, Sequence
+
+    from pydantic import BaseModel
+
     from esb_oms._http import BearerHTTPClient
 
 
+_ResultT = TypeVar("_ResultT")
+
+# Query parameters of an endpoint call: API field name to value
+QueryParams = dict[str, str | int]
+
+
+def encode_request(request: BaseModel, *, exclude_none: bool = True) -> bytes:
+    """Encode a request model as a JSON body.
+
+    Produces the same JSON as dumping the model by alias and encoding the
+    dict, but in one pass through pydantic-core without the intermediate
+    dict.
+
+    Args:
+        request: The request model.
+        exclude_none: Leave out fields that are None.
+
+    Returns:
+        UTF-8 encoded JSON body.
+    """
+    return request.__pydantic_serializer__.to_json(
+        request, by_alias=True, exclude_none=exclude_none
+    )
+
+
+def filter_body(
+    filters: Mapping[str, object], *, required: Collection[str] = ()
+) -> dict[str, str]:
+    """Build a request body of string filters without a request model.
+
+    Applies what the request models did: values are stripped of
+    surrounding whitespace (``str_strip_whitespace`` on ESBBaseModel),
+    non-string values are rejected instead of being serialized as is, and
+    unset optional filters are left out.
+
+    Args:
+        filters: API field name to filter value, None when unset.
+        required: Field names that must be set.
+
+    Returns:
+        The filters to send, keyed by API field name.
+
+    Raises:
+        TypeError: If a filter is not a string, or a required one is None.
+    """
+    body: dict[str, str] = {}
+    for key, value in filters.items():
+        if value is None and key not in required:
+            continue
+        if not isinstance(value, str):
+            msg = f"{key} must be a string, not {type(value).__name__}"
+            raise TypeError(msg)
+        body[key] = value.strip()
+    return body
+
+
+def expect_object(response: dict[str, Any] | list[Any], path: str) -> dict[str, Any]:
+    """Check that a response is a JSON object.
+
+    Endpoints that always answer with an object go through this once, so
+    their callers can index the result directly.
+
+    Args:
+        response: Parsed JSON response.
+        path: API endpoint path, used in the error message.
+
+    Returns:
+        The response, typed as a dict.
+
+    Raises:
+        TypeError: If the response is not a JSON object.
+    """
+    if type(response) is dict:
+        return response
+    msg = f"Unexpected response format from {path}: expected a JSON object"
+    raise TypeError(msg)
+
+
+def expect_list(response: dict[str, Any] | list[Any], path: str) -> list[Any]:
+    """Check that a response is a JSON list.
+
+    The list counterpart of expect_object(), for endpoints that answer with
+    a bare array. Anything else, including the empty object returned for
+    a 204, is reported as an API error rather than a validation error.
+
+    Args:
+        response: Parsed JSON response.
+        path: API endpoint path, used in the error message.
+
+    Returns:
+        The response, typed as a list.
+
+    Raises:
+        ESBError: If the response is not a JSON list.
+    """
+    if isinstance(response, list):
+        return response
+    msg = f"Unexpected response format from {path}: expected a JSON list"
+    raise ESBError(msg, response_data=response)
+
+
+# SuccessResponse models by result type, see _envelope()
+_ENVELOPES: dict[type[Any], type[SuccessResponse[Any]]] = {}
+
+
+def _envelope(result_type: type[_ResultT]) -> type[SuccessResponse[_ResultT]]:
+    """Get the SuccessResponse model for a result type.
+
+    Parametrizing a generic model builds a new class, so it is done once per
+    result type, on first use rather than at import.
+    """
+    envelope = _ENVELOPES.get(result_type)
+    if envelope is None:
+        envelope = SuccessResponse[result_type]  # type: ignore[valid-type]
+        _ENVELOPES[result_type] = envelope
+    return envelope
+
+
+def _unwrap_result(
+    response: SuccessResponse[_ResultT] | dict[str, Any] | list[Any],
+    envelope: type[SuccessResponse[_ResultT]],
+    path: str,
+) -> _ResultT:
+    """Get the ``result`` of a get_decoded() response.
+
+    Responses the fast path declined arrive as parsed JSON and are
+    validated the regular way, with a missing result treated as empty.
+    """
+    if isinstance(response, (dict, list)):
+        result = expect_object(response, path).get("result", {})
+        return envelope.model_validate({"result": result}).result
+    return response.result
+
+
+_ItemT_co = TypeVar("_ItemT_co", covariant=True)
+
+
+class Page(Protocol[_ItemT_co]):
+    """A page of a paginated listing response."""
+
+    @property
+    def data(self) -> Sequence[_ItemT_co]: ...
+
+    @property
+    def count(self) -> int: ...
+
+    @property
+    def limit(self) -> int: ...
+
+    @property
+    def next_cursor(self) -> str | None: ...
+
+
+class RawPage:
+    """Unvalidated page of a listing ``result``, validated by the caller."""
+
+    __slots__ = ("count", "data", "limit", "next_cursor")
+
+    def __init__(self, result: dict[str, Any]) -> None:
+        self.data: list[Any] = result.get("data") or []
+        self.count = int(result.get("count") or 0)
+        self.limit = int(result.get("limit") or 0)
+        self.next_cursor: str | None = result.get("nextCursor") or None
+
+
+# Default number of pages fetched at once by gather_pages() callers
+DEFAULT_PAGE_CONCURRENCY = 8
+
+
+async def gather_pages(
+    get_page: Callable[[int], Awaitable[Page[_ItemT_co]]],
+    max_concurrency: int,
+) -> list[_ItemT_co]:
+    """Fetch every page of a paginated listing concurrently.
+
+    The first page is fetched alone to learn ``count`` and ``limit``; the
+    remaining pages are then requested together over the shared async
+    client, at most ``max_concurrency`` at a time.
+
+    Args:
+        get_page: Fetches a page given its page number.
+        max_concurrency: Maximum number of pages in flight.
+
+    Returns:
+        Items of all pages in page order.
+    """
+    first = await get_page(1)
+    items = list(first.data)
+    page_size = first.limit or len(first.data)
+    if not first.data or page_size <= 0 or first.count <= len(first.data):
+        return items
+    total_pages = -(-first.count // page_size)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_one(page: int) -> Page[_ItemT_co]:
+        async with semaphore:
+            return await get_page(page)
+
+    pages = await asyncio.gather(*[get_one(p) for p in range(2, total_pages + 1)])
+    for page in pages:
+        items.extend(page.data)
+    return items
+
+
 class BaseAPI:
     """Base class for all API endpoint groups using Bearer token authentication.
 
@@ -30,8 +242,9 @@ class BaseAPI:
         self,
         path: str,
         *,
-        params: dict[str, Any] | None = None,
+        params: QueryParams | None = None,
         headers: dict[str, str] | None = None,
+        cache: bool = True,
     ) -> dict[str, Any] | list[Any]:
         """Make a GET request with automatic Bearer authentication.
 
@@ -39,18 +252,49 @@ class BaseAPI:
             path: API endpoint path.
             params: Query parameters.
             headers: Additional headers.
+            cache: Whether the client's response cache may be used.
 
         Returns:
             Parsed JSON response (dict or list).
         """
-        return self._http.get(path, params=params, headers=headers)
+        return self._http.get(path, params=params, headers=headers, cache=cache)
+
+    def _get_result(
+        self,
+        path: str,
+        result_type: type[_ResultT],
+        *,
+        params: QueryParams | None = None,
+    ) -> _ResultT:
+        """Make a GET request and validate its ``result`` from the raw body.
+
+        Success responses are parsed and validated in one pydantic-core pass
+        over the bytes; anything else falls back to the regular handling.
+
+        Args:
+            path: API endpoint path.
+            result_type: Model of the response's ``result``.
+            params: Query parameters.
+
+        Returns:
+            The validated ``result`` of the response.
+
+        Raises:
+            TypeError: If the response is not a JSON object.
+        """
+        envelope = _envelope(result_type)
+        response = self._http.get_decoded(
+            path, envelope.model_validate_json, params=params
+        )
+        return _unwrap_result(response, envelope, path)
 
     def _post(
         self,
         path: str,
         *,
-        params: dict[str, Any] | None = None,
+        params: QueryParams | None = None,
         json: Any | None = None,
+        content: bytes | None = None,
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any] | list[Any]:
         """Make a POST request with automatic Bearer authentication.
@@ -59,9 +303,160 @@ class BaseAPI:
             path: API endpoint path.
             params: Query parameters.
             json: JSON body data.
+            content: Pre-encoded JSON body, e.g. from encode_request().
+            headers: Additional headers.
+
+        Returns:
+            Parsed JSON response (dict or list).
+        """
+        return self._http.post(
+            path, params=params, json=json, content=content, headers=headers
+        )
+
+    def _get_object(
+        self,
+        path: str,
+        *,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make a GET request to an endpoint that returns a JSON object.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            TypeError: If the response is not a JSON object.
+        """
+        return expect_object(self._get(path, params=params, headers=headers), path)
+
+    def _post_object(
+        self,
+        path: str,
+        *,
+        params: QueryParams | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make a POST request to an endpoint that returns a JSON object.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body, e.g. from encode_request().
+            headers: Additional headers.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            TypeError: If the response is not a JSON object.
+        """
+        response = self._post(
+            path, params=params, json=json, content=content, headers=headers
+        )
+        return expect_object(response, path)
+
+    async def _get_async(
+        self,
+        path: str,
+        *,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+        cache: bool = True,
+    ) -> dict[str, Any] | list[Any]:
+        """Make an async GET request with automatic Bearer authentication.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers.
+            cache: Whether the client's response cache may be used.
+
+        Returns:
+            Parsed JSON response (dict or list).
+        """
+        return await self._http.get_async(
+            path, params=params, headers=headers, cache=cache
+        )
+
+    async def _get_object_async(
+        self,
+        path: str,
+        *,
+        params: QueryParams | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make an async GET request to an endpoint that returns a JSON object.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            headers: Additional headers.
+
+        Returns:
+            Parsed JSON response.
+
+        Raises:
+            TypeError: If the response is not a JSON object.
+        """
+        response = await self._get_async(path, params=params, headers=headers)
+        return expect_object(response, path)
+
+    async def _get_result_async(
+        self,
+        path: str,
+        result_type: type[_ResultT],
+        *,
+        params: QueryParams | None = None,
+    ) -> _ResultT:
+        """Async version of _get_result().
+
+        Args:
+            path: API endpoint path.
+            result_type: Model of the response's ``result``.
+            params: Query parameters.
+
+        Returns:
+            The validated ``result`` of the response.
+
+        Raises:
+            TypeError: If the response is not a JSON object.
+        """
+        envelope = _envelope(result_type)
+        response = await self._http.get_decoded_async(
+            path, envelope.model_validate_json, params=params
+        )
+        return _unwrap_result(response, envelope, path)
+
+    async def _post_async(
+        self,
+        path: str,
+        *,
+        params: QueryParams | None = None,
+        json: Any | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make an async POST request with automatic Bearer authentication.
+
+        Args:
+            path: API endpoint path.
+            params: Query parameters.
+            json: JSON body data.
+            content: Pre-encoded JSON body, e.g. from encode_request().
             headers: Additional headers.
 
         Returns:
             Parsed JSON response (dict or list).
         """
-        return self._http.post(path, params=params, json=json, headers=headers)
+        return await self._http.post_async(
+            path, params=params, json=json, content=content, headers=headers
+        )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from esb_oms.api._base import expect_object
 from esb_oms.models.auth import LoginResult, RefreshResult
 
 if TYPE_CHECKING:
@@ -54,15 +55,12 @@ class AuthAPI:
             print(f"Company: {result.company_name}")
             ```
         """
+        path = "/auth/login"
         response = self._http.post(
-            "/auth/login",
+            path,
             json={"username": username, "password": password},
-            headers={"Content-Type": "application/json"},
         )
-        if isinstance(response, dict):
-            return LoginResult.model_validate(response["result"])
-        msg = "Unexpected response format from login API"
-        raise TypeError(msg)
+        return LoginResult.model_validate(expect_object(response, path)["result"])
 
     def refresh(self, refresh_token: str) -> RefreshResult:
         """Refresh an expired access token.
@@ -87,11 +85,9 @@ class AuthAPI:
             new_refresh_token = result.refresh_token
             ```
         """
+        path = "/auth/refresh"
         response = self._http.get_with_token(
-            "/auth/refresh",
+            path,
             auth_token=refresh_token,
         )
-        if isinstance(response, dict):
-            return RefreshResult.model_validate(response["result"])
-        msg = "Unexpected response format from refresh API"
-        raise TypeError(msg)
+        return RefreshResult.model_validate(expect_object(response, path)["result"])
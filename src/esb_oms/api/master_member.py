@@ -5,12 +5,16 @@ This module provides APIs for retrieving member information.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from esb_oms.api._base import BaseAPI
 from esb_oms.models.member import MemberResult
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from esb_oms._http import BearerHTTPClient
 
 
@@ -84,8 +88,103 @@ class MasterMemberAPI(BaseAPI):
             "/extv1/member",
             params={"searchMember": search_member},
         )
-        if isinstance(response, dict):
-            result = response.get("result")
-            if result:
-                return MemberResult.model_validate(result)
-        return None
+        return _parse_member(response)
+
+    async def get_async(self, search_member: str) -> MemberResult | None:
+        """Get member information without blocking the event loop.
+
+        Same as get(). Use it to look up many members concurrently.
+
+        Args:
+            search_member: Member code, phone number, or email to search for.
+
+        Returns:
+            Member information if found, None if not found.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async with ESBClient(static_token="your_api_key") as client:
+                members = await asyncio.gather(
+                    *(client.member.get_async(code) for code in member_codes)
+                )
+            ```
+        """
+        response = await self._get_async(
+            "/extv1/member",
+            params={"searchMember": search_member},
+        )
+        return _parse_member(response)
+
+    def get_many(
+        self, search_members: Iterable[str], *, max_concurrency: int = 10
+    ) -> list[MemberResult | None]:
+        """Get information for many members concurrently.
+
+        Lookups run on a small thread pool sharing the client's connection
+        pool, so N lookups take roughly N / max_concurrency round trips
+        instead of N.
+
+        Args:
+            search_members: Member codes, phone numbers, or emails.
+            max_concurrency: Maximum lookups in flight at once.
+
+        Returns:
+            One result per search key, in input order (None if not found).
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            members = client.member.get_many(["WGG00000009", "081234567890"])
+            for member in members:
+                if member:
+                    print(member.member_name)
+            ```
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(self.get, search_members))
+
+    async def get_many_async(
+        self, search_members: Iterable[str], *, max_concurrency: int = 10
+    ) -> list[MemberResult | None]:
+        """Get information for many members concurrently on the event loop.
+
+        Same as get_many(), using get_async() and asyncio.gather.
+
+        Args:
+            search_members: Member codes, phone numbers, or emails.
+            max_concurrency: Maximum lookups in flight at once.
+
+        Returns:
+            One result per search key, in input order (None if not found).
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_one(search_member: str) -> MemberResult | None:
+            async with semaphore:
+                return await self.get_async(search_member)
+
+        return await asyncio.gather(*[get_one(key) for key in search_members])
+
+
+def _parse_member(response: dict[str, Any] | list[Any]) -> MemberResult | None:
+    """Parse a member lookup response.
+
+    Args:
+        response: Raw JSON response from the member endpoint.
+
+    Returns:
+        Member information if found, None if not found.
+    """
+    if isinstance(response, dict):
+        result = response.get("result")
+        if result:
+            return MemberResult.model_validate(result)
+    return None
@@ -5,9 +5,18 @@ This module provides APIs for managing menu categories, menus, and menu template
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from esb_oms.api._base import BaseAPI
+from pydantic import TypeAdapter
+
+from esb_oms.api._base import (
+    DEFAULT_PAGE_CONCURRENCY,
+    BaseAPI,
+    RawPage,
+    encode_request,
+    gather_pages,
+)
+from esb_oms.models.common import DEFER_BUILD
 from esb_oms.models.menu import (
     CreateMenuCategoryRequest,
     CreateMenuRequest,
@@ -24,7 +33,74 @@ from esb_oms.models.menu import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
     from esb_oms._http import BearerHTTPClient
+    from esb_oms.api._base import Page, QueryParams
+
+_MENU_RESULTS: TypeAdapter[list[MenuResult]] = TypeAdapter(
+    list[MenuResult], config=DEFER_BUILD
+)
+_MENU_TEMPLATE_RESULTS: TypeAdapter[list[MenuTemplateResult]] = TypeAdapter(
+    list[MenuTemplateResult], config=DEFER_BUILD
+)
+
+_ItemT = TypeVar("_ItemT")
+
+
+def _page_params(page: int, cursor: str | None, page_size: int | None) -> QueryParams:
+    """Build the pagination query parameters for a get() call."""
+    params: QueryParams = {}
+    if cursor is not None:
+        params["cursor"] = cursor
+    else:
+        params["page"] = page
+    if page_size is not None:
+        params["pageSize"] = page_size
+    return params
+
+
+def _iter_pages(
+    get_page: Callable[[int, str | None], Page[_ItemT]],
+) -> Iterator[_ItemT]:
+    """Yield every item of a paginated listing, one page at a time.
+
+    Follows ``nextCursor`` when the server returns one, so deep pages cost
+    the same as the first. Otherwise falls back to page numbers until a
+    short or empty page, or ``count`` items have been seen. A cursor that
+    comes back a second time, or a page identical to the previous one
+    (a server ignoring the page number), also ends the listing instead of
+    looping forever.
+
+    Args:
+        get_page: Fetches a page given (page number, cursor or None).
+
+    Yields:
+        Items of each page in order.
+    """
+    page = 1
+    cursor: str | None = None
+    cursors_seen: set[str] = set()
+    previous: Sequence[_ItemT] | None = None
+    seen = 0
+    while True:
+        response = get_page(page, cursor)
+        if not response.data or response.data == previous:
+            return
+        yield from response.data
+        seen += len(response.data)
+        previous = response.data
+        if response.next_cursor:
+            if response.next_cursor in cursors_seen:
+                return
+            cursors_seen.add(response.next_cursor)
+            cursor = response.next_cursor
+            continue
+        if cursor is not None or len(response.data) < response.limit:
+            return
+        if response.count and seen >= response.count:
+            return
+        page += 1
 
 
 class MasterMenuCategoryAPI(BaseAPI):
@@ -61,18 +137,12 @@ class MasterMenuCategoryAPI(BaseAPI):
         ```
     """
 
-    def __init__(self, http_client: BearerHTTPClient) -> None:
-        """Initialize the Master Menu Category API.
-
-        Args:
-            http_client: Bearer HTTP client configured for the API URL.
-        """
-        super().__init__(http_client)
-
     def get(
         self,
         *,
         page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
         menu_category_id: int | None = None,
     ) -> GetMenuCategoryResponse:
         """Get menu categories.
@@ -81,6 +151,9 @@ class MasterMenuCategoryAPI(BaseAPI):
 
         Args:
             page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``. When
+                given it is sent instead of ``page`` (keyset pagination).
+            page_size: Optional number of items per page.
             menu_category_id: Optional filter by specific category ID.
 
         Returns:
@@ -101,15 +174,158 @@ class MasterMenuCategoryAPI(BaseAPI):
             response = client.menu_category.get(menu_category_id=123)
             ```
         """
-        params: dict[str, Any] = {"page": page}
+        return self._get_result(
+            "/corev1/master/get-menu-category",
+            GetMenuCategoryResponse,
+            params=self._params(page, cursor, page_size, menu_category_id),
+        )
+
+    async def get_async(
+        self,
+        *,
+        page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        menu_category_id: int | None = None,
+    ) -> GetMenuCategoryResponse:
+        """Get menu categories without blocking the event loop.
+
+        Same as get().
+
+        Args:
+            page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``.
+            page_size: Optional number of items per page.
+            menu_category_id: Optional filter by specific category ID.
+
+        Returns:
+            Paginated list of menu categories.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return await self._get_result_async(
+            "/corev1/master/get-menu-category",
+            GetMenuCategoryResponse,
+            params=self._params(page, cursor, page_size, menu_category_id),
+        )
+
+    def _params(
+        self,
+        page: int,
+        cursor: str | None,
+        page_size: int | None,
+        menu_category_id: int | None,
+    ) -> QueryParams:
+        """Build the query parameters of a get() call."""
+        params = _page_params(page, cursor, page_size)
         if menu_category_id is not None:
             params["menuCategoryID"] = menu_category_id
+        return params
+
+    def _get_page(
+        self,
+        page: int,
+        cursor: str | None,
+        page_size: int | None,
+        menu_category_id: int | None,
+    ) -> dict[str, Any]:
+        """Fetch the raw ``result`` object of one get() page."""
+        response = self._get_object(
+            "/corev1/master/get-menu-category",
+            params=self._params(page, cursor, page_size, menu_category_id),
+        )
+        result: dict[str, Any] = response.get("result", {})
+        return result
+
+    def count(self, *, menu_category_id: int | None = None) -> int:
+        """Get the total number of menu categories matching the filter.
+
+        Fetches a single-item page and reads its ``count`` without
+        validating any category.
+
+        Args:
+            menu_category_id: Optional filter by specific category ID.
+
+        Returns:
+            Total number of matching categories reported by the server.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return RawPage(self._get_page(1, None, 1, menu_category_id)).count
+
+    def iter(
+        self,
+        *,
+        page_size: int | None = None,
+        menu_category_id: int | None = None,
+    ) -> Iterator[MenuCategoryResult]:
+        """Iterate lazily over menu categories, page by page.
+
+        Unlike get(), pages are not validated up front: each category is
+        validated as it is consumed, and the next page is only fetched once
+        the current one is exhausted. Stopping early skips the rest.
+
+        Args:
+            page_size: Optional number of items per page.
+            menu_category_id: Optional filter by specific category ID.
+
+        Returns:
+            Iterator over menu categories in server order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            category = next(
+                c for c in client.menu_category.iter()
+                if c.menu_category_code == "FOOD"
+            )
+            ```
+        """
+        pages = _iter_pages(
+            lambda page, cursor: RawPage(
+                self._get_page(page, cursor, page_size, menu_category_id)
+            )
+        )
+        return map(MenuCategoryResult.model_validate, pages)
+
+    async def get_all_pages(
+        self,
+        *,
+        page_size: int | None = None,
+        menu_category_id: int | None = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[MenuCategoryResult]:
+        """Get all menu categories, fetching the pages concurrently.
 
-        response = self._get("/corev1/master/get-menu-category", params=params)
-        if isinstance(response, dict):
-            return GetMenuCategoryResponse.model_validate(response.get("result", {}))
-        msg = "Unexpected response format from get menu category API"
-        raise TypeError(msg)
+        Fetches the first page to learn the total count, then requests the
+        remaining pages at once over the shared async client.
+
+        Args:
+            page_size: Optional number of items per page.
+            menu_category_id: Optional filter by specific category ID.
+            max_concurrency: Maximum number of pages in flight (default: 8).
+
+        Returns:
+            All menu categories in page order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            everything = await client.menu_category.get_all_pages()
+            ```
+        """
+        return await gather_pages(
+            lambda page: self.get_async(
+                page=page, page_size=page_size, menu_category_id=menu_category_id
+            ),
+            max_concurrency,
+        )
 
     def create(self, request: CreateMenuCategoryRequest) -> MenuCategoryResult:
         """Create a new menu category.
@@ -149,14 +365,11 @@ class MasterMenuCategoryAPI(BaseAPI):
             print(f"Created: {result.menu_category_name}")
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/create-menu-category",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return MenuCategoryResult.model_validate(response.get("result", {}))
-        msg = "Unexpected response format from create menu category API"
-        raise TypeError(msg)
+        return MenuCategoryResult.model_validate(response.get("result", {}))
 
     def update(self, request: UpdateMenuCategoryRequest) -> MenuCategoryResult:
         """Update an existing menu category.
@@ -195,14 +408,11 @@ class MasterMenuCategoryAPI(BaseAPI):
             result = client.menu_category.update(request)
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/update-menu-category",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return MenuCategoryResult.model_validate(response.get("result", {}))
-        msg = "Unexpected response format from update menu category API"
-        raise TypeError(msg)
+        return MenuCategoryResult.model_validate(response.get("result", {}))
 
 
 class MasterMenuAPI(BaseAPI):
@@ -244,6 +454,8 @@ class MasterMenuAPI(BaseAPI):
         self,
         *,
         page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
         menu_code: str | None = None,
         flag_active: int = 1,
     ) -> GetMenuResponse:
@@ -253,6 +465,9 @@ class MasterMenuAPI(BaseAPI):
 
         Args:
             page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``. When
+                given it is sent instead of ``page`` (keyset pagination).
+            page_size: Optional number of items per page.
             menu_code: Optional filter by menu code.
             flag_active: Filter by active status (1=Active, 0=Inactive, default: 1).
 
@@ -274,15 +489,171 @@ class MasterMenuAPI(BaseAPI):
                 print(f"  - {menu.menu_name}")
             ```
         """
-        params: dict[str, Any] = {"page": page, "flagActive": flag_active}
+        return self._get_result(
+            "/corev1/master/get-menu",
+            GetMenuResponse,
+            params=self._params(page, cursor, page_size, menu_code, flag_active),
+        )
+
+    async def get_async(
+        self,
+        *,
+        page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        menu_code: str | None = None,
+        flag_active: int = 1,
+    ) -> GetMenuResponse:
+        """Get menus without blocking the event loop.
+
+        Same as get().
+
+        Args:
+            page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``.
+            page_size: Optional number of items per page.
+            menu_code: Optional filter by menu code.
+            flag_active: Filter by active status (1=Active, 0=Inactive, default: 1).
+
+        Returns:
+            Paginated list of menus.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return await self._get_result_async(
+            "/corev1/master/get-menu",
+            GetMenuResponse,
+            params=self._params(page, cursor, page_size, menu_code, flag_active),
+        )
+
+    def _params(
+        self,
+        page: int,
+        cursor: str | None,
+        page_size: int | None,
+        menu_code: str | None,
+        flag_active: int,
+    ) -> QueryParams:
+        """Build the query parameters of a get() call."""
+        params = _page_params(page, cursor, page_size)
+        params["flagActive"] = flag_active
         if menu_code is not None:
             params["menuCode"] = menu_code
+        return params
+
+    def _get_page(
+        self,
+        page: int,
+        cursor: str | None,
+        page_size: int | None,
+        menu_code: str | None,
+        flag_active: int,
+    ) -> dict[str, Any]:
+        """Fetch the raw ``result`` object of one get() page."""
+        response = self._get_object(
+            "/corev1/master/get-menu",
+            params=self._params(page, cursor, page_size, menu_code, flag_active),
+        )
+        result: dict[str, Any] = response.get("result", {})
+        return result
+
+    def count(self, *, menu_code: str | None = None, flag_active: int = 1) -> int:
+        """Get the total number of menus matching the filters.
+
+        Fetches a single-item page and reads its ``count`` without
+        validating any menu.
+
+        Args:
+            menu_code: Optional filter by menu code.
+            flag_active: Filter by active status (1=Active, 0=Inactive, default: 1).
+
+        Returns:
+            Total number of matching menus reported by the server.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return RawPage(self._get_page(1, None, 1, menu_code, flag_active)).count
+
+    def iter(
+        self,
+        *,
+        page_size: int | None = None,
+        menu_code: str | None = None,
+        flag_active: int = 1,
+    ) -> Iterator[MenuResult]:
+        """Iterate lazily over menus, page by page.
 
-        response = self._get("/corev1/master/get-menu", params=params)
-        if isinstance(response, dict):
-            return GetMenuResponse.model_validate(response.get("result", {}))
-        msg = "Unexpected response format from get menu API"
-        raise TypeError(msg)
+        Unlike get(), pages are not validated up front: each menu is
+        validated as it is consumed, and the next page is only fetched once
+        the current one is exhausted. Stopping early skips the rest.
+
+        Args:
+            page_size: Optional number of items per page.
+            menu_code: Optional filter by menu code.
+            flag_active: Filter by active status (1=Active, 0=Inactive, default: 1).
+
+        Returns:
+            Iterator over menus in server order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            menu = next(
+                (m for m in client.menu.iter() if m.menu_name == "Nasi Goreng"),
+                None,
+            )
+            ```
+        """
+        pages = _iter_pages(
+            lambda page, cursor: RawPage(
+                self._get_page(page, cursor, page_size, menu_code, flag_active)
+            )
+        )
+        return map(MenuResult.model_validate, pages)
+
+    async def get_all_pages(
+        self,
+        *,
+        page_size: int | None = None,
+        menu_code: str | None = None,
+        flag_active: int = 1,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[MenuResult]:
+        """Get all menus, fetching the pages concurrently.
+
+        Fetches the first page to learn the total count, then requests the
+        remaining pages at once over the shared async client.
+
+        Args:
+            page_size: Optional number of items per page.
+            menu_code: Optional filter by menu code.
+            flag_active: Filter by active status (1=Active, 0=Inactive, default: 1).
+            max_concurrency: Maximum number of pages in flight (default: 8).
+
+        Returns:
+            All menus in page order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            everything = await client.menu.get_all_pages()
+            ```
+        """
+        return await gather_pages(
+            lambda page: self.get_async(
+                page=page,
+                page_size=page_size,
+                menu_code=menu_code,
+                flag_active=flag_active,
+            ),
+            max_concurrency,
+        )
 
     def create(self, request: CreateMenuRequest) -> list[MenuResult]:
         """Create a new menu.
@@ -325,17 +696,14 @@ class MasterMenuAPI(BaseAPI):
             print(f"Created: {results[0].menu_name}")
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/create-menu",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                return [MenuResult.model_validate(item) for item in result]
-            return [MenuResult.model_validate(result)]
-        msg = "Unexpected response format from create menu API"
-        raise TypeError(msg)
+        result = response.get("result", [])
+        if type(result) is list:
+            return _MENU_RESULTS.validate_python(result)
+        return [MenuResult.model_validate(result)]
 
     def update(self, request: UpdateMenuRequest) -> list[MenuResult]:
         """Update an existing menu.
@@ -366,17 +734,14 @@ class MasterMenuAPI(BaseAPI):
             results = client.menu.update(request)
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/update-menu",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                return [MenuResult.model_validate(item) for item in result]
-            return [MenuResult.model_validate(result)]
-        msg = "Unexpected response format from update menu API"
-        raise TypeError(msg)
+        result = response.get("result", [])
+        if type(result) is list:
+            return _MENU_RESULTS.validate_python(result)
+        return [MenuResult.model_validate(result)]
 
 
 class MasterMenuTemplateAPI(BaseAPI):
@@ -429,6 +794,8 @@ class MasterMenuTemplateAPI(BaseAPI):
         self,
         *,
         page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
     ) -> GetMenuTemplateResponse:
         """Get menu templates.
 
@@ -436,6 +803,9 @@ class MasterMenuTemplateAPI(BaseAPI):
 
         Args:
             page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``. When
+                given it is sent instead of ``page`` (keyset pagination).
+            page_size: Optional number of items per page.
 
         Returns:
             Response containing paginated menu template data.
@@ -454,13 +824,123 @@ class MasterMenuTemplateAPI(BaseAPI):
                     print(f"      Menu: {detail.menu_name}, Price: {detail.price}")
             ```
         """
-        params: dict[str, Any] = {"page": page}
+        return self._get_result(
+            "/corev1/master/get-menu-template",
+            GetMenuTemplateResponse,
+            params=_page_params(page, cursor, page_size),
+        )
+
+    async def get_async(
+        self,
+        *,
+        page: int = 1,
+        cursor: str | None = None,
+        page_size: int | None = None,
+    ) -> GetMenuTemplateResponse:
+        """Get menu templates without blocking the event loop.
+
+        Same as get().
+
+        Args:
+            page: Page number for pagination (default: 1).
+            cursor: Cursor from a previous response's ``next_cursor``.
+            page_size: Optional number of items per page.
+
+        Returns:
+            Paginated list of menu templates.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return await self._get_result_async(
+            "/corev1/master/get-menu-template",
+            GetMenuTemplateResponse,
+            params=_page_params(page, cursor, page_size),
+        )
+
+    def _get_page(
+        self, page: int, cursor: str | None, page_size: int | None
+    ) -> dict[str, Any]:
+        """Fetch the raw ``result`` object of one get() page."""
+        response = self._get_object(
+            "/corev1/master/get-menu-template",
+            params=_page_params(page, cursor, page_size),
+        )
+        result: dict[str, Any] = response.get("result", {})
+        return result
+
+    def count(self) -> int:
+        """Get the total number of menu templates.
+
+        Fetches a single-item page and reads its ``count`` without
+        validating any template.
+
+        Returns:
+            Total number of menu templates reported by the server.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+        """
+        return RawPage(self._get_page(1, None, 1)).count
+
+    def iter(self, *, page_size: int | None = None) -> Iterator[MenuTemplateResult]:
+        """Iterate lazily over menu templates, page by page.
+
+        Unlike get(), pages are not validated up front: each template is
+        validated as it is consumed, and the next page is only fetched once
+        the current one is exhausted. Stopping early skips the rest.
 
-        response = self._get("/corev1/master/get-menu-template", params=params)
-        if isinstance(response, dict):
-            return GetMenuTemplateResponse.model_validate(response.get("result", {}))
-        msg = "Unexpected response format from get menu template API"
-        raise TypeError(msg)
+        Args:
+            page_size: Optional number of items per page.
+
+        Returns:
+            Iterator over menu templates in server order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            for template in client.menu_template.iter():
+                if template.menu_template_name == "Dine In":
+                    break
+            ```
+        """
+        pages = _iter_pages(
+            lambda page, cursor: RawPage(self._get_page(page, cursor, page_size))
+        )
+        return map(MenuTemplateResult.model_validate, pages)
+
+    async def get_all_pages(
+        self,
+        *,
+        page_size: int | None = None,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> list[MenuTemplateResult]:
+        """Get all menu templates, fetching the pages concurrently.
+
+        Fetches the first page to learn the total count, then requests the
+        remaining pages at once over the shared async client.
+
+        Args:
+            page_size: Optional number of items per page.
+            max_concurrency: Maximum number of pages in flight (default: 8).
+
+        Returns:
+            All menu templates in page order.
+
+        Raises:
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            everything = await client.menu_template.get_all_pages()
+            ```
+        """
+        return await gather_pages(
+            lambda page: self.get_async(page=page, page_size=page_size),
+            max_concurrency,
+        )
 
     def create(self, request: CreateMenuTemplateRequest) -> list[MenuTemplateResult]:
         """Create a new menu template.
@@ -509,17 +989,14 @@ class MasterMenuTemplateAPI(BaseAPI):
             print(f"Created: {results[0].menu_template_name}")
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/create-menu-template",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                return [MenuTemplateResult.model_validate(item) for item in result]
-            return [MenuTemplateResult.model_validate(result)]
-        msg = "Unexpected response format from create menu template API"
-        raise TypeError(msg)
+        result = response.get("result", [])
+        if type(result) is list:
+            return _MENU_TEMPLATE_RESULTS.validate_python(result)
+        return [MenuTemplateResult.model_validate(result)]
 
     def update(self, request: UpdateMenuTemplateRequest) -> list[MenuTemplateResult]:
         """Update an existing menu template.
@@ -560,14 +1037,11 @@ class MasterMenuTemplateAPI(BaseAPI):
             results = client.menu_template.update(request)
             ```
         """
-        response = self._post(
+        response = self._post_object(
             "/corev1/master/update-menu-template",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                return [MenuTemplateResult.model_validate(item) for item in result]
-            return [MenuTemplateResult.model_validate(result)]
-        msg = "Unexpected response format from update menu template API"
-        raise TypeError(msg)
+        result = response.get("result", [])
+        if type(result) is list:
+            return _MENU_TEMPLATE_RESULTS.validate_python(result)
+        return [MenuTemplateResult.model_validate(result)]
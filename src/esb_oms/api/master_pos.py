@@ -10,13 +10,10 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import TypeAdapter
 
+from esb_oms.api._base import filter_body
+from esb_oms.models.common import DEFER_BUILD
 from esb_oms.models.master import (
     Branch,
-    GetBranchRequest,
-    GetMenuRequest,
-    GetPaymentMethodRequest,
-    GetStockBranchRequest,
-    GetVisitPurposeRequest,
     MenuCategory,
     PaymentMethodType,
     StockBranchItem,
@@ -26,6 +23,23 @@ from esb_oms.models.master import (
 if TYPE_CHECKING:
     from esb_oms._http import BasicAuthHTTPClient
 
+# Responses are validated even though the data is trusted: pydantic-core
+# validates these nested lists faster than model_construct() can build them
+# in Python (~0.5 ms vs ~2 ms for a 3x3x3 menu tree).
+_MENU_CATEGORIES: TypeAdapter[list[MenuCategory]] = TypeAdapter(
+    list[MenuCategory], config=DEFER_BUILD
+)
+_STOCK_BRANCH_ITEMS: TypeAdapter[list[StockBranchItem]] = TypeAdapter(
+    list[StockBranchItem], config=DEFER_BUILD
+)
+_VISIT_PURPOSES: TypeAdapter[list[VisitPurpose]] = TypeAdapter(
+    list[VisitPurpose], config=DEFER_BUILD
+)
+_BRANCHES: TypeAdapter[list[Branch]] = TypeAdapter(list[Branch], config=DEFER_BUILD)
+_PAYMENT_METHOD_TYPES: TypeAdapter[dict[str, PaymentMethodType]] = TypeAdapter(
+    dict[str, PaymentMethodType], config=DEFER_BUILD
+)
+
 
 class MasterPOSAPI:
     """Master POS API endpoints.
@@ -66,9 +80,12 @@ class MasterPOSAPI:
         """
         self._http = http_client
 
-    def _post(self, path: str, json: dict[str, Any]) -> Any:
+    def _post(self, path: str, json: dict[str, str]) -> Any:
         """Make a POST request with automatic Basic Auth.
 
+        The request bodies here are a few string filters, so they are
+        built with filter_body() rather than request models.
+
         Args:
             path: API endpoint path.
             json: JSON body data.
@@ -76,11 +93,7 @@ class MasterPOSAPI:
         Returns:
             Raw response data (usually a list or dict).
         """
-        return self._http.post(
-            path,
-            json=json,
-            headers={"Content-Type": "application/json"},
-        )
+        return self._http.post(path, json=json)
 
     def get_menu(
         self,
@@ -116,16 +129,17 @@ class MasterPOSAPI:
                         print(f"  - {menu.menu_name}: {menu.price}")
             ```
         """
-        request = GetMenuRequest(
-            filter_branch_code=branch_code,
-            filter_visit_purpose_id=visit_purpose_id,
-        )
         response = self._post(
             "/external/general/get-menu",
-            json=request.model_dump(by_alias=True),
+            json=filter_body(
+                {
+                    "filterBranchCode": branch_code,
+                    "filterVisitPurposeID": visit_purpose_id,
+                },
+                required=("filterBranchCode", "filterVisitPurposeID"),
+            ),
         )
-        adapter = TypeAdapter(list[MenuCategory])
-        return adapter.validate_python(response)
+        return _MENU_CATEGORIES.validate_python(response)
 
     def get_stock_branch(self, branch_code: str) -> list[StockBranchItem]:
         """Get stock data for a branch.
@@ -149,13 +163,13 @@ class MasterPOSAPI:
                 print(f"{stock.product_name}: {stock.stock} {stock.uom_name}")
             ```
         """
-        request = GetStockBranchRequest(filter_branch_code=branch_code)
         response = self._post(
             "/external/general/stock-branch",
-            json=request.model_dump(by_alias=True),
+            json=filter_body(
+                {"filterBranchCode": branch_code}, required=("filterBranchCode",)
+            ),
         )
-        adapter = TypeAdapter(list[StockBranchItem])
-        return adapter.validate_python(response)
+        return _STOCK_BRANCH_ITEMS.validate_python(response)
 
     def get_visit_purpose(
         self,
@@ -185,13 +199,9 @@ class MasterPOSAPI:
             purposes = client.master.get_visit_purpose(visit_purpose_id="1")
             ```
         """
-        request = GetVisitPurposeRequest(visit_purpose_id=visit_purpose_id)
-        response = self._post(
-            "/external/general/get-visit-purpose",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-        )
-        adapter = TypeAdapter(list[VisitPurpose])
-        return adapter.validate_python(response)
+        body = filter_body({"visitPurposeID": visit_purpose_id})
+        response = self._post("/external/general/get-visit-purpose", json=body)
+        return _VISIT_PURPOSES.validate_python(response)
 
     def get_payment_method(
         self,
@@ -220,18 +230,18 @@ class MasterPOSAPI:
                     print(f"  - {method.payment_method_name}")
             ```
         """
-        request = GetPaymentMethodRequest(filter_branch_code=branch_code)
         response = self._post(
             "/external/general/get-payment-method",
-            json=request.model_dump(by_alias=True),
+            json=filter_body(
+                {"filterBranchCode": branch_code}, required=("filterBranchCode",)
+            ),
         )
         # Response is a dict with string keys (e.g., "1", "2")
-        result: dict[str, PaymentMethodType] = {}
-        if isinstance(response, dict):
-            for key, value in response.items():
-                if isinstance(value, dict):
-                    result[key] = PaymentMethodType.model_validate(value)
-        return result
+        if not isinstance(response, dict):
+            return {}
+        return _PAYMENT_METHOD_TYPES.validate_python(
+            {key: value for key, value in response.items() if type(value) is dict}
+        )
 
     def get_branch(
         self,
@@ -270,15 +280,13 @@ class MasterPOSAPI:
             branches = client.master.get_branch(branch_name="Main")
             ```
         """
-        request = GetBranchRequest(
-            filter_branch_name=branch_name,
-            filter_branch_address=branch_address,
-            filter_branch_phone=branch_phone,
-            filter_brand_id=brand_id,
-        )
-        response = self._post(
-            "/external/general/get-branch",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+        body = filter_body(
+            {
+                "filterBranchName": branch_name,
+                "filterBranchAddress": branch_address,
+                "filterBranchPhone": branch_phone,
+                "filterBrandID": brand_id,
+            }
         )
-        adapter = TypeAdapter(list[Branch])
-        return adapter.validate_python(response)
+        response = self._post("/external/general/get-branch", json=body)
+        return _BRANCHES.validate_python(response)
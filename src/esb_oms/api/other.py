@@ -5,11 +5,12 @@ This module provides miscellaneous utility APIs.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from pydantic import TypeAdapter
 
-from esb_oms.api._base import BaseAPI
+from esb_oms.api._base import BaseAPI, encode_request, expect_list
+from esb_oms.models.common import DEFER_BUILD
 from esb_oms.models.other import (
     BranchSalesSummaryItem,
     BranchSalesSummaryRequest,
@@ -20,6 +21,17 @@ from esb_oms.models.other import (
 
 if TYPE_CHECKING:
     from esb_oms._http import BasicAuthHTTPClient, BearerHTTPClient
+    from esb_oms.api._base import QueryParams
+
+_BRANCH_SALES_SUMMARY_ITEMS: TypeAdapter[list[BranchSalesSummaryItem]] = TypeAdapter(
+    list[BranchSalesSummaryItem], config=DEFER_BUILD
+)
+_DAILY_SALES_MATERIAL_USAGE_ITEMS: TypeAdapter[list[DailySalesMaterialUsageItem]] = (
+    TypeAdapter(list[DailySalesMaterialUsageItem], config=DEFER_BUILD)
+)
+_SALES_DETAIL_ITEMS: TypeAdapter[list[SalesDetailItem]] = TypeAdapter(
+    list[SalesDetailItem], config=DEFER_BUILD
+)
 
 
 class OtherAPI(BaseAPI):
@@ -93,6 +105,7 @@ class OtherAPI(BaseAPI):
         Raises:
             ESBValidationError: If date parameters are missing or sales_type is invalid.
             ESBAuthenticationError: If authentication fails.
+            ESBError: If the response is not a list of summaries.
 
         Example:
             ```python
@@ -118,15 +131,9 @@ class OtherAPI(BaseAPI):
             filter_sales_date_to=sales_date_to,
             sales_type=sales_type,
         )
-        response = self._master_pos_http.post(
-            "/external/general/sales-branch-summary",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-            headers={"Content-Type": "application/json"},
-        )
-        if isinstance(response, list):
-            adapter = TypeAdapter(list[BranchSalesSummaryItem])
-            return adapter.validate_python(response)
-        return []
+        path = "/external/general/sales-branch-summary"
+        response = self._master_pos_http.post(path, content=encode_request(request))
+        return _BRANCH_SALES_SUMMARY_ITEMS.validate_python(expect_list(response, path))
 
     def get_daily_material_usage(
         self,
@@ -171,7 +178,7 @@ class OtherAPI(BaseAPI):
                 print(f"  Conversion: {item.total_conversion_qty}")
             ```
         """
-        params: dict[str, Any] = {
+        params: QueryParams = {
             "salesDate": sales_date,
             "flagUnit": flag_unit,
         }
@@ -184,12 +191,10 @@ class OtherAPI(BaseAPI):
         )
         # Response can be a list directly or wrapped in result
         if isinstance(response, list):
-            adapter = TypeAdapter(list[DailySalesMaterialUsageItem])
-            return adapter.validate_python(response)
+            return _DAILY_SALES_MATERIAL_USAGE_ITEMS.validate_python(response)
         result = response.get("result", [])
         if isinstance(result, list):
-            adapter = TypeAdapter(list[DailySalesMaterialUsageItem])
-            return adapter.validate_python(result)
+            return _DAILY_SALES_MATERIAL_USAGE_ITEMS.validate_python(result)
         return []
 
     def get_sales(
@@ -216,6 +221,7 @@ class OtherAPI(BaseAPI):
             ESBValidationError: If neither bill_num nor sales_num is provided,
                 or if the values don't match any transaction.
             ESBAuthenticationError: If authentication fails.
+            ESBError: If the response is not a list of sales.
 
         Example:
             ```python
@@ -251,12 +257,6 @@ class OtherAPI(BaseAPI):
             bill_num=bill_num,
             sales_num=sales_num,
         )
-        response = self._master_pos_http.post(
-            "/external/general/get-sales",
-            json=request.model_dump(by_alias=True, exclude_none=True),
-            headers={"Content-Type": "application/json"},
-        )
-        if isinstance(response, list):
-            adapter = TypeAdapter(list[SalesDetailItem])
-            return adapter.validate_python(response)
-        return []
+        path = "/external/general/get-sales"
+        response = self._master_pos_http.post(path, content=encode_request(request))
+        return _SALES_DETAIL_ITEMS.validate_python(expect_list(response, path))
@@ -5,25 +5,200 @@ This module provides APIs for retrieving sales reports and summaries.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pydantic import TypeAdapter
 
-from esb_oms.api._base import BaseAPI
+from esb_oms._prefetch import prefetch_pages
+from esb_oms.api._base import BaseAPI, expect_object, filter_body
+from esb_oms.models.common import DEFER_BUILD, SuccessResponse
 from esb_oms.models.report import (
     SalesHeadItem,
-    SalesHeadRequest,
     SalesInformationItem,
     SalesMenuCompletionItem,
-    SalesMenuCompletionRequest,
     SalesMenuReportItem,
-    SalesMenuRequest,
     SalesMenuSummaryResult,
     SalesPaymentSummaryItem,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
     from esb_oms._http import BasicAuthHTTPClient, BearerHTTPClient
+    from esb_oms.api._base import QueryParams
+
+_SALES_INFORMATION_ITEMS: TypeAdapter[list[SalesInformationItem]] = TypeAdapter(
+    list[SalesInformationItem], config=DEFER_BUILD
+)
+_SALES_HEAD_ITEMS: TypeAdapter[list[SalesHeadItem]] = TypeAdapter(
+    list[SalesHeadItem], config=DEFER_BUILD
+)
+_SALES_MENU_COMPLETION_ITEMS: TypeAdapter[list[SalesMenuCompletionItem]] = TypeAdapter(
+    list[SalesMenuCompletionItem], config=DEFER_BUILD
+)
+_SALES_MENU_REPORT_ITEMS: TypeAdapter[list[SalesMenuReportItem]] = TypeAdapter(
+    list[SalesMenuReportItem], config=DEFER_BUILD
+)
+_SALES_PAYMENT_SUMMARY_ITEMS: TypeAdapter[list[SalesPaymentSummaryItem]] = TypeAdapter(
+    list[SalesPaymentSummaryItem], config=DEFER_BUILD
+)
+
+_SALES_INFORMATION_PATH = "/corev1/sales/sales-information"
+_SALES_PAYMENT_SUMMARY_PATH = "/report/sales-payment-summary"
+
+# Successful Sales Information response, validated straight from the body
+_SALES_INFORMATION_RESPONSE = SuccessResponse[list[SalesInformationItem]]
+
+_ItemT = TypeVar("_ItemT")
+
+# The sales payment summary endpoint expects a JSON Content-Type even on
+# GET; shared, never mutated
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Reports for dates at least this many days old are treated as final and
+# may be served from the client's response cache; newer ones are always
+# fetched, since sales for them can still come in (the margin covers the
+# server's timezone)
+SETTLED_AFTER_DAYS = 2
+
+
+def _is_settled(last_date: str) -> bool:
+    """Check whether a report's last sales date (YYYY-MM-DD) is final."""
+    try:
+        day = date.fromisoformat(last_date)
+    except ValueError:
+        return False
+    today = datetime.now(tz=UTC).date()
+    return day <= today - timedelta(days=SETTLED_AFTER_DAYS)
+
+
+def _sales_information_params(
+    *,
+    sales_date_from: str,
+    sales_date_to: str,
+    branch_code: str | None,
+    sales_num: str | None,
+    bill_num: str | None,
+    self_order_id: str | None,
+    status_name: str | None,
+    sort_by: str | None,
+    sort_order: str | None,
+    ext_branch_code: str | None,
+    page: int,
+) -> QueryParams:
+    """Build query parameters for the Sales Information API."""
+    params: QueryParams = {
+        "salesDateFrom": sales_date_from,
+        "salesDateTo": sales_date_to,
+        "page": page,
+    }
+    if branch_code is not None:
+        params["branchCode"] = branch_code
+    if sales_num is not None:
+        params["salesNum"] = sales_num
+    if bill_num is not None:
+        params["billNum"] = bill_num
+    if self_order_id is not None:
+        params["selfOrderID"] = self_order_id
+    if status_name is not None:
+        params["statusName"] = status_name
+    if sort_by is not None:
+        params["sortBy"] = sort_by
+    if sort_order is not None:
+        params["sortOrder"] = sort_order
+    if ext_branch_code is not None:
+        params["extBranchCode"] = ext_branch_code
+    return params
+
+
+def _sales_filters(
+    sales_date_from: str,
+    sales_date_to: str,
+    *,
+    branch_code: str | None = None,
+    bill_num: str | None = None,
+    sales_num: str | None = None,
+) -> dict[str, str]:
+    """Build the filter body of the Master POS sales reports.
+
+    The bodies are a few string filters, so they are built with
+    filter_body() rather than request models; unset filters are left out.
+    """
+    return filter_body(
+        {
+            "filterSalesDateFrom": sales_date_from,
+            "filterSalesDateTo": sales_date_to,
+            "filterBranchCode": branch_code,
+            "filterBillNum": bill_num,
+            "filterSalesNum": sales_num,
+        },
+        required=("filterSalesDateFrom", "filterSalesDateTo"),
+    )
+
+
+def _parse_sales_information(
+    response: SuccessResponse[list[SalesInformationItem]] | dict[str, Any] | list[Any],
+) -> list[SalesInformationItem]:
+    """Parse a Sales Information API response into items.
+
+    Success bodies arrive already validated from get_decoded(); responses
+    it declined arrive as parsed JSON, where a missing or non-list result
+    means no items.
+    """
+    if isinstance(response, (dict, list)):
+        result = expect_object(response, _SALES_INFORMATION_PATH).get("result")
+        if isinstance(result, list):
+            return _SALES_INFORMATION_ITEMS.validate_python(result)
+        return []
+    return response.result
+
+
+def _page_decoder(
+    items: TypeAdapter[list[_ItemT]],
+) -> Callable[[bytes], tuple[list[_ItemT]]]:
+    """Build the one-pass decoder for a Master POS report page.
+
+    The decoded items come back wrapped in a tuple, so _page_items() can
+    tell them from a list the decoder declined and that arrives as parsed
+    JSON.
+    """
+
+    def decode(body: bytes) -> tuple[list[_ItemT]]:
+        return (items.validate_json(body),)
+
+    return decode
+
+
+def _page_items(
+    response: tuple[list[_ItemT]] | dict[str, Any] | list[Any],
+    items: TypeAdapter[list[_ItemT]],
+) -> list[_ItemT]:
+    """Get the items of a Master POS report page decoded by _page_decoder().
+
+    Decoded pages are returned as they are. A declined list is validated
+    again so its validation error is raised, and anything else means no
+    items.
+    """
+    if isinstance(response, tuple):
+        return response[0]
+    if isinstance(response, list):
+        return items.validate_python(response)
+    return []
+
+
+def _parse_sales_payment_summary(
+    response: dict[str, Any] | list[Any],
+) -> list[SalesPaymentSummaryItem]:
+    """Parse a Sales Payment Summary API response into items.
+
+    A missing or non-list result means no items.
+    """
+    result = expect_object(response, _SALES_PAYMENT_SUMMARY_PATH).get("result")
+    if isinstance(result, list):
+        return _SALES_PAYMENT_SUMMARY_ITEMS.validate_python(result)
+    return []
 
 
 class ReportAPI(BaseAPI):
@@ -78,6 +253,46 @@ class ReportAPI(BaseAPI):
         self._master_pos_http = master_pos_http
         self._core_bearer_http = core_bearer_http
 
+    def _post_list(
+        self,
+        path: str,
+        body: dict[str, str],
+        page: int,
+        items: TypeAdapter[list[_ItemT]],
+    ) -> list[_ItemT]:
+        """Post a Master POS report query and validate its list response.
+
+        The body is decoded straight into items in one pass when it is a
+        valid list. Anything else is handled as a regular response: lists
+        that fail validation raise, and other responses mean no items.
+        """
+        response = self._master_pos_http.post_decoded(
+            path, _page_decoder(items), params={"page": page}, json=body
+        )
+        return _page_items(response, items)
+
+    def _iter_post_list_async(
+        self,
+        path: str,
+        body: dict[str, str],
+        items: TypeAdapter[list[_ItemT]],
+    ) -> AsyncIterator[_ItemT]:
+        """Iterate over every page of a Master POS report, prefetching.
+
+        The async counterpart of paging through _post_list(); see
+        prefetch_pages() for how the next page is requested early.
+        """
+
+        decode = _page_decoder(items)
+
+        async def get_page(page: int) -> list[_ItemT]:
+            response = await self._master_pos_http.post_decoded_async(
+                path, decode, params={"page": page}, json=body
+            )
+            return _page_items(response, items)
+
+        return prefetch_pages(get_page)
+
     def get_sales_head(
         self,
         *,
@@ -121,23 +336,120 @@ class ReportAPI(BaseAPI):
                 print(f"  Status: {head.status_name}")
             ```
         """
-        request = SalesHeadRequest(
-            filter_sales_date_from=sales_date_from,
-            filter_sales_date_to=sales_date_to,
-            filter_branch_code=branch_code,
-            filter_bill_num=bill_num,
-            filter_sales_num=sales_num,
+        body = _sales_filters(
+            sales_date_from,
+            sales_date_to,
+            branch_code=branch_code,
+            bill_num=bill_num,
+            sales_num=sales_num,
+        )
+        return self._post_list(
+            "/external/general/sales-head", body, page, _SALES_HEAD_ITEMS
         )
-        response = self._master_pos_http.post(
+
+    def iter_sales_head(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+        bill_num: str | None = None,
+        sales_num: str | None = None,
+        page: int = 1,
+    ) -> Iterator[SalesHeadItem]:
+        """Iterate over sales head transactions as the response downloads.
+
+        Same request as get_sales_head(), but items are parsed and yielded
+        one at a time (incrementally when ijson is installed), so large
+        pages don't have to be held in memory at once.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+            bill_num: Optional filter by bill number.
+            sales_num: Optional filter by sales number.
+            page: Page number for pagination (default: 1).
+
+        Yields:
+            Sales head items.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            for head in client.report.iter_sales_head(
+                sales_date_from="2024-01-01",
+                sales_date_to="2024-01-31",
+            ):
+                print(head.sales_num, head.grand_total)
+            ```
+        """
+        body = _sales_filters(
+            sales_date_from,
+            sales_date_to,
+            branch_code=branch_code,
+            bill_num=bill_num,
+            sales_num=sales_num,
+        )
+        for item in self._master_pos_http.request_stream(
+            "POST",
             "/external/general/sales-head",
             params={"page": page},
-            json=request.model_dump(by_alias=True, exclude_none=True),
-            headers={"Content-Type": "application/json"},
+            json=body,
+        ):
+            yield SalesHeadItem.model_validate(item)
+
+    def iter_sales_head_async(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+        bill_num: str | None = None,
+        sales_num: str | None = None,
+    ) -> AsyncIterator[SalesHeadItem]:
+        """Iterate over sales head transactions across all pages.
+
+        Same prefetching as iter_sales_information_async(): the next page
+        downloads while the caller works through the current one, and
+        iteration stops at the first empty page.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+            bill_num: Optional filter by bill number.
+            sales_num: Optional filter by sales number.
+
+        Returns:
+            Async iterator over sales head items in page order.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async for head in client.report.iter_sales_head_async(
+                sales_date_from="2024-01-01",
+                sales_date_to="2024-01-31",
+            ):
+                print(head.sales_num, head.grand_total)
+            ```
+        """
+        body = _sales_filters(
+            sales_date_from,
+            sales_date_to,
+            branch_code=branch_code,
+            bill_num=bill_num,
+            sales_num=sales_num,
+        )
+        return self._iter_post_list_async(
+            "/external/general/sales-head", body, _SALES_HEAD_ITEMS
         )
-        if isinstance(response, list):
-            adapter = TypeAdapter(list[SalesHeadItem])
-            return adapter.validate_python(response)
-        return []
 
     def get_sales_information(
         self,
@@ -196,35 +508,176 @@ class ReportAPI(BaseAPI):
                 print(f"  Payment: {sale.payment_total}")
             ```
         """
-        params: dict[str, Any] = {
-            "salesDateFrom": sales_date_from,
-            "salesDateTo": sales_date_to,
-            "page": page,
-        }
-        if branch_code is not None:
-            params["branchCode"] = branch_code
-        if sales_num is not None:
-            params["salesNum"] = sales_num
-        if bill_num is not None:
-            params["billNum"] = bill_num
-        if self_order_id is not None:
-            params["selfOrderID"] = self_order_id
-        if status_name is not None:
-            params["statusName"] = status_name
-        if sort_by is not None:
-            params["sortBy"] = sort_by
-        if sort_order is not None:
-            params["sortOrder"] = sort_order
-        if ext_branch_code is not None:
-            params["extBranchCode"] = ext_branch_code
-
-        response = self._get("/corev1/sales/sales-information", params=params)
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                adapter = TypeAdapter(list[SalesInformationItem])
-                return adapter.validate_python(result)
-        return []
+        params = _sales_information_params(
+            sales_date_from=sales_date_from,
+            sales_date_to=sales_date_to,
+            branch_code=branch_code,
+            sales_num=sales_num,
+            bill_num=bill_num,
+            self_order_id=self_order_id,
+            status_name=status_name,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            ext_branch_code=ext_branch_code,
+            page=page,
+        )
+        response = self._http.get_decoded(
+            _SALES_INFORMATION_PATH,
+            _SALES_INFORMATION_RESPONSE.model_validate_json,
+            params=params,
+            cache=_is_settled(sales_date_to),
+        )
+        return _parse_sales_information(response)
+
+    async def get_sales_information_async(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+        sales_num: str | None = None,
+        bill_num: str | None = None,
+        self_order_id: str | None = None,
+        status_name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        ext_branch_code: str | None = None,
+        page: int = 1,
+    ) -> list[SalesInformationItem]:
+        """Get sales information without blocking the event loop.
+
+        Async variant of get_sales_information(). Useful for fetching many
+        pages concurrently with asyncio.gather.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+            sales_num: Optional filter by exact sales number.
+            bill_num: Optional filter by exact bill number.
+            self_order_id: Optional filter by ESB Order ID.
+            status_name: Optional filter by status (New, Finished, Cancelled, Void).
+            sort_by: Optional sort field (salesDateIn, salesDateOut, memberCode).
+            sort_order: Optional sort order (asc, desc).
+            ext_branch_code: Optional filter by external branch code.
+            page: Page number for pagination (default: 1).
+
+        Returns:
+            List of sales information items.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            pages = await asyncio.gather(
+                *(
+                    client.report.get_sales_information_async(
+                        sales_date_from="2024-01-01",
+                        sales_date_to="2024-01-31",
+                        page=page,
+                    )
+                    for page in range(1, 6)
+                )
+            )
+            ```
+        """
+        params = _sales_information_params(
+            sales_date_from=sales_date_from,
+            sales_date_to=sales_date_to,
+            branch_code=branch_code,
+            sales_num=sales_num,
+            bill_num=bill_num,
+            self_order_id=self_order_id,
+            status_name=status_name,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            ext_branch_code=ext_branch_code,
+            page=page,
+        )
+        response = await self._http.get_decoded_async(
+            _SALES_INFORMATION_PATH,
+            _SALES_INFORMATION_RESPONSE.model_validate_json,
+            params=params,
+            cache=_is_settled(sales_date_to),
+        )
+        return _parse_sales_information(response)
+
+    def iter_sales_information_async(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+        sales_num: str | None = None,
+        bill_num: str | None = None,
+        self_order_id: str | None = None,
+        status_name: str | None = None,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        ext_branch_code: str | None = None,
+    ) -> AsyncIterator[SalesInformationItem]:
+        """Iterate over sales information across all pages.
+
+        The next page is requested as soon as the current one arrives, so
+        it downloads while the caller works through the current items.
+        Iteration stops at the first empty page; stopping early cancels
+        the prefetch in flight.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+            sales_num: Optional filter by exact sales number.
+            bill_num: Optional filter by exact bill number.
+            self_order_id: Optional filter by ESB Order ID.
+            status_name: Optional filter by status (New, Finished, Cancelled, Void).
+            sort_by: Optional sort field (salesDateIn, salesDateOut, memberCode).
+            sort_order: Optional sort order (asc, desc).
+            ext_branch_code: Optional filter by external branch code.
+
+        Returns:
+            Async iterator over sales information items in page order.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async for sale in client.report.iter_sales_information_async(
+                sales_date_from="2024-01-01",
+                sales_date_to="2024-01-31",
+            ):
+                print(sale.sales_num)
+            ```
+        """
+        params = _sales_information_params(
+            sales_date_from=sales_date_from,
+            sales_date_to=sales_date_to,
+            branch_code=branch_code,
+            sales_num=sales_num,
+            bill_num=bill_num,
+            self_order_id=self_order_id,
+            status_name=status_name,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            ext_branch_code=ext_branch_code,
+            page=1,
+        )
+        cache = _is_settled(sales_date_to)
+
+        async def get_page(page: int) -> list[SalesInformationItem]:
+            response = await self._http.get_decoded_async(
+                _SALES_INFORMATION_PATH,
+                _SALES_INFORMATION_RESPONSE.model_validate_json,
+                params={**params, "page": page},
+                cache=cache,
+            )
+            return _parse_sales_information(response)
+
+        return prefetch_pages(get_page)
 
     def get_sales_menu_completion(
         self,
@@ -265,21 +718,54 @@ class ReportAPI(BaseAPI):
                 print(f"  Checker: {item.checker_qty} / {item.checker_process}")
             ```
         """
-        request = SalesMenuCompletionRequest(
-            filter_sales_date_from=sales_date_from,
-            filter_sales_date_to=sales_date_to,
-            filter_branch_code=branch_code,
+        body = _sales_filters(sales_date_from, sales_date_to, branch_code=branch_code)
+        return self._post_list(
+            "/external/general/sales-menu-completion",
+            body,
+            page,
+            _SALES_MENU_COMPLETION_ITEMS,
         )
-        response = self._master_pos_http.post(
+
+    def iter_sales_menu_completion_async(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+    ) -> AsyncIterator[SalesMenuCompletionItem]:
+        """Iterate over sales menu completion across all pages.
+
+        Same prefetching as iter_sales_information_async(): the next page
+        downloads while the caller works through the current one, and
+        iteration stops at the first empty page.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+
+        Returns:
+            Async iterator over sales menu completion items in page order.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async for item in client.report.iter_sales_menu_completion_async(
+                sales_date_from="2024-01-01",
+                sales_date_to="2024-01-31",
+            ):
+                print(item.menu, item.kitchen_qty)
+            ```
+        """
+        body = _sales_filters(sales_date_from, sales_date_to, branch_code=branch_code)
+        return self._iter_post_list_async(
             "/external/general/sales-menu-completion",
-            params={"page": page},
-            json=request.model_dump(by_alias=True, exclude_none=True),
-            headers={"Content-Type": "application/json"},
+            body,
+            _SALES_MENU_COMPLETION_ITEMS,
         )
-        if isinstance(response, list):
-            adapter = TypeAdapter(list[SalesMenuCompletionItem])
-            return adapter.validate_python(response)
-        return []
 
     def get_sales_menu_summary(
         self,
@@ -316,15 +802,15 @@ class ReportAPI(BaseAPI):
                     print(f"  {menu.menu_name}: {menu.qty} = {menu.total}")
             ```
         """
-        params: dict[str, Any] = {"salesDate": sales_date}
+        params: QueryParams = {"salesDate": sales_date}
         if branch_code is not None:
             params["branchCode"] = branch_code
 
-        response = self._get("/extv1/sales/sales-menu-summary/", params=params)
-        if isinstance(response, dict):
-            data = response.get("data")
-            if data:
-                return SalesMenuSummaryResult.model_validate(data)
+        path = "/extv1/sales/sales-menu-summary/"
+        response = self._get(path, params=params, cache=_is_settled(sales_date))
+        data = expect_object(response, path).get("data")
+        if data:
+            return SalesMenuSummaryResult.model_validate(data)
         return None
 
     def get_sales_menu(
@@ -367,22 +853,61 @@ class ReportAPI(BaseAPI):
                 print(f"  Qty: {menu.qty}, Total: {menu.total}")
             ```
         """
-        request = SalesMenuRequest(
-            filter_sales_date_from=sales_date_from,
-            filter_sales_date_to=sales_date_to,
-            filter_branch_code=branch_code,
-            filter_sales_num=sales_num,
+        body = _sales_filters(
+            sales_date_from,
+            sales_date_to,
+            branch_code=branch_code,
+            sales_num=sales_num,
         )
-        response = self._master_pos_http.post(
-            "/external/general/sales-menu",
-            params={"page": page},
-            json=request.model_dump(by_alias=True, exclude_none=True),
-            headers={"Content-Type": "application/json"},
+        return self._post_list(
+            "/external/general/sales-menu", body, page, _SALES_MENU_REPORT_ITEMS
+        )
+
+    def iter_sales_menu_async(
+        self,
+        *,
+        sales_date_from: str,
+        sales_date_to: str,
+        branch_code: str | None = None,
+        sales_num: str | None = None,
+    ) -> AsyncIterator[SalesMenuReportItem]:
+        """Iterate over sales menu data across all pages.
+
+        Same prefetching as iter_sales_information_async(): the next page
+        downloads while the caller works through the current one, and
+        iteration stops at the first empty page.
+
+        Args:
+            sales_date_from: Start date filter (YYYY-MM-DD).
+            sales_date_to: End date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+            sales_num: Optional filter by sales number.
+
+        Returns:
+            Async iterator over sales menu report items in page order.
+
+        Raises:
+            ESBValidationError: If date parameters are missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async for menu in client.report.iter_sales_menu_async(
+                sales_date_from="2024-01-01",
+                sales_date_to="2024-01-31",
+            ):
+                print(menu.menu_name, menu.qty)
+            ```
+        """
+        body = _sales_filters(
+            sales_date_from,
+            sales_date_to,
+            branch_code=branch_code,
+            sales_num=sales_num,
+        )
+        return self._iter_post_list_async(
+            "/external/general/sales-menu", body, _SALES_MENU_REPORT_ITEMS
         )
-        if isinstance(response, list):
-            adapter = TypeAdapter(list[SalesMenuReportItem])
-            return adapter.validate_python(response)
-        return []
 
     def get_sales_payment_summary(
         self,
@@ -423,18 +948,61 @@ class ReportAPI(BaseAPI):
                     print(f"    Net: {payment.net_after_mdr}")
             ```
         """
-        params: dict[str, Any] = {"salesDate": sales_date, "page": page}
+        params: QueryParams = {"salesDate": sales_date, "page": page}
         if branch_code is not None:
             params["branchCode"] = branch_code
 
         response = self._core_bearer_http.get(
-            "/report/sales-payment-summary",
+            _SALES_PAYMENT_SUMMARY_PATH,
             params=params,
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
+            cache=_is_settled(sales_date),
         )
-        if isinstance(response, dict):
-            result = response.get("result", [])
-            if isinstance(result, list):
-                adapter = TypeAdapter(list[SalesPaymentSummaryItem])
-                return adapter.validate_python(result)
-        return []
+        return _parse_sales_payment_summary(response)
+
+    def iter_sales_payment_summary_async(
+        self,
+        *,
+        sales_date: str,
+        branch_code: str | None = None,
+    ) -> AsyncIterator[SalesPaymentSummaryItem]:
+        """Iterate over the sales payment summary across all pages.
+
+        Same prefetching as iter_sales_information_async(): the next page
+        downloads while the caller works through the current one, and
+        iteration stops at the first empty page.
+
+        Args:
+            sales_date: Sales date filter (YYYY-MM-DD).
+            branch_code: Optional filter by branch code.
+
+        Returns:
+            Async iterator over sales payment summary items in page order.
+
+        Raises:
+            ESBValidationError: If date parameter is missing.
+            ESBAuthenticationError: If authentication fails.
+
+        Example:
+            ```python
+            async for summary in client.report.iter_sales_payment_summary_async(
+                sales_date="2024-01-01",
+            ):
+                print(summary.branch_name)
+            ```
+        """
+        params: QueryParams = {"salesDate": sales_date}
+        if branch_code is not None:
+            params["branchCode"] = branch_code
+        cache = _is_settled(sales_date)
+
+        async def get_page(page: int) -> list[SalesPaymentSummaryItem]:
+            response = await self._core_bearer_http.get_async(
+                _SALES_PAYMENT_SUMMARY_PATH,
+                params={**params, "page": page},
+                headers=_JSON_HEADERS,
+                cache=cache,
+            )
+            return _parse_sales_payment_summary(response)
+
+        return prefetch_pages(get_page)
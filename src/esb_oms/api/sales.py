@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from esb_oms.api._base import BaseAPI
+from esb_oms.api._base import BaseAPI, encode_request
 from esb_oms.models.sales import (
     PushSalesDataRequest,
     PushSalesDataResult,
@@ -98,14 +98,11 @@ class SalesAPI(BaseAPI):
             ```
         """
         request = PushSalesDataRequest(sales_head=sales_head)
-        response = self._post(
+        response = self._post_object(
             "/extv1/push/sales-data",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return PushSalesDataResult.model_validate(response["result"])
-        msg = "Unexpected response format from push_sales_data API"
-        raise TypeError(msg)
+        return PushSalesDataResult.model_validate(response["result"])
 
     def push_shift_data(self, shift_data: ShiftData) -> PushShiftDataResult:
         """Push shift data to ESB Core (V2).
@@ -142,14 +139,11 @@ class SalesAPI(BaseAPI):
             ```
         """
         request = PushShiftDataRequest(shift_data=shift_data)
-        response = self._post(
+        response = self._post_object(
             "/extv1/push/shift-data",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return PushShiftDataResult.model_validate(response["result"])
-        msg = "Unexpected response format from push_shift_data API"
-        raise TypeError(msg)
+        return PushShiftDataResult.model_validate(response["result"])
 
     def push_sales_data_v1(self, sales_head: SalesHead) -> PushSalesDataResult:
         """Push sales data to ESB Core (V1 - Legacy).
@@ -167,14 +161,11 @@ class SalesAPI(BaseAPI):
             ESBAuthenticationError: If authentication fails.
         """
         request = PushSalesDataRequest(sales_head=sales_head)
-        response = self._post(
+        response = self._post_object(
             "/ext/push/sales-data",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return PushSalesDataResult.model_validate(response["result"])
-        msg = "Unexpected response format from push_sales_data_v1 API"
-        raise TypeError(msg)
+        return PushSalesDataResult.model_validate(response["result"])
 
     def push_shift_data_v1(self, shift_data: ShiftData) -> PushShiftDataResult:
         """Push shift data to ESB Core (V1 - Legacy).
@@ -192,11 +183,8 @@ class SalesAPI(BaseAPI):
             ESBAuthenticationError: If authentication fails.
         """
         request = PushShiftDataRequest(shift_data=shift_data)
-        response = self._post(
+        response = self._post_object(
             "/ext/push/shift-data",
-            json=request.model_dump(by_alias=True, exclude_none=True),
+            content=encode_request(request),
         )
-        if isinstance(response, dict):
-            return PushShiftDataResult.model_validate(response["result"])
-        msg = "Unexpected response format from push_shift_data_v1 API"
-        raise TypeError(msg)
+        return PushShiftDataResult.model_validate(response["result"])
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from esb_oms._base import BaseClient
+from esb_oms._http import DEFAULT_LIMITS
 from esb_oms.environments import Environment
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, MutableMapping
+    from pathlib import Path
+
+    import httpx
+
     from esb_oms.api.auth import AuthAPI
     from esb_oms.api.master_member import MasterMemberAPI
     from esb_oms.api.master_menu import (
@@ -80,6 +86,9 @@ class ESBClient(BaseClient):
         environment: Environment = Environment.PRODUCTION,
         auto_refresh: bool = True,
         timeout: float = 30.0,
+        token_cache_path: Path | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        response_cache: MutableMapping[Hashable, Any] | None = None,
     ) -> None:
         """Initialize the ESB OMS API client.
 
@@ -93,6 +102,15 @@ class ESBClient(BaseClient):
             environment: Target environment (STAGING_INT, STAGING, PRODUCTION).
             auto_refresh: Automatically refresh expired access tokens.
             timeout: Request timeout in seconds (default: 30).
+            token_cache_path: Optional file for caching login tokens between
+                runs, so a new process can skip login while the token is valid.
+            limits: Connection pool limits shared by the HTTP clients
+                (default: 40 connections, 20 kept alive for 60 seconds).
+            response_cache: Optional mapping (e.g. ``cachetools.TTLCache``)
+                memoizing GET responses such as member lookups. Responses
+                are keyed by credentials, so clients for different users
+                may share one cache. Responses under a path are dropped
+                when a write is sent to it.
 
         Raises:
             ValueError: If neither credentials nor static token provided.
@@ -120,6 +138,9 @@ class ESBClient(BaseClient):
             environment=environment,
             auto_refresh=auto_refresh,
             timeout=timeout,
+            token_cache_path=token_cache_path,
+            limits=limits,
+            response_cache=response_cache,
         )
 
         # Lazy-loaded API instances
@@ -1,100 +1,197 @@
 """Pydantic models for ESB OMS API."""
 
-from esb_oms.models.auth import LoginRequest, LoginResult, TokenInfo
-from esb_oms.models.common import ESBBaseModel
-from esb_oms.models.master import (
-    Branch,
-    BranchVisitPurpose,
-    BusinessHour,
-    MenuCategory,
-    MenuCategoryDetail,
-    MenuPackageGroup,
-    PaymentMethodItem,
-    PaymentMethodType,
-    POSMenuItem,
-    StockBranchItem,
-    VisitPurpose,
-)
-from esb_oms.models.member import GetMemberResponse, MemberResult
-from esb_oms.models.menu import (
-    CreateMenuCategoryRequest,
-    CreateMenuRequest,
-    CreateMenuTemplateRequest,
-    GetMenuCategoryResponse,
-    GetMenuResponse,
-    GetMenuTemplateResponse,
-    MenuCategoryDetailInput,
-    MenuCategoryResult,
-    MenuExtraInput,
-    MenuIconInput,
-    MenuPackageGroupInput,
-    MenuPackageMenuInput,
-    MenuResult,
-    MenuTagInput,
-    MenuTemplateDetailInput,
-    MenuTemplateDetailResult,
-    MenuTemplatePriceInput,
-    MenuTemplateResult,
-    RelatedMenuInput,
-    UpdateMenuCategoryRequest,
-    UpdateMenuRequest,
-    UpdateMenuTemplateRequest,
-)
-from esb_oms.models.other import (
-    BranchSalesSummaryItem,
-    DailySalesMaterialUsageItem,
-    SalesDetailItem,
-    SalesExtraItem,
-    SalesMenuDetailItem,
-    SalesPackageItem,
-    SalesPaymentDetailItem,
-)
-from esb_oms.models.promotion import (
-    ApplyDiscountTo,
-    ApplyTo,
-    CreateDiscountAmountESORequest,
-    CreateDiscountLimitPercentageRequest,
-    CreateDiscountPercentageESORequest,
-    CreateDiscountPercentageRequest,
-    CreateFreeItemRequest,
-    CreatePromotionResponse,
-    CreatePromotionResult,
-    PaymentMethodResult,
-    PromotionBranchResult,
-    PromotionCategoryResult,
-    PromotionDay,
-    PromotionResult,
-    PromotionTimeInput,
-    PromotionType,
-    SelfOrderPaymentMethodResult,
-)
-from esb_oms.models.report import (
-    GetSalesMenuSummaryResponse,
-    GetSalesPaymentSummaryResponse,
-    MenuSummaryItem,
-    PaymentSummaryItem,
-    SalesHeadItem,
-    SalesInformationItem,
-    SalesMenuCompletionItem,
-    SalesMenuReportExtraItem,
-    SalesMenuReportItem,
-    SalesMenuReportPackageItem,
-    SalesMenuSummaryResult,
-    SalesPaymentSummaryItem,
-)
-from esb_oms.models.sales import (
-    MenuExtra,
-    MenuPackage,
-    MenuStatus,
-    Payment,
-    PushSalesDataRequest,
-    PushSalesDataResult,
-    PushShiftDataRequest,
-    PushShiftDataResult,
-    SalesHead,
-    SalesMenuItem,
-    SalesStatus,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from esb_oms.models.auth import LoginRequest, LoginResult, TokenInfo
+    from esb_oms.models.common import ESBBaseModel
+    from esb_oms.models.master import (
+        Branch,
+        BranchVisitPurpose,
+        BusinessHour,
+        MenuCategory,
+        MenuCategoryDetail,
+        MenuPackageGroup,
+        PaymentMethodItem,
+        PaymentMethodType,
+        POSMenuItem,
+        StockBranchItem,
+        VisitPurpose,
+    )
+    from esb_oms.models.member import GetMemberResponse, MemberResult
+    from esb_oms.models.menu import (
+        CreateMenuCategoryRequest,
+        CreateMenuRequest,
+        CreateMenuTemplateRequest,
+        GetMenuCategoryResponse,
+        GetMenuResponse,
+        GetMenuTemplateResponse,
+        MenuCategoryDetailInput,
+        MenuCategoryResult,
+        MenuExtraInput,
+        MenuIconInput,
+        MenuPackageGroupInput,
+        MenuPackageMenuInput,
+        MenuResult,
+        MenuTagInput,
+        MenuTemplateDetailInput,
+        MenuTemplateDetailResult,
+        MenuTemplatePriceInput,
+        MenuTemplateResult,
+        RelatedMenuInput,
+        UpdateMenuCategoryRequest,
+        UpdateMenuRequest,
+        UpdateMenuTemplateRequest,
+    )
+    from esb_oms.models.other import (
+        BranchSalesSummaryItem,
+        DailySalesMaterialUsageItem,
+        SalesDetailItem,
+        SalesExtraItem,
+        SalesMenuDetailItem,
+        SalesPackageItem,
+        SalesPaymentDetailItem,
+    )
+    from esb_oms.models.promotion import (
+        ApplyDiscountTo,
+        ApplyTo,
+        CreateDiscountAmountESORequest,
+        CreateDiscountLimitPercentageRequest,
+        CreateDiscountPercentageESORequest,
+        CreateDiscountPercentageRequest,
+        CreateFreeItemRequest,
+        CreatePromotionResponse,
+        CreatePromotionResult,
+        PaymentMethodResult,
+        PromotionBranchResult,
+        PromotionCategoryResult,
+        PromotionDay,
+        PromotionResult,
+        PromotionTimeInput,
+        PromotionType,
+        SelfOrderPaymentMethodResult,
+    )
+    from esb_oms.models.report import (
+        GetSalesMenuSummaryResponse,
+        GetSalesPaymentSummaryResponse,
+        MenuSummaryItem,
+        PaymentSummaryItem,
+        SalesHeadItem,
+        SalesInformationItem,
+        SalesMenuCompletionItem,
+        SalesMenuReportExtraItem,
+        SalesMenuReportItem,
+        SalesMenuReportPackageItem,
+        SalesMenuSummaryResult,
+        SalesPaymentSummaryItem,
+    )
+    from esb_oms.models.sales import (
+        MenuExtra,
+        MenuPackage,
+        MenuStatus,
+        Payment,
+        PushSalesDataRequest,
+        PushSalesDataResult,
+        PushShiftDataRequest,
+        PushShiftDataResult,
+        SalesHead,
+        SalesMenuItem,
+        SalesStatus,
+    )
+
+# Model name -> submodule defining it. Submodules are imported on first
+# attribute access, so ``import esb_oms`` doesn't build every pydantic model.
+_LAZY_IMPORTS: dict[str, str] = {
+    "LoginRequest": "auth",
+    "LoginResult": "auth",
+    "TokenInfo": "auth",
+    "ESBBaseModel": "common",
+    "Branch": "master",
+    "BranchVisitPurpose": "master",
+    "BusinessHour": "master",
+    "MenuCategory": "master",
+    "MenuCategoryDetail": "master",
+    "MenuPackageGroup": "master",
+    "PaymentMethodItem": "master",
+    "PaymentMethodType": "master",
+    "POSMenuItem": "master",
+    "StockBranchItem": "master",
+    "VisitPurpose": "master",
+    "GetMemberResponse": "member",
+    "MemberResult": "member",
+    "CreateMenuCategoryRequest": "menu",
+    "CreateMenuRequest": "menu",
+    "CreateMenuTemplateRequest": "menu",
+    "GetMenuCategoryResponse": "menu",
+    "GetMenuResponse": "menu",
+    "GetMenuTemplateResponse": "menu",
+    "MenuCategoryDetailInput": "menu",
+    "MenuCategoryResult": "menu",
+    "MenuExtraInput": "menu",
+    "MenuIconInput": "menu",
+    "MenuPackageGroupInput": "menu",
+    "MenuPackageMenuInput": "menu",
+    "MenuResult": "menu",
+    "MenuTagInput": "menu",
+    "MenuTemplateDetailInput": "menu",
+    "MenuTemplateDetailResult": "menu",
+    "MenuTemplatePriceInput": "menu",
+    "MenuTemplateResult": "menu",
+    "RelatedMenuInput": "menu",
+    "UpdateMenuCategoryRequest": "menu",
+    "UpdateMenuRequest": "menu",
+    "UpdateMenuTemplateRequest": "menu",
+    "BranchSalesSummaryItem": "other",
+    "DailySalesMaterialUsageItem": "other",
+    "SalesDetailItem": "other",
+    "SalesExtraItem": "other",
+    "SalesMenuDetailItem": "other",
+    "SalesPackageItem": "other",
+    "SalesPaymentDetailItem": "other",
+    "ApplyDiscountTo": "promotion",
+    "ApplyTo": "promotion",
+    "CreateDiscountAmountESORequest": "promotion",
+    "CreateDiscountLimitPercentageRequest": "promotion",
+    "CreateDiscountPercentageESORequest": "promotion",
+    "CreateDiscountPercentageRequest": "promotion",
+    "CreateFreeItemRequest": "promotion",
+    "CreatePromotionResponse": "promotion",
+    "CreatePromotionResult": "promotion",
+    "PaymentMethodResult": "promotion",
+    "PromotionBranchResult": "promotion",
+    "PromotionCategoryResult": "promotion",
+    "PromotionDay": "promotion",
+    "PromotionResult": "promotion",
+    "PromotionTimeInput": "promotion",
+    "PromotionType": "promotion",
+    "SelfOrderPaymentMethodResult": "promotion",
+    "GetSalesMenuSummaryResponse": "report",
+    "GetSalesPaymentSummaryResponse": "report",
+    "MenuSummaryItem": "report",
+    "PaymentSummaryItem": "report",
+    "SalesHeadItem": "report",
+    "SalesInformationItem": "report",
+    "SalesMenuCompletionItem": "report",
+    "SalesMenuReportExtraItem": "report",
+    "SalesMenuReportItem": "report",
+    "SalesMenuReportPackageItem": "report",
+    "SalesMenuSummaryResult": "report",
+    "SalesPaymentSummaryItem": "report",
+    "MenuExtra": "sales",
+    "MenuPackage": "sales",
+    "MenuStatus": "sales",
+    "Payment": "sales",
+    "PushSalesDataRequest": "sales",
+    "PushSalesDataResult": "sales",
+    "PushShiftDataRequest": "sales",
+    "PushShiftDataResult": "sales",
+    "SalesHead": "sales",
+    "SalesMenuItem": "sales",
+    "SalesStatus": "sales",
+}
 
 __all__ = [
     # Common
@@ -193,3 +290,29 @@ __all__ = [
     "SalesPaymentDetailItem",
     "SalesDetailItem",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model from its submodule on first access.
+
+    Args:
+        name: Model name, e.g. ``"SalesHead"``.
+
+    Returns:
+        The model class or enum.
+
+    Raises:
+        AttributeError: If the name is not an exported model.
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported models."""
+    return sorted({*globals(), *__all__})
@@ -104,9 +104,11 @@ class TokenInfo(ESBBaseModel):
         refresh_token: Current JWT refresh token.
         username: Username associated with the tokens.
         company_code: Company code associated with the tokens.
+        expires_at: When the access token expires, if known.
     """
 
     access_token: str
     refresh_token: str
     username: str | None = None
     company_code: str | None = None
+    expires_at: datetime | None = None
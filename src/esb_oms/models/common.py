@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Generic, TypeVar
+from decimal import Decimal
+from typing import Annotated, Any, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
 
 # Type variable for generic response result
 T = TypeVar("T")
 
+# TypeAdapter config that, like ESBBaseModel, builds the validator on first
+# use instead of at import time. The API modules keep their list adapters at
+# module level, so each validator is built once rather than on every call.
+DEFER_BUILD = ConfigDict(defer_build=True)
+
+# Decimal amount in request models. Serialized to JSON as a number rather
+# than pydantic's default string, matching what the API expects.
+Amount = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
 
 class ESBBaseModel(BaseModel):
     """Base model with common configuration for all ESB models.
@@ -25,6 +35,7 @@ class ESBBaseModel(BaseModel):
         validate_assignment=True,
         extra="ignore",  # Ignore extra fields for forward compatibility
         str_strip_whitespace=True,
+        defer_build=True,
     )
 
 
@@ -69,6 +80,22 @@ class APIResponse(ESBBaseModel, Generic[T]):
         return self.status.lower() == "ok"
 
 
+class SuccessResponse(ESBBaseModel, Generic[T]):
+    """Successful API response, validated straight from the JSON body.
+
+    Only accepts the success statuses the HTTP client's fast path accepts
+    ("ok", "00" or none), so any other body is left to the regular error
+    handling.
+
+    Attributes:
+        status: Response status.
+        result: The response data.
+    """
+
+    status: Literal["", "ok", "00"] = ""
+    result: T
+
+
 class PaginatedResult(ESBBaseModel, Generic[T]):
     """Paginated result container.
 
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from pydantic import Field
 
-from esb_oms.models.common import ESBBaseModel
+from esb_oms.models.common import Amount, ESBBaseModel
 
 
 class MenuCategoryDetailInput(ESBBaseModel):
@@ -19,7 +19,7 @@ class MenuCategoryDetailInput(ESBBaseModel):
     menu_category_detail_on_eso: str = Field("", alias="menuCategoryDetailOnEso")
     menu_category_detail_code: str = Field("", alias="menuCategoryDetailCode")
     description: str = ""
-    max_order_qty: Decimal = Field(Decimal("1"), alias="maxOrderQty")
+    max_order_qty: Amount = Field(Decimal("1"), alias="maxOrderQty")
     menu_category_detail_theme: str = Field("", alias="menuCategoryDetailTheme")
     image_url: str = Field("", alias="imageUrl")
 
@@ -99,13 +99,14 @@ class GetMenuCategoryResponse(ESBBaseModel):
     limit: int = 10
     count: int = 0
     data: list[MenuCategoryResult] = Field(default_factory=list)
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 class MenuTemplatePackageInput(ESBBaseModel):
     """Menu template package price input."""
 
     menu_template_id: int = Field(..., alias="menuTemplateID")
-    price: Decimal
+    price: Amount
 
 
 class MenuPackageMenuInput(ESBBaseModel):
@@ -114,7 +115,7 @@ class MenuPackageMenuInput(ESBBaseModel):
     menu_id: int = Field(..., alias="menuID")
     menu_name: str = Field("", alias="menuName")
     menu_code: str = Field("", alias="menuCode")
-    price: Decimal
+    price: Amount
     default_item: bool = Field(False, alias="defaultItem")
     menu_template_packages: list[MenuTemplatePackageInput] = Field(
         default_factory=list, alias="menuTemplatePackages"
@@ -126,8 +127,8 @@ class MenuPackageGroupInput(ESBBaseModel):
 
     menu_group_id: int | str = Field("", alias="menuGroupID")
     menu_group_name: str = Field("", alias="menuGroupName")
-    min_qty: Decimal = Field(Decimal("0"), alias="minQty")
-    max_qty: Decimal = Field(Decimal("999999"), alias="maxQty")
+    min_qty: Amount = Field(Decimal("0"), alias="minQty")
+    max_qty: Amount = Field(Decimal("999999"), alias="maxQty")
     notes: str = ""
     order_id: int = Field(0, alias="orderID")
     flag_active: bool = Field(True, alias="flagActive")
@@ -140,9 +141,9 @@ class MenuExtraInput(ESBBaseModel):
     menu_extra_id: int | str = Field("", alias="menuExtraID")
     menu_id: int = Field(..., alias="menuID")
     menu_name: str = Field("", alias="menuName")
-    price: Decimal
-    min_extra_qty: Decimal = Field(Decimal("0"), alias="minExtraQty")
-    max_extra_qty: Decimal = Field(Decimal("1"), alias="maxExtraQty")
+    price: Amount
+    min_extra_qty: Amount = Field(Decimal("0"), alias="minExtraQty")
+    max_extra_qty: Amount = Field(Decimal("1"), alias="maxExtraQty")
     color: str = ""
 
 
@@ -176,7 +177,7 @@ class MenuTemplatePriceInput(ESBBaseModel):
     """Menu template price input for menu creation."""
 
     menu_template_id: int = Field(..., alias="menuTemplateID")
-    price: Decimal
+    price: Amount
 
 
 class CreateMenuRequest(ESBBaseModel):
@@ -394,13 +395,14 @@ class GetMenuResponse(ESBBaseModel):
     limit: int = 20
     count: int = 0
     data: list[MenuResult] = Field(default_factory=list)
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
 
 class MenuTemplateDetailInput(ESBBaseModel):
     """Template detail for create/update requests."""
 
     menu_id: int = Field(..., alias="menuID")
-    price: Decimal
+    price: Amount
     show_on_eso: bool = Field(False, alias="showOnEso")
     start_time: str = Field("", alias="startTime")
     end_time: str = Field("", alias="endTime")
@@ -490,3 +492,4 @@ class GetMenuTemplateResponse(ESBBaseModel):
     limit: int = 10
     count: int = 0
     data: list[MenuTemplateResult] = Field(default_factory=list)
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
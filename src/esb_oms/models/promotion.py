@@ -7,7 +7,7 @@ from enum import IntEnum
 
 from pydantic import Field
 
-from esb_oms.models.common import ESBBaseModel
+from esb_oms.models.common import Amount, ESBBaseModel
 
 
 class PromotionType(IntEnum):
@@ -65,12 +65,12 @@ class CreateDiscountPercentageRequest(ESBBaseModel):
         PromotionType.DISCOUNT_PERCENTAGE, alias="promotionType"
     )
     notes: str = ""
-    discount: Decimal
+    discount: Amount
     authorization_needed: bool = Field(False, alias="authorizationNeeded")
     promotion_days_id: list[int] = Field(default_factory=list, alias="promotionDaysID")
     start_date: str = Field(..., alias="startDate")
     end_date: str = Field(..., alias="endDate")
-    min_sales_price: Decimal = Field(Decimal("0"), alias="minSalesPrice")
+    min_sales_price: Amount = Field(Decimal("0"), alias="minSalesPrice")
     all_categories: bool = Field(True, alias="allCategories")
     apply_discount_to: int | None = Field(default=None, alias="applyDiscountTo")
     menu_category_id: list[int] = Field(default_factory=list, alias="menuCategoryID")
@@ -78,7 +78,7 @@ class CreateDiscountPercentageRequest(ESBBaseModel):
         default_factory=list, alias="menuCategoryDetailID"
     )
     menu_id: list[int] = Field(default_factory=list, alias="menuID")
-    max_sales_price: Decimal | None = Field(default=None, alias="maxSalesPrice")
+    max_sales_price: Amount | None = Field(default=None, alias="maxSalesPrice")
     used_for_loyalty: bool = Field(False, alias="usedForLoyalty")
     apply_to: int | None = Field(default=None, alias="applyTo")
     employee_group_name: list[str] = Field(
@@ -103,12 +103,12 @@ class CreateDiscountLimitPercentageRequest(ESBBaseModel):
         PromotionType.DISCOUNT_LIMIT_PERCENTAGE, alias="promotionType"
     )
     notes: str = ""
-    discount: Decimal
+    discount: Amount
     authorization_needed: bool = Field(False, alias="authorizationNeeded")
     promotion_days_id: list[int] = Field(default_factory=list, alias="promotionDaysID")
     start_date: str = Field(..., alias="startDate")
     end_date: str = Field(..., alias="endDate")
-    min_sales_price: Decimal = Field(Decimal("0"), alias="minSalesPrice")
+    min_sales_price: Amount = Field(Decimal("0"), alias="minSalesPrice")
     all_categories: bool = Field(True, alias="allCategories")
     apply_discount_to: int | None = Field(default=None, alias="applyDiscountTo")
     menu_category_id: list[int] = Field(default_factory=list, alias="menuCategoryID")
@@ -116,7 +116,7 @@ class CreateDiscountLimitPercentageRequest(ESBBaseModel):
         default_factory=list, alias="menuCategoryDetailID"
     )
     menu_id: list[int] = Field(default_factory=list, alias="menuID")
-    max_sales_price: Decimal | None = Field(default=None, alias="maxSalesPrice")
+    max_sales_price: Amount | None = Field(default=None, alias="maxSalesPrice")
     used_for_loyalty: bool = Field(False, alias="usedForLoyalty")
     apply_to: int | None = Field(default=None, alias="applyTo")
     employee_group_name: list[str] = Field(
@@ -171,7 +171,7 @@ class CreateFreeItemRequest(ESBBaseModel):
     promotion_desc: str = Field("", alias="promotionDesc")
     payment_method_name: str | None = Field(default=None, alias="paymentMethodName")
     voucher_source_name: str | None = Field(default=None, alias="voucherSourceName")
-    min_sales_price: Decimal | None = Field(default=None, alias="minSalesPrice")
+    min_sales_price: Amount | None = Field(default=None, alias="minSalesPrice")
     prefix_promotion: str | None = Field(default=None, alias="prefixPromotion")
 
 
@@ -184,7 +184,7 @@ class CreateDiscountPercentageESORequest(ESBBaseModel):
         PromotionType.DISCOUNT_PERCENTAGE_ESO, alias="promotionType"
     )
     notes: str = ""
-    discount: Decimal
+    discount: Amount
     promotion_days_id: list[int] = Field(default_factory=list, alias="promotionDaysID")
     start_date: str = Field(..., alias="startDate")
     end_date: str = Field(..., alias="endDate")
@@ -195,8 +195,8 @@ class CreateDiscountPercentageESORequest(ESBBaseModel):
         default_factory=list, alias="menuCategoryDetailID"
     )
     menu_id: list[int] = Field(default_factory=list, alias="menuID")
-    min_sales_price: Decimal = Field(Decimal("0"), alias="minSalesPrice")
-    max_discount: Decimal | None = Field(default=None, alias="maxDiscount")
+    min_sales_price: Amount = Field(Decimal("0"), alias="minSalesPrice")
+    max_discount: Amount | None = Field(default=None, alias="maxDiscount")
     used_for_loyalty: bool = Field(False, alias="usedForLoyalty")
     promotion_code: str = Field("", alias="promotionCode")
     promotion_desc: str = Field("", alias="promotionDesc")
@@ -222,11 +222,11 @@ class CreateDiscountAmountESORequest(ESBBaseModel):
         PromotionType.DISCOUNT_AMOUNT_ESO, alias="promotionType"
     )
     notes: str = ""
-    discount: Decimal
+    discount: Amount
     promotion_days_id: list[int] = Field(default_factory=list, alias="promotionDaysID")
     start_date: str = Field(..., alias="startDate")
     end_date: str = Field(..., alias="endDate")
-    min_sales_price: Decimal = Field(Decimal("0"), alias="minSalesPrice")
+    min_sales_price: Amount = Field(Decimal("0"), alias="minSalesPrice")
     all_categories: bool = Field(True, alias="allCategories")
     apply_discount_to: int | None = Field(default=None, alias="applyDiscountTo")
     menu_category_id: list[int] = Field(default_factory=list, alias="menuCategoryID")
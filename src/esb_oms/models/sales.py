@@ -7,7 +7,7 @@ from enum import IntEnum
 
 from pydantic import Field
 
-from esb_oms.models.common import ESBBaseModel
+from esb_oms.models.common import Amount, ESBBaseModel
 
 
 class SalesStatus(IntEnum):
@@ -38,16 +38,16 @@ class MenuExtra(ESBBaseModel):
     menu_extra_code: str = Field(..., alias="menuExtraCode", max_length=50)
     menu_extra_name: str = Field(..., alias="menuExtraName", max_length=100)
     qty: int
-    price: Decimal
-    discount: Decimal = Decimal("0")
-    other_tax: Decimal = Field(Decimal("0"), alias="otherTax")
-    other_tax_value: Decimal = Field(Decimal("0"), alias="otherTaxValue")
-    vat: Decimal = Decimal("0")
-    vat_value: Decimal = Field(Decimal("0"), alias="vatValue")
-    other_vat: Decimal = Field(Decimal("0"), alias="otherVat")
-    other_vat_value: Decimal = Field(Decimal("0"), alias="otherVatValue")
+    price: Amount
+    discount: Amount = Decimal("0")
+    other_tax: Amount = Field(Decimal("0"), alias="otherTax")
+    other_tax_value: Amount = Field(Decimal("0"), alias="otherTaxValue")
+    vat: Amount = Decimal("0")
+    vat_value: Amount = Field(Decimal("0"), alias="vatValue")
+    other_vat: Amount = Field(Decimal("0"), alias="otherVat")
+    other_vat_value: Amount = Field(Decimal("0"), alias="otherVatValue")
     other_tax_on_vat: int = Field(0, alias="otherTaxOnVat")
-    total: Decimal
+    total: Amount
     status_id: int = Field(MenuStatus.PREPARING, alias="statusID")
 
 
@@ -62,17 +62,17 @@ class MenuPackage(ESBBaseModel):
     menu_name: str = Field(..., alias="menuName", max_length=50)
     menu_code: str = Field(..., alias="menuCode", max_length=50)
     qty: int
-    original_price: Decimal = Field(Decimal("0"), alias="originalPrice")
-    price: Decimal
-    discount: Decimal = Decimal("0")
-    other_tax: Decimal = Field(Decimal("0"), alias="otherTax")
-    other_tax_value: Decimal = Field(Decimal("0"), alias="otherTaxValue")
-    vat: Decimal = Decimal("0")
-    vat_value: Decimal = Field(Decimal("0"), alias="vatValue")
-    other_vat: Decimal = Field(Decimal("0"), alias="otherVat")
-    other_vat_value: Decimal = Field(Decimal("0"), alias="otherVatValue")
+    original_price: Amount = Field(Decimal("0"), alias="originalPrice")
+    price: Amount
+    discount: Amount = Decimal("0")
+    other_tax: Amount = Field(Decimal("0"), alias="otherTax")
+    other_tax_value: Amount = Field(Decimal("0"), alias="otherTaxValue")
+    vat: Amount = Decimal("0")
+    vat_value: Amount = Field(Decimal("0"), alias="vatValue")
+    other_vat: Amount = Field(Decimal("0"), alias="otherVat")
+    other_vat_value: Amount = Field(Decimal("0"), alias="otherVatValue")
     other_tax_on_vat: int = Field(0, alias="otherTaxOnVat")
-    total: Decimal
+    total: Amount
     notes: str = ""
     status_id: int = Field(MenuStatus.PREPARING, alias="statusID")
 
@@ -83,18 +83,18 @@ class SalesMenuItem(ESBBaseModel):
     menu_id: int = Field(..., alias="menuID")
     menu_code: str = Field(..., alias="menuCode", max_length=50)
     qty: int
-    original_price: Decimal = Field(..., alias="originalPrice")
-    price: Decimal
-    discount: Decimal = Decimal("0")
-    discount_value: Decimal = Field(Decimal("0"), alias="discountValue")
-    other_tax: Decimal = Field(Decimal("0"), alias="otherTax")
-    other_tax_value: Decimal = Field(Decimal("0"), alias="otherTaxValue")
-    vat: Decimal = Decimal("0")
-    vat_value: Decimal = Field(Decimal("0"), alias="vatValue")
-    other_vat: Decimal = Field(Decimal("0"), alias="otherVat")
-    other_vat_value: Decimal = Field(Decimal("0"), alias="otherVatValue")
+    original_price: Amount = Field(..., alias="originalPrice")
+    price: Amount
+    discount: Amount = Decimal("0")
+    discount_value: Amount = Field(Decimal("0"), alias="discountValue")
+    other_tax: Amount = Field(Decimal("0"), alias="otherTax")
+    other_tax_value: Amount = Field(Decimal("0"), alias="otherTaxValue")
+    vat: Amount = Decimal("0")
+    vat_value: Amount = Field(Decimal("0"), alias="vatValue")
+    other_vat: Amount = Field(Decimal("0"), alias="otherVat")
+    other_vat_value: Amount = Field(Decimal("0"), alias="otherVatValue")
     other_tax_on_vat: int = Field(0, alias="otherTaxOnVat")
-    total: Decimal
+    total: Amount
     notes: str = ""
     status_id: int = Field(MenuStatus.PREPARING, alias="statusID")
     promotion_detail_id: int | None = Field(default=None, alias="promotionDetailID")
@@ -116,9 +116,9 @@ class Payment(ESBBaseModel):
     notes: str = Field("", max_length=100)
     card_number: str = Field("", alias="cardNumber", max_length=20)
     card_holder: str = Field("", alias="cardHolder", max_length=100)
-    amount: Decimal
-    charge: Decimal = Decimal("0")
-    change: Decimal = Decimal("0")
+    amount: Amount
+    charge: Amount = Decimal("0")
+    change: Amount = Decimal("0")
 
 
 class SalesHead(ESBBaseModel):
@@ -137,19 +137,19 @@ class SalesHead(ESBBaseModel):
     customer_name: str = Field("", alias="customerName", max_length=100)
     visit_purpose_name: str = Field("", alias="visitPurposeName", max_length=50)
     pax_total: int = Field(1, alias="paxTotal")
-    subtotal: Decimal
-    discount_total: Decimal = Field(Decimal("0"), alias="discountTotal")
-    menu_discount_total: Decimal = Field(Decimal("0"), alias="menuDiscountTotal")
-    promotion_discount: Decimal = Field(Decimal("0"), alias="promotionDiscount")
-    other_tax_total: Decimal = Field(Decimal("0"), alias="otherTaxTotal")
-    vat_total: Decimal = Field(Decimal("0"), alias="vatTotal")
-    other_vat_total: Decimal = Field(Decimal("0"), alias="otherVatTotal")
-    delivery_fee: Decimal = Field(Decimal("0"), alias="deliveryFee")
-    order_fee: Decimal = Field(Decimal("0"), alias="orderFee")
-    grand_total: Decimal = Field(..., alias="grandTotal")
-    voucher_total: Decimal = Field(Decimal("0"), alias="voucherTotal")
-    rounding_total: Decimal = Field(Decimal("0"), alias="roundingTotal")
-    payment_total: Decimal = Field(..., alias="paymentTotal")
+    subtotal: Amount
+    discount_total: Amount = Field(Decimal("0"), alias="discountTotal")
+    menu_discount_total: Amount = Field(Decimal("0"), alias="menuDiscountTotal")
+    promotion_discount: Amount = Field(Decimal("0"), alias="promotionDiscount")
+    other_tax_total: Amount = Field(Decimal("0"), alias="otherTaxTotal")
+    vat_total: Amount = Field(Decimal("0"), alias="vatTotal")
+    other_vat_total: Amount = Field(Decimal("0"), alias="otherVatTotal")
+    delivery_fee: Amount = Field(Decimal("0"), alias="deliveryFee")
+    order_fee: Amount = Field(Decimal("0"), alias="orderFee")
+    grand_total: Amount = Field(..., alias="grandTotal")
+    voucher_total: Amount = Field(Decimal("0"), alias="voucherTotal")
+    rounding_total: Amount = Field(Decimal("0"), alias="roundingTotal")
+    payment_total: Amount = Field(..., alias="paymentTotal")
     billing_print_count: int = Field(0, alias="billingPrintCount")
     payment_print_count: int = Field(0, alias="paymentPrintCount")
     additional_info: str = Field("", alias="additionalInfo", max_length=200)
@@ -178,12 +178,12 @@ class ShiftData(ESBBaseModel):
     shift_start: str = Field(..., alias="shiftStart")
     shift_end: str = Field("", alias="shiftEnd")
     cashier_name: str = Field(..., alias="cashierName", max_length=100)
-    opening_cash: Decimal = Field(Decimal("0"), alias="openingCash")
-    closing_cash: Decimal = Field(Decimal("0"), alias="closingCash")
-    total_sales: Decimal = Field(Decimal("0"), alias="totalSales")
-    total_void: Decimal = Field(Decimal("0"), alias="totalVoid")
-    total_discount: Decimal = Field(Decimal("0"), alias="totalDiscount")
-    total_refund: Decimal = Field(Decimal("0"), alias="totalRefund")
+    opening_cash: Amount = Field(Decimal("0"), alias="openingCash")
+    closing_cash: Amount = Field(Decimal("0"), alias="closingCash")
+    total_sales: Amount = Field(Decimal("0"), alias="totalSales")
+    total_void: Amount = Field(Decimal("0"), alias="totalVoid")
+    total_discount: Amount = Field(Decimal("0"), alias="totalDiscount")
+    total_refund: Amount = Field(Decimal("0"), alias="totalRefund")
     status_id: int = Field(1, alias="statusID")
     created_by: str = Field(..., alias="createdBy", max_length=100)
 
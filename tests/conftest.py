@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@pytest.fixture
+def requests_seen() -> list[httpx.Request]:
+    """Requests recorded by a test's handler."""
+    return []
@@ -0,0 +1,71 @@
+"""Test helpers: HTTP clients wired to httpx.MockTransport handlers."""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from esb_oms._http import BasicAuthHTTPClient, BearerHTTPClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, MutableMapping
+    from datetime import datetime
+
+
+def ok(result: Any) -> httpx.Response:
+    """Build a successful ESB response wrapping ``result``."""
+    return httpx.Response(200, json={"status": "ok", "result": result})
+
+
+def make_bearer_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    *,
+    token: str = "token",
+    response_cache: MutableMapping[Hashable, Any] | None = None,
+    max_retries: int = 0,
+) -> BearerHTTPClient:
+    """Build a Bearer client whose sync and async requests go to handler."""
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    return BearerHTTPClient(
+        base_url="https://api.example.test",
+        get_token=lambda: token,
+        max_retries=max_retries,
+        transport=httpx.MockTransport(handler),
+        async_transport=httpx.MockTransport(async_handler),
+        response_cache=response_cache,
+    )
+
+
+def make_basic_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    *,
+    credentials: tuple[str, str] = ("user", "secret"),
+    response_cache: MutableMapping[Hashable, Any] | None = None,
+    max_retries: int = 0,
+) -> BasicAuthHTTPClient:
+    """Build a Basic Auth client whose sync and async requests go to handler."""
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    return BasicAuthHTTPClient(
+        base_url="https://pos.example.test",
+        get_credentials=lambda: credentials,
+        max_retries=max_retries,
+        transport=httpx.MockTransport(handler),
+        async_transport=httpx.MockTransport(async_handler),
+        response_cache=response_cache,
+    )
+
+
+def make_jwt(expires_at: datetime) -> str:
+    """Build an unsigned JWT whose "exp" claim is ``expires_at``."""
+    claims = json.dumps({"exp": int(expires_at.timestamp())}).encode()
+    payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
@@ -0,0 +1,223 @@
+"""Tests for the circuit breaker and GET retries of the HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from esb_oms import _http
+from esb_oms._circuit_breaker import DEFAULT_FAILURE_THRESHOLD, CircuitBreaker
+from esb_oms._http import BearerHTTPClient
+from esb_oms.exceptions import ESBConnectionError, ESBRateLimitError, ESBServerError
+
+from .helpers import make_bearer_client, ok
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry waits instead of sleeping."""
+    waited: list[float] = []
+
+    async def async_sleep(delay: float) -> None:
+        waited.append(delay)
+
+    monkeypatch.setattr(_http.time, "sleep", waited.append)
+    monkeypatch.setattr(_http.asyncio, "sleep", async_sleep)
+    return waited
+
+
+def _server_error(_: httpx.Request) -> httpx.Response:
+    return httpx.Response(500, json={"status": "fail", "message": "down"})
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=60.0)
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+
+    with pytest.raises(ESBConnectionError, match="Circuit open"):
+        breaker.before_request()
+
+
+def test_breaker_success_resets_the_count() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=60.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    breaker.before_request()
+
+
+def test_half_open_breaker_lets_one_probe_through() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    breaker.before_request()
+    with pytest.raises(ESBConnectionError):
+        breaker.before_request()
+
+    breaker.record_success()
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_failed_probe_opens_the_circuit_again() -> None:
+    breaker = CircuitBreaker("host", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    breaker.before_request()
+
+    breaker.record_failure()
+    breaker.reset_timeout = 60.0
+
+    with pytest.raises(ESBConnectionError):
+        breaker.before_request()
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_retried_request_counts_as_one_failure(
+    requests_seen: list[httpx.Request],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return _server_error(request)
+
+    client = make_bearer_client(handler, max_retries=2)
+
+    for _ in range(DEFAULT_FAILURE_THRESHOLD - 1):
+        with pytest.raises(ESBServerError):
+            client.get("/things")
+
+    # 3 attempts per request, but the circuit is still closed
+    assert len(requests_seen) == 3 * (DEFAULT_FAILURE_THRESHOLD - 1)
+    with pytest.raises(ESBServerError):
+        client.get("/things")
+    with pytest.raises(ESBConnectionError, match="Circuit open"):
+        client.get("/things")
+
+
+def test_breakers_are_not_shared_between_clients() -> None:
+    failing = make_bearer_client(_server_error)
+    healthy = make_bearer_client(lambda _: ok([]))
+
+    for _ in range(DEFAULT_FAILURE_THRESHOLD):
+        with pytest.raises(ESBServerError):
+            failing.get("/things")
+
+    with pytest.raises(ESBConnectionError):
+        failing.get("/things")
+    assert healthy.get("/things") == {"status": "ok", "result": []}
+
+
+def test_api_errors_do_not_count_as_failures() -> None:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"status": "fail", "message": "missing"})
+
+    client = make_bearer_client(handler)
+
+    for _ in range(DEFAULT_FAILURE_THRESHOLD + 1):
+        with pytest.raises(Exception, match="missing"):
+            client.get("/things")
+
+
+def test_long_retry_after_is_raised_instead_of_slept(
+    sleeps: list[float], requests_seen: list[httpx.Request]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(
+            429,
+            headers={"Retry-After": "3600"},
+            json={"status": "fail", "message": "slow down"},
+        )
+
+    client = make_bearer_client(handler, max_retries=3)
+
+    with pytest.raises(ESBRateLimitError) as excinfo:
+        client.get("/things")
+
+    assert excinfo.value.retry_after == 3600
+    assert len(requests_seen) == 1
+    assert sleeps == []
+
+
+def test_short_retry_after_is_honoured(sleeps: list[float]) -> None:
+    responses = iter(
+        [
+            httpx.Response(
+                429,
+                headers={"Retry-After": "2"},
+                json={"status": "fail", "message": "slow down"},
+            ),
+            ok([1]),
+        ]
+    )
+    client = make_bearer_client(lambda _: next(responses), max_retries=3)
+
+    assert client.get("/things") == {"status": "ok", "result": [1]}
+    assert len(sleeps) == 1
+    assert 2.0 <= sleeps[0] < 2.0 + _http.RETRY_BASE_DELAY
+
+
+def test_async_retried_request_counts_as_one_failure(
+    sleeps: list[float], requests_seen: list[httpx.Request]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return _server_error(request)
+
+    client = make_bearer_client(handler, max_retries=2)
+
+    async def fail_until_open() -> None:
+        for _ in range(DEFAULT_FAILURE_THRESHOLD):
+            with pytest.raises(ESBServerError):
+                await client.get_async("/things")
+        with pytest.raises(ESBConnectionError, match="Circuit open"):
+            await client.get_async("/things")
+
+    asyncio.run(fail_until_open())
+
+    assert len(requests_seen) == 3 * DEFAULT_FAILURE_THRESHOLD
+    assert len(sleeps) == 2 * DEFAULT_FAILURE_THRESHOLD
+
+
+def test_cancelled_probe_leaves_the_circuit_open(
+    requests_seen: list[httpx.Request],
+) -> None:
+    async def hang(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        await asyncio.Event().wait()
+        return ok([])
+
+    client = BearerHTTPClient(
+        base_url="https://api.example.test",
+        get_token=lambda: "token",
+        max_retries=0,
+        transport=httpx.MockTransport(_server_error),
+        async_transport=httpx.MockTransport(hang),
+    )
+    for _ in range(DEFAULT_FAILURE_THRESHOLD):
+        with pytest.raises(ESBServerError):
+            client.get("/things")
+    client._breaker.reset_timeout = 0.0
+
+    async def cancel_probe() -> None:
+        probe = asyncio.create_task(client.get_async("/things"))
+        while not requests_seen:
+            await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+
+    # Neither closed nor stuck half-open: the next request probes again
+    with pytest.raises(ESBServerError):
+        client.get("/things")
+    client._breaker.reset_timeout = 60.0
+    with pytest.raises(ESBConnectionError, match="Circuit open"):
+        client.get("/things")
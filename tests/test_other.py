@@ -0,0 +1,40 @@
+"""Tests for the Other API response checks."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from esb_oms.api.other import OtherAPI
+from esb_oms.exceptions import ESBError
+
+from .helpers import make_basic_client, make_bearer_client, ok
+
+
+def _other_api(response: httpx.Response) -> OtherAPI:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return response
+
+    return OtherAPI(make_bearer_client(handler), make_basic_client(handler))
+
+
+@pytest.mark.parametrize(
+    "response",
+    [httpx.Response(204), ok({"rows": []})],
+    ids=["no-content", "object"],
+)
+def test_non_list_answer_raises_esb_error(response: httpx.Response) -> None:
+    api = _other_api(response)
+
+    with pytest.raises(ESBError, match="/external/general/get-sales"):
+        api.get_sales(bill_num="B001")
+    with pytest.raises(ESBError, match="/external/general/sales-branch-summary"):
+        api.get_branch_sales_summary(
+            sales_date_from="2024-01-01", sales_date_to="2024-01-31"
+        )
+
+
+def test_empty_list_answer_is_returned() -> None:
+    api = _other_api(httpx.Response(200, json=[]))
+
+    assert api.get_sales(sales_num="S001") == []
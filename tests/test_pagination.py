@@ -0,0 +1,67 @@
+"""Tests for lazy iteration over paginated menu listings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from esb_oms.api.master_menu import MasterMenuAPI
+
+from .helpers import make_bearer_client, ok
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _menus(*ids: int) -> list[dict[str, Any]]:
+    return [{"menuID": menu_id, "menuName": f"Menu {menu_id}"} for menu_id in ids]
+
+
+def test_page_numbers_stop_at_a_short_page(
+    requests_seen: list[httpx.Request],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        page = int(request.url.params["page"])
+        data = _menus(page * 10 + 1, page * 10 + 2) if page < 3 else _menus(31)
+        return ok({"page": str(page), "limit": 2, "count": 0, "data": data})
+
+    menus = list(MasterMenuAPI(make_bearer_client(handler)).iter())
+
+    assert [menu.menu_id for menu in menus] == [11, 12, 21, 22, 31]
+    assert len(requests_seen) == 3
+
+
+def test_repeated_cursor_ends_the_listing(
+    requests_seen: list[httpx.Request],
+) -> None:
+    next_cursors = {None: "a", "a": "b", "b": "a"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        cursor = request.url.params.get("cursor")
+        result = {
+            "limit": 1,
+            "count": 0,
+            "data": _menus(len(requests_seen)),
+            "nextCursor": next_cursors[cursor],
+        }
+        return ok(result)
+
+    menus = list(MasterMenuAPI(make_bearer_client(handler)).iter())
+
+    assert [menu.menu_id for menu in menus] == [1, 2, 3]
+    assert len(requests_seen) == 3
+
+
+def test_page_ignored_by_server_ends_the_listing(
+    requests_seen: list[httpx.Request],
+) -> None:
+    # No limit or count to stop on, and every page number returns page 1
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return ok({"limit": 0, "count": 0, "data": _menus(1, 2)})
+
+    menus = list(MasterMenuAPI(make_bearer_client(handler)).iter())
+
+    assert [menu.menu_id for menu in menus] == [1, 2]
+    assert len(requests_seen) == 2
@@ -0,0 +1,154 @@
+"""Tests for access token refresh."""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from esb_oms import ESBClient
+from esb_oms._base import REFRESH_MAX_ATTEMPTS, REFRESH_MAX_BACKOFF
+from esb_oms._http import ManualTokenHTTPClient
+from esb_oms.exceptions import ESBRateLimitError
+from esb_oms.models.auth import TokenInfo
+
+from .helpers import make_jwt, ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+THREADS = 8
+
+
+def _refresh_result(generation: int) -> dict[str, object]:
+    expires_at = datetime.now(tz=UTC) + timedelta(hours=1)
+    return {
+        "username": "alice",
+        "fullName": "Alice",
+        "companyID": 1,
+        "companyCode": "ACME",
+        "companyName": "Acme",
+        "accessToken": make_jwt(expires_at) + str(generation),
+        "refreshToken": f"refresh-{generation}",
+        "flagActive": 1,
+        "logInfo": {
+            "logID": generation,
+            "username": "alice",
+            "loginTime": "2024-01-01T00:00:00",
+        },
+    }
+
+
+def _logged_in_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> ESBClient:
+    client = ESBClient(username="alice", password="secret")
+    client.__dict__["_core_http"] = ManualTokenHTTPClient(
+        base_url="https://core.example.test",
+        max_retries=0,
+        transport=httpx.MockTransport(handler),
+    )
+    client._token_info = TokenInfo(
+        access_token="expired",
+        refresh_token="refresh-0",
+        username="alice",
+    )
+    return client
+
+
+def test_concurrent_refreshes_rotate_the_token_once(
+    requests_seen: list[httpx.Request],
+) -> None:
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        release.wait(timeout=5)
+        return ok(_refresh_result(len(requests_seen)))
+
+    client = _logged_in_client(handler)
+    threads = [
+        threading.Thread(target=client.refresh_token, args=("expired",))
+        for _ in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(requests_seen) == 1
+    assert requests_seen[0].headers["Authorization"] == "Bearer refresh-0"
+    assert client._token_info is not None
+    assert client._token_info.refresh_token == "refresh-1"
+
+
+def test_late_refresh_of_a_replaced_token_is_skipped(
+    requests_seen: list[httpx.Request],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return ok(_refresh_result(len(requests_seen)))
+
+    client = _logged_in_client(handler)
+
+    client.refresh_token("expired")
+    client.refresh_token("expired")
+
+    assert len(requests_seen) == 1
+    assert client._token_info is not None
+    assert client._token_info.refresh_token == "refresh-1"
+
+
+def test_rate_limited_refresh_is_retried_without_nesting(
+    monkeypatch: pytest.MonkeyPatch, requests_seen: list[httpx.Request]
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(
+            429,
+            headers={"Retry-After": "1"},
+            json={"status": "error", "code": "EC000429", "message": "Slow down"},
+        )
+
+    client = ESBClient(username="alice", password="secret")
+    # Through the client's own Core HTTP client, with its retry settings
+    client.__dict__["_transport"] = httpx.MockTransport(handler)
+    client._token_info = TokenInfo(
+        access_token="expired", refresh_token="refresh-0", username="alice"
+    )
+
+    with pytest.raises(ESBRateLimitError):
+        client.refresh_token()
+
+    assert len(requests_seen) == REFRESH_MAX_ATTEMPTS
+    assert len(sleeps) == REFRESH_MAX_ATTEMPTS - 1
+
+
+def test_refresh_backoff_caps_retry_after(
+    monkeypatch: pytest.MonkeyPatch, requests_seen: list[httpx.Request]
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if len(requests_seen) == 1:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": "3600"},
+                json={"status": "error", "code": "EC000429", "message": "Slow down"},
+            )
+        return ok(_refresh_result(len(requests_seen)))
+
+    client = _logged_in_client(handler)
+    client.refresh_token()
+
+    assert len(sleeps) == 1
+    assert sleeps[0] <= REFRESH_MAX_BACKOFF + 0.5
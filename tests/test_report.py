@@ -0,0 +1,113 @@
+"""Tests for the prefetching async report iterators."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from esb_oms.api.report import ReportAPI
+from esb_oms.models.report import SalesHeadItem
+
+from .helpers import make_basic_client, make_bearer_client, ok
+
+if TYPE_CHECKING:
+    from esb_oms.models.report import SalesPaymentSummaryItem
+
+
+def test_sales_payment_summary_iterates_until_an_empty_page(
+    requests_seen: list[httpx.Request],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        page = int(request.url.params["page"])
+        if page > 2:
+            return ok([])
+        return ok([{"branchCode": f"BR{page}", "salesDate": "2024-01-01"}])
+
+    core = make_bearer_client(handler)
+    report = ReportAPI(core, make_basic_client(handler), core)
+
+    async def collect() -> list[SalesPaymentSummaryItem]:
+        return [
+            summary
+            async for summary in report.iter_sales_payment_summary_async(
+                sales_date="2024-01-01", branch_code="BR"
+            )
+        ]
+
+    summaries = asyncio.run(collect())
+
+    assert [summary.branch_code for summary in summaries] == ["BR1", "BR2"]
+    assert [request.url.params["page"] for request in requests_seen] == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert all(request.url.params["branchCode"] == "BR" for request in requests_seen)
+
+
+def test_sales_head_iterates_master_pos_pages(
+    requests_seen: list[httpx.Request],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        page = int(request.url.params["page"])
+        if page > 2:
+            return httpx.Response(200, json=[])
+        return httpx.Response(
+            200, json=[{"salesNum": f"S{page}-1"}, {"salesNum": f"S{page}-2"}]
+        )
+
+    pos = make_basic_client(handler)
+    report = ReportAPI(make_bearer_client(handler), pos, make_bearer_client(handler))
+
+    async def collect() -> list[str]:
+        return [
+            head.sales_num
+            async for head in report.iter_sales_head_async(
+                sales_date_from="2024-01-01", sales_date_to="2024-01-31"
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["S1-1", "S1-2", "S2-1", "S2-2"]
+    assert len(requests_seen) == 3
+    assert all(request.method == "POST" for request in requests_seen)
+
+
+class _CountingAdapter(TypeAdapter[list[SalesHeadItem]]):
+    """TypeAdapter that counts validate_python() calls."""
+
+    python_validations = 0
+
+    def validate_python(self, *args: Any, **kwargs: Any) -> list[SalesHeadItem]:
+        type(self).python_validations += 1
+        return super().validate_python(*args, **kwargs)
+
+
+def test_master_pos_pages_are_validated_once() -> None:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"salesNum": "S1"}])
+
+    pos = make_basic_client(handler)
+    report = ReportAPI(make_bearer_client(handler), pos, make_bearer_client(handler))
+    items = _CountingAdapter(list[SalesHeadItem])
+
+    heads = report._post_list("/external/general/sales-head", {}, 1, items)
+
+    assert [head.sales_num for head in heads] == ["S1"]
+    assert _CountingAdapter.python_validations == 0
+
+
+def test_invalid_master_pos_page_raises() -> None:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"salesNum": ["not", "a", "string"]}])
+
+    pos = make_basic_client(handler)
+    report = ReportAPI(make_bearer_client(handler), pos, make_bearer_client(handler))
+
+    with pytest.raises(ValidationError):
+        report.get_sales_head(sales_date_from="2024-01-01", sales_date_to="2024-01-31")
@@ -0,0 +1,80 @@
+"""Tests for the filter bodies sent to the Master POS and report endpoints."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from esb_oms.api.master_pos import MasterPOSAPI
+from esb_oms.api.report import ReportAPI
+
+from .helpers import make_basic_client, make_bearer_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _recording_handler(
+    bodies: list[dict[str, Any]],
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=[])
+
+    return handler
+
+
+def test_master_pos_filters_are_stripped_like_the_request_models() -> None:
+    bodies: list[dict[str, Any]] = []
+    master = MasterPOSAPI(make_basic_client(_recording_handler(bodies)))
+
+    master.get_menu(branch_code=" BR001 ", visit_purpose_id="1\n")
+    master.get_branch(branch_name=" Main ")
+    master.get_visit_purpose()
+
+    assert bodies == [
+        {"filterBranchCode": "BR001", "filterVisitPurposeID": "1"},
+        {"filterBranchName": "Main"},
+        {},
+    ]
+
+
+def test_master_pos_filters_reject_non_strings() -> None:
+    bodies: list[dict[str, Any]] = []
+    master = MasterPOSAPI(make_basic_client(_recording_handler(bodies)))
+
+    # Compiled builds reject these at the call, before filter_body() runs
+    with pytest.raises(TypeError):
+        master.get_branch(brand_id=date(2024, 1, 1))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        master.get_stock_branch(branch_code=None)  # type: ignore[arg-type]
+
+    assert bodies == []
+
+
+def test_sales_report_filters_are_stripped_and_type_checked() -> None:
+    bodies: list[dict[str, Any]] = []
+    handler = _recording_handler(bodies)
+    bearer = make_bearer_client(handler)
+    report = ReportAPI(bearer, make_basic_client(handler), bearer)
+
+    report.get_sales_head(
+        sales_date_from=" 2024-01-01", sales_date_to="2024-01-31 ", sales_num=" S1 "
+    )
+    with pytest.raises(TypeError):
+        report.get_sales_menu(
+            sales_date_from="2024-01-01",
+            sales_date_to=date(2024, 1, 31),  # type: ignore[arg-type]
+        )
+
+    assert bodies == [
+        {
+            "filterSalesDateFrom": "2024-01-01",
+            "filterSalesDateTo": "2024-01-31",
+            "filterSalesNum": "S1",
+        }
+    ]
@@ -0,0 +1,99 @@
+"""Tests for HTTPClient.request_stream() and the streamed sales head report."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from esb_oms import _http
+from esb_oms.api.report import ReportAPI
+from esb_oms.exceptions import ESBError
+
+from .helpers import make_basic_client, make_bearer_client
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "no-ijson"])
+def ijson_available(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> bool:
+    """Run a test with and without the incremental ijson parser."""
+    available: bool = request.param
+    if available:
+        pytest.importorskip("ijson")
+    monkeypatch.setattr(_http, "IJSON_AVAILABLE", available)
+    return available
+
+
+def _stream(body: bytes, **headers: str) -> list[Any]:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/json", **headers},
+            stream=httpx.ByteStream(body),
+        )
+
+    client = make_bearer_client(handler)
+    return list(client.request_stream("POST", "/report", json={}))
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_list_body_yields_items() -> None:
+    items = _stream(b'  [{"salesNum": "S1"}, {"salesNum": "S2"}]')
+
+    assert items == [{"salesNum": "S1"}, {"salesNum": "S2"}]
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_empty_body_yields_nothing() -> None:
+    assert _stream(b"") == []
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_error_envelope_raises() -> None:
+    body = json.dumps({"status": "fail", "message": "bad filter"}).encode()
+
+    with pytest.raises(ESBError, match="bad filter"):
+        _stream(body)
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_compressed_error_envelope_raises() -> None:
+    body = gzip.compress(json.dumps({"status": "fail", "message": "bad"}).encode())
+
+    with pytest.raises(ESBError, match="bad"):
+        _stream(body, **{"Content-Encoding": "gzip"})
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_iter_sales_head_raises_on_error_envelope() -> None:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "fail", "message": "bad filter"})
+
+    bearer = make_bearer_client(handler)
+    report = ReportAPI(bearer, make_basic_client(handler), bearer)
+
+    with pytest.raises(ESBError, match="bad filter"):
+        list(
+            report.iter_sales_head(
+                sales_date_from="2024-01-01", sales_date_to="2024-01-31"
+            )
+        )
+
+
+@pytest.mark.usefixtures("ijson_available")
+def test_iter_sales_head_yields_rows() -> None:
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"salesNum": "S1"}, {"salesNum": "S2"}])
+
+    bearer = make_bearer_client(handler)
+    report = ReportAPI(bearer, make_basic_client(handler), bearer)
+
+    heads = report.iter_sales_head(
+        sales_date_from="2024-01-01", sales_date_to="2024-01-31"
+    )
+
+    assert [head.sales_num for head in heads] == ["S1", "S2"]
@@ -0,0 +1,145 @@
+"""Tests for the opt-in GET response cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from esb_oms.api.master_menu import MasterMenuCategoryAPI
+from esb_oms.models.menu import CreateMenuCategoryRequest, MenuCategoryDetailInput
+
+from .helpers import make_basic_client, make_bearer_client, ok
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx
+
+_CATEGORY = {"menuCategoryID": 7, "menuCategoryName": "Beverages"}
+
+
+def _category_api(
+    requests_seen: list[httpx.Request],
+    response_cache: dict[Any, Any] | None,
+) -> MasterMenuCategoryAPI:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.method == "POST":
+            return ok(_CATEGORY)
+        return ok({"page": "1", "limit": 10, "count": 1, "data": [_CATEGORY]})
+
+    return MasterMenuCategoryAPI(
+        make_bearer_client(handler, response_cache=response_cache)
+    )
+
+
+def _create_request() -> CreateMenuCategoryRequest:
+    return CreateMenuCategoryRequest(
+        menu_category_name="Beverages",
+        sales_account="4100001",
+        cogs_account="5100001",
+        discount_account="4200001",
+        menu_category_details=[
+            MenuCategoryDetailInput(menu_category_detail_name="Hot Drinks")
+        ],
+    )
+
+
+def test_category_lookups_are_not_cached_without_response_cache(
+    requests_seen: list[httpx.Request],
+) -> None:
+    api = _category_api(requests_seen, response_cache=None)
+
+    api.get(menu_category_id=7)
+    api.get(menu_category_id=7)
+
+    assert len(requests_seen) == 2
+
+
+def test_category_lookups_use_response_cache(
+    requests_seen: list[httpx.Request],
+) -> None:
+    api = _category_api(requests_seen, response_cache={})
+
+    first = api.get(menu_category_id=7)
+    second = api.get(menu_category_id=7)
+
+    assert len(requests_seen) == 1
+    assert first == second
+    assert second.data[0].menu_category_name == "Beverages"
+
+
+def test_post_invalidates_cached_gets_under_its_parent_path(
+    requests_seen: list[httpx.Request],
+) -> None:
+    api = _category_api(requests_seen, response_cache={})
+
+    api.get(menu_category_id=7)
+    api.create(_create_request())
+    api.get(menu_category_id=7)
+
+    assert [request.method for request in requests_seen] == ["GET", "POST", "GET"]
+
+
+def test_cached_responses_are_copies(requests_seen: list[httpx.Request]) -> None:
+    api = _category_api(requests_seen, response_cache={})
+
+    api.get(menu_category_id=7).data[0].menu_category_name = "Changed"
+
+    assert api.get(menu_category_id=7).data[0].menu_category_name == "Beverages"
+
+
+def _echo_auth(
+    requests_seen: list[httpx.Request],
+) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return ok(request.headers.get("Authorization"))
+
+    return handler
+
+
+def test_shared_cache_is_keyed_by_bearer_token(
+    requests_seen: list[httpx.Request],
+) -> None:
+    cache: dict[Any, Any] = {}
+    handler = _echo_auth(requests_seen)
+    alice = make_bearer_client(handler, token="alice", response_cache=cache)
+    bob = make_bearer_client(handler, token="bob", response_cache=cache)
+    alice_again = make_bearer_client(handler, token="alice", response_cache=cache)
+
+    assert alice.get("/members")["result"] == "Bearer alice"
+    assert bob.get("/members")["result"] == "Bearer bob"
+    assert alice_again.get("/members")["result"] == "Bearer alice"
+    assert len(requests_seen) == 2
+
+
+def test_shared_cache_is_keyed_by_basic_credentials(
+    requests_seen: list[httpx.Request],
+) -> None:
+    cache: dict[Any, Any] = {}
+    handler = _echo_auth(requests_seen)
+    alice = make_basic_client(
+        handler, credentials=("alice", "pw"), response_cache=cache
+    )
+    bob = make_basic_client(handler, credentials=("bob", "pw"), response_cache=cache)
+
+    alice_auth = alice.get("/branches")["result"]
+    bob_auth = bob.get("/branches")["result"]
+
+    assert alice_auth != bob_auth
+    assert len(requests_seen) == 2
+
+
+def test_write_drops_other_users_cached_gets(
+    requests_seen: list[httpx.Request],
+) -> None:
+    cache: dict[Any, Any] = {}
+    handler = _echo_auth(requests_seen)
+    alice = make_bearer_client(handler, token="alice", response_cache=cache)
+    bob = make_bearer_client(handler, token="bob", response_cache=cache)
+
+    alice.get("/master/menu/get")
+    bob.post("/master/menu/create", json={})
+    alice.get("/master/menu/get")
+
+    assert [request.method for request in requests_seen] == ["GET", "POST", "GET"]
@@ -0,0 +1,94 @@
+"""Tests for the on-disk token cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from esb_oms import Environment, ESBClient
+from esb_oms._token_cache import load_token, save_token
+from esb_oms.environments import get_core_url
+from esb_oms.models.auth import TokenInfo
+
+from .helpers import make_jwt
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PRODUCTION_URL = get_core_url(Environment.PRODUCTION)
+STAGING_URL = get_core_url(Environment.STAGING)
+
+
+def _token(
+    username: str = "alice", lifetime: timedelta = timedelta(hours=1)
+) -> TokenInfo:
+    expires_at = datetime.now(tz=UTC) + lifetime
+    return TokenInfo(
+        access_token=make_jwt(expires_at),
+        refresh_token="refresh",
+        username=username,
+        expires_at=expires_at,
+    )
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    token = _token()
+
+    save_token(path, token, PRODUCTION_URL)
+
+    assert load_token(path, "alice", PRODUCTION_URL) == token
+
+
+def test_token_from_another_environment_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    save_token(path, _token(), STAGING_URL)
+
+    assert load_token(path, "alice", PRODUCTION_URL) is None
+
+
+def test_token_of_another_user_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    save_token(path, _token(username="bob"), PRODUCTION_URL)
+
+    assert load_token(path, "alice", PRODUCTION_URL) is None
+
+
+def test_expiring_token_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    save_token(path, _token(lifetime=timedelta(seconds=30)), PRODUCTION_URL)
+
+    assert load_token(path, "alice", PRODUCTION_URL) is None
+
+
+def test_file_without_issuer_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    token = _token()
+    path.write_bytes(token.model_dump_json().encode())
+
+    assert load_token(path, "alice", PRODUCTION_URL) is None
+
+
+def test_missing_file_is_ignored(tmp_path: Path) -> None:
+    assert load_token(tmp_path / "token.json", "alice", PRODUCTION_URL) is None
+
+
+def test_client_only_reuses_tokens_of_its_environment(tmp_path: Path) -> None:
+    path = tmp_path / "token.json"
+    save_token(path, _token(), STAGING_URL)
+
+    production = ESBClient(
+        username="alice",
+        password="secret",
+        environment=Environment.PRODUCTION,
+        token_cache_path=path,
+    )
+    staging = ESBClient(
+        username="alice",
+        password="secret",
+        environment=Environment.STAGING,
+        token_cache_path=path,
+    )
+
+    assert not production.is_authenticated
+    assert staging.is_authenticated